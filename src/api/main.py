@@ -12,9 +12,13 @@ from src.core.config import settings
 from src.core.security.audit_log import AuditMiddleware
 
 # Import your modules' routers here as they are implemented
+from src.modules.cover_letter.api.routes import router as cover_letter_router
 from src.modules.gdpr.api.routes import router as gdpr_router
 from src.modules.identity.api.routes import router as identity_router
 from src.modules.job_search.api.routes import router as job_router
+from src.modules.job_search.events.handlers import (
+    register_handlers as register_job_search_handlers,
+)
 from src.modules.persona.api.routes import router as persona_router
 from src.modules.resume.api.routes import router as resume_router
 
@@ -40,6 +44,9 @@ app.add_exception_handler(Exception, global_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
 
+# Internal event subscriptions
+register_job_search_handlers()
+
 
 @app.get("/health", tags=["System"])
 async def health_check() -> dict[str, str]:
@@ -51,4 +58,7 @@ app.include_router(identity_router, prefix="/api/v1/auth", tags=["Identity"])
 app.include_router(persona_router, prefix="/api/v1/persona", tags=["Persona"])
 app.include_router(resume_router, prefix="/api/v1/resume", tags=["Resume"])
 app.include_router(job_router, prefix="/api/v1/jobs", tags=["Job Search"])
+app.include_router(
+    cover_letter_router, prefix="/api/v1/cover-letters", tags=["Cover Letter"]
+)
 app.include_router(gdpr_router, prefix="/api/v1", tags=["GDPR/DSGVO"])
@@ -0,0 +1,139 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.infrastructure.redis import RedisProvider, redis_provider
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_key(model: str, task_type: str, text: str) -> str:
+    """Content address of an embedding: the same input always embeds the same"""
+    return hashlib.sha256(f"{model}\0{task_type}\0{text}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache shared by every embedding consumer.
+
+    Entries are keyed by sha256(model, task_type, text). Lookups go to an
+    in-process LRU first and then to Redis, where vectors are stored as raw
+    little-endian float16 (or float32) bytes: a 768-dim embedding takes
+    1.5 KB instead of ~16 KB of JSON and decodes without parsing. float16
+    keeps cosine similarities within ~1e-3 of the originals.
+
+    Redis is optional: when it is not connected or errors, the cache
+    degrades to the local tier and misses are simply recomputed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.ai.EMBEDDING_CACHE_SIZE,
+        ttl: int = settings.ai.EMBEDDING_CACHE_TTL_SECONDS,
+        dtype: str = settings.ai.EMBEDDING_CACHE_DTYPE,
+        redis: RedisProvider | None = redis_provider,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self.redis = redis
+        self._local: OrderedDict[str, list[float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"emb:{self.dtype.name}:{key}"
+
+    def encode(self, embedding: list[float]) -> bytes:
+        return np.asarray(embedding, dtype=self.dtype).tobytes()
+
+    def decode(self, raw: bytes) -> list[float]:
+        return np.frombuffer(raw, dtype=self.dtype).astype(np.float32).tolist()
+
+    async def get_many(
+        self, model: str, task_type: str, texts: list[str]
+    ) -> list[list[float] | None]:
+        """Cached embedding per text, None where neither tier has it"""
+        keys = [embedding_key(model, task_type, text) for text in texts]
+        found: list[list[float] | None] = [self._get_local(key) for key in keys]
+
+        remote = [i for i, embedding in enumerate(found) if embedding is None]
+        if remote and self.redis is not None:
+            try:
+                raws = await self.redis.get_many_bytes(
+                    [self._redis_key(keys[i]) for i in remote]
+                )
+            except Exception as e:
+                logger.debug(f"Embedding cache read failed: {e}")
+                raws = [None] * len(remote)
+            for i, raw in zip(remote, raws, strict=True):
+                if raw:
+                    found[i] = self.decode(raw)
+                    self._put_local(keys[i], found[i])
+
+        hits = sum(embedding is not None for embedding in found)
+        self.hits += hits
+        self.misses += len(found) - hits
+        return found
+
+    async def put_many(
+        self, model: str, task_type: str, items: dict[str, list[float]]
+    ) -> None:
+        """Store text -> embedding in both tiers"""
+        if not items:
+            return
+        values: dict[str, bytes] = {}
+        for text, embedding in items.items():
+            key = embedding_key(model, task_type, text)
+            self._put_local(key, embedding)
+            values[self._redis_key(key)] = self.encode(embedding)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set_many_bytes(values, expire=self.ttl)
+        except Exception as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    async def get_or_embed(
+        self,
+        model: str,
+        task_type: str,
+        text: str,
+        embed: Callable[[str], Awaitable[Any]],
+    ) -> list[float]:
+        """Cached embedding of text, computing and storing it on a miss"""
+        (cached,) = await self.get_many(model, task_type, [text])
+        if cached is not None:
+            return cached
+        embedding = [float(x) for x in await embed(text)]
+        await self.put_many(model, task_type, {text: embedding})
+        return embedding
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def _get_local(self, key: str) -> list[float] | None:
+        embedding = self._local.get(key)
+        if embedding is not None:
+            self._local.move_to_end(key)
+        return embedding
+
+    def _put_local(self, key: str, embedding: list[float]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._local[key] = embedding
+        self._local.move_to_end(key)
+        if len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+
+# Shared by every embedding consumer in the process
+embedding_cache = EmbeddingCache()
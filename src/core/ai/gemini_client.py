@@ -1,10 +1,12 @@
+import asyncio
+import hashlib
 import logging
 import time
-from collections.abc import AsyncIterator
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Hashable
 from typing import Any, TypeVar, cast
 
 import google.generativeai as genai
-from aiolimiter import AsyncLimiter
 from google.generativeai.types import (
     GenerationConfig,
 )
@@ -16,13 +18,26 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.core.ai.embedding_cache import EmbeddingCache
+from src.core.ai.embedding_cache import embedding_cache as default_embedding_cache
+from src.core.ai.response_cache import ResponseCache, response_cache
+from src.core.ai.scheduler import (
+    GeminiScheduler,
+    Priority,
+    Reservation,
+    estimate_tokens,
+    gemini_scheduler,
+)
+from src.core.config import settings
+
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Model configurations for specific tasks
-MODEL_CONFIGS = {
+MODEL_CONFIGS: dict[str, dict[str, Any]] = {
     "resume_enhancement": {
         "model": "gemini-1.5-pro",  # Note: gemini-1.5 is the current stable
         "temperature": 0.3,
@@ -40,6 +55,263 @@ MODEL_CONFIGS = {
     },
 }
 
+# How long responses cached with cache_as= live, per task
+RESPONSE_CACHE_TTLS = {
+    "resume_enhancement": 7 * 24 * 3600,
+    "cover_letter": 3600,
+    "question_answering": 7 * 24 * 3600,
+}
+
+EMBEDDING_MODEL = "models/text-embedding-004"
+# Gemini bills every image as a fixed number of input tokens
+IMAGE_TOKENS = 258
+# batchEmbedContents accepts at most 100 texts per request
+EMBED_BATCH_SIZE = 100
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    hash(value)
+    return cast(Hashable, value)
+
+
+class ModelHandleCache:
+    """
+    LRU of genai.GenerativeModel handles, keyed by model name, system
+    instruction and generation config.
+
+    Building a handle converts its system instruction and config to protos,
+    and a handle binds the shared async gRPC client on first use, so reusing
+    handles keeps per-call setup off the request path. grpc.aio channels
+    belong to the event loop that opened them: when the cache is used from
+    another loop (e.g. a new asyncio.run), handles and genai's default
+    clients are dropped and rebuilt on that loop.
+    """
+
+    def __init__(self, maxsize: int = settings.ai.MODEL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._models: OrderedDict[Hashable, Any] = OrderedDict()
+        self._api_key: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, api_key: str) -> None:
+        """Point genai at the key; reconfiguring drops its gRPC clients"""
+        if api_key == self._api_key:
+            return
+        genai.configure(api_key=api_key)  # type: ignore[attr-defined]
+        self._api_key = api_key
+        self._models.clear()
+
+    def get(
+        self,
+        model_name: str,
+        system_instruction: str | None = None,
+        generation_config: dict[str, Any] | None = None,
+    ) -> Any:
+        self.bind_loop()
+        try:
+            key = (model_name, system_instruction, _freeze(generation_config or {}))
+        except TypeError:
+            # Unhashable config values; build an uncached handle
+            return self._build(model_name, system_instruction, generation_config)
+
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+            self.hits += 1
+            return model
+
+        self.misses += 1
+        model = self._build(model_name, system_instruction, generation_config)
+        self._models[key] = model
+        if len(self._models) > self.maxsize:
+            self._models.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        self._models.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def bind_loop(self) -> None:
+        """
+        Rebuild genai's clients when called from a new event loop.
+
+        Call before every genai.*_async call that does not go through get().
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            self._models.clear()
+            if self._api_key is not None:
+                genai.configure(api_key=self._api_key)  # type: ignore[attr-defined]
+        self._loop = loop
+
+    def _build(
+        self,
+        model_name: str,
+        system_instruction: str | None,
+        generation_config: dict[str, Any] | None,
+    ) -> Any:
+        # Returning Any because genai.GenerativeModel is not
+        # explicitly exported for mypy
+        return genai.GenerativeModel(  # type: ignore[attr-defined]
+            model_name=model_name,
+            system_instruction=system_instruction,
+            generation_config=GenerationConfig(**generation_config)
+            if generation_config
+            else None,
+        )
+
+
+# Shared by every GeminiClient in the process
+model_handles = ModelHandleCache()
+
+
+class EmbeddingMicroBatcher:
+    """
+    Coalesces concurrent embed_text calls into embed_batch requests.
+
+    The first text queued for a task type opens a window of `window`
+    seconds; texts queued during it are sent in the same request when the
+    window closes, or as soon as max_batch distinct texts are waiting.
+    Identical texts share one slot. Each caller gets its own embedding
+    back, or the request's exception.
+    """
+
+    def __init__(
+        self,
+        client: "GeminiClient",
+        window: float = 0.005,
+        max_batch: int = EMBED_BATCH_SIZE,
+    ):
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[str, dict[str, list[asyncio.Future[list[float]]]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._requests: set[asyncio.Task[None]] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def embed(self, text: str, task_type: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Anything queued on a previous loop can no longer complete
+            self._pending.clear()
+            self._timers.clear()
+            self._loop = loop
+
+        future: asyncio.Future[list[float]] = loop.create_future()
+        pending = self._pending.setdefault(task_type, {})
+        pending.setdefault(text, []).append(future)
+        if len(pending) >= self.max_batch:
+            self._flush(task_type)
+        elif task_type not in self._timers:
+            self._timers[task_type] = loop.call_later(
+                self.window, self._flush, task_type
+            )
+        return await future
+
+    def _flush(self, task_type: str) -> None:
+        timer = self._timers.pop(task_type, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(task_type, None)
+        if not pending:
+            return
+        request = asyncio.get_running_loop().create_task(self._send(task_type, pending))
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(
+        self, task_type: str, pending: dict[str, list[asyncio.Future[list[float]]]]
+    ) -> None:
+        texts = list(pending)
+        try:
+            embeddings = await self.client.embed_batch(texts, task_type=task_type)
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for text, embedding in zip(texts, embeddings, strict=True):
+            for future in pending[text]:
+                # Callers may have been cancelled while waiting
+                if not future.done():
+                    future.set_result(embedding)
+
+
+def prompt_key(
+    model_name: str, config: dict[str, Any], *parts: object
+) -> Hashable | None:
+    """Identity of a generation request, or None if config isn't hashable"""
+    digest = hashlib.sha256("\0".join(map(str, parts)).encode()).hexdigest()
+    try:
+        return (model_name, _freeze(config), digest)
+    except TypeError:
+        return None
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call among concurrent callers with the same key.
+
+    The first caller starts the call; callers arriving before it finishes
+    await the same task and get its result or exception. A caller giving
+    up does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.shared = 0
+
+    async def do(
+        self, key: Hashable | None, call: Callable[[], Coroutine[Any, Any, R]]
+    ) -> R:
+        if key is None:
+            return await call()
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Tasks of a previous loop can never finish
+            self._calls.clear()
+            self._loop = loop
+
+        task = self._calls.get(key)
+        if task is None:
+            task = loop.create_task(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+        return cast(R, await asyncio.shield(task))
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Retrieve the exception so it isn't reported as never retrieved
+        # when every caller has gone
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+# Shared by every GeminiClient in the process
+in_flight_prompts = SingleFlight()
+
 
 class GeminiClient:
     """
@@ -51,26 +323,94 @@ class GeminiClient:
         self,
         api_key: str,
         default_model: str = "gemini-1.5-flash",
-        requests_per_minute: int = 60,
+        requests_per_minute: int | None = None,
+        model_cache: ModelHandleCache | None = None,
+        embed_batch_window: float | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        scheduler: GeminiScheduler | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+        single_flight: SingleFlight | None = None,
+        responses: ResponseCache | None = None,
     ):
-        genai.configure(api_key=api_key)  # type: ignore[attr-defined]
+        self.models = model_handles if model_cache is None else model_cache
+        self.models.configure(api_key)
         self.default_model_name = default_model
-        self.limiter = AsyncLimiter(requests_per_minute, 60)
+        # Quotas are per API key, so clients share the process scheduler
+        # unless given their own limits
+        if scheduler is None:
+            scheduler = (
+                gemini_scheduler
+                if requests_per_minute is None
+                else GeminiScheduler(rpm=requests_per_minute)
+            )
+        self.scheduler = scheduler
+        # Lane for calls that don't pass priority=; workers use BATCH
+        self.priority = priority
+        # Identical concurrent prompts share one upstream call
+        self.in_flight = in_flight_prompts if single_flight is None else single_flight
+        self.responses = response_cache if responses is None else responses
+        # Opt-in: concurrent embed_text calls within the window share a request
+        self.embed_batcher = (
+            EmbeddingMicroBatcher(self, embed_batch_window)
+            if embed_batch_window
+            else None
+        )
+        self.embedding_cache = (
+            default_embedding_cache if embedding_cache is None else embedding_cache
+        )
 
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.start_time = time.time()
 
-    def _get_model(self, model_name: str | None = None) -> Any:
-        # Returning Any because genai.GenerativeModel is not
-        # explicitly exported for mypy
-        return genai.GenerativeModel(  # type: ignore[attr-defined]
-            model_name or self.default_model_name
+    def _get_model(
+        self,
+        model_name: str | None = None,
+        system_instruction: str | None = None,
+        generation_config: dict[str, Any] | None = None,
+    ) -> Any:
+        return self.models.get(
+            model_name or self.default_model_name, system_instruction, generation_config
         )
 
-    def _update_token_counts(self, response: Any) -> None:
+    def _call_settings(
+        self, kwargs: dict[str, Any], default_model: str | None = None
+    ) -> tuple[str, Priority, dict[str, Any]]:
+        """
+        Model, priority and generation config of a call.
+
+        task= names a MODEL_CONFIGS entry whose model and generation
+        settings apply unless overridden by the other kwargs.
+        """
+        config = dict(MODEL_CONFIGS[kwargs.pop("task")]) if "task" in kwargs else {}
+        task_model = config.pop("model", default_model or self.default_model_name)
+        model_name = kwargs.pop("model", task_model)
+        priority = kwargs.pop("priority", self.priority)
+        return model_name, priority, {**config, **kwargs}
+
+    def _cached(
+        self,
+        template: str | None,
+        task: str | None,
+        model_name: str,
+        prompt: str,
+        config: dict[str, Any],
+        generate: Callable[[], Coroutine[Any, Any, str]],
+    ) -> Callable[[], Coroutine[Any, Any, str]]:
+        """generate, served from the response cache when a template is named"""
+        if template is None:
+            return generate
+        key = self.responses.key(model_name, template, prompt, config)
+        ttl = RESPONSE_CACHE_TTLS.get(task or "")
+        return lambda: self.responses.get_or_generate(key, generate, ttl)
+
+    def _update_token_counts(
+        self, response: Any, reservation: Reservation | None = None
+    ) -> None:
         try:
             usage = response.usage_metadata
+            if reservation is not None:
+                reservation.settle(usage.prompt_token_count)
             self.total_input_tokens += usage.prompt_token_count
             self.total_output_tokens += usage.candidates_token_count
             logger.info(
@@ -86,47 +426,75 @@ class GeminiClient:
         stop=stop_after_attempt(3),
     )
     async def generate_text(self, prompt: str, **kwargs: Any) -> str:
-        """Standard text generation with retries and rate limiting."""
-        async with self.limiter:
-            model_name = kwargs.pop("model", self.default_model_name)
-            model = self._get_model(model_name)
+        """
+        Standard text generation with retries and rate limiting.
 
-            config = GenerationConfig(**kwargs)
-            response = await model.generate_content_async(
-                prompt, generation_config=config, request_options={"timeout": 30}
-            )
+        cache_as= names the prompt template to cache the response under.
+        """
+        template, task = kwargs.pop("cache_as", None), kwargs.get("task")
+        model_name, priority, config = self._call_settings(kwargs)
 
-            self._update_token_counts(response)
-            return cast(str, response.text)
+        async def generate() -> str:
+            async with self.scheduler.reserve(
+                model_name, estimate_tokens(prompt), priority
+            ) as reservation:
+                model = self._get_model(model_name, generation_config=config)
+
+                response = await model.generate_content_async(
+                    prompt, request_options={"timeout": 30}
+                )
+
+                self._update_token_counts(response, reservation)
+                return cast(str, response.text)
+
+        return await self.in_flight.do(
+            prompt_key(model_name, config, "text", prompt),
+            self._cached(template, task, model_name, prompt, config, generate),
+        )
 
     async def generate_structured(
         self, prompt: str, schema: type[T], **kwargs: Any
     ) -> T:
-        """Generate structured data using Pydantic models."""
-        async with self.limiter:
-            model_name = kwargs.pop("model", "gemini-1.5-pro")  # Better for structured
-            model = self._get_model(model_name)
-
-            # Gemini supports response_mime_type="application/json"
-            # and response_schema for constrained output
-            config = GenerationConfig(
-                response_mime_type="application/json", response_schema=schema, **kwargs
-            )
+        """Generate structured data using Pydantic models; see cache_as above."""
+        template, task = kwargs.pop("cache_as", None), kwargs.get("task")
+        # Pro is better for structured output
+        model_name, priority, config = self._call_settings(kwargs, "gemini-1.5-pro")
+        # Gemini supports response_mime_type="application/json"
+        # and response_schema for constrained output
+        config = {
+            "response_mime_type": "application/json",
+            "response_schema": schema,
+            **config,
+        }
 
-            response = await model.generate_content_async(
-                prompt, generation_config=config, request_options={"timeout": 60}
-            )
-            self._update_token_counts(response)
+        async def generate() -> str:
+            async with self.scheduler.reserve(
+                model_name, estimate_tokens(prompt), priority
+            ) as reservation:
+                model = self._get_model(model_name, generation_config=config)
+
+                response = await model.generate_content_async(
+                    prompt, request_options={"timeout": 60}
+                )
+                self._update_token_counts(response, reservation)
+                return cast(str, response.text)
 
-            return schema.model_validate_json(response.text)
+        # Shared as JSON so every caller validates its own instance
+        text = await self.in_flight.do(
+            prompt_key(model_name, config, "structured", prompt),
+            self._cached(template, task, model_name, prompt, config, generate),
+        )
+        return schema.model_validate_json(text)
 
     async def generate_with_image(
         self, prompt: str, image_data: str, mime_type: str, **kwargs: Any
     ) -> str:
         """Generate content with an image input (multimodal)."""
-        async with self.limiter:
-            model_name = kwargs.pop("model", "gemini-1.5-pro")
-            model = self._get_model(model_name)
+        model_name, priority, config = self._call_settings(kwargs, "gemini-1.5-pro")
+        async with self.scheduler.reserve(
+            model_name, estimate_tokens(prompt) + IMAGE_TOKENS, priority
+        ) as reservation:
+            model = self._get_model(model_name, generation_config=config)
 
             # Create image part for multimodal input
             image_part = {
@@ -134,14 +502,11 @@ class GeminiClient:
                 "data": image_data,  # Base64 encoded
             }
 
-            config = GenerationConfig(**kwargs)
             response = await model.generate_content_async(
-                [prompt, image_part],
-                generation_config=config,
-                request_options={"timeout": 60},
+                [prompt, image_part], request_options={"timeout": 60}
             )
 
-            self._update_token_counts(response)
+            self._update_token_counts(response, reservation)
             return cast(str, response.text)
 
     async def generate_with_context(
@@ -152,22 +517,25 @@ class GeminiClient:
         **kwargs: Any,
     ) -> str:
         """Chat-style generation with system instructions and history."""
-        async with self.limiter:
-            model_name = kwargs.pop("model", self.default_model_name)
-            # system_instruction is supported in newer versions
-            model = genai.GenerativeModel(  # type: ignore[attr-defined]
-                model_name=model_name, system_instruction=system
-            )
+        model_name, priority, config = self._call_settings(kwargs)
 
-            chat = model.start_chat(history=history or [])  # type: ignore[arg-type]
-            response = await chat.send_message_async(
-                user,
-                generation_config=GenerationConfig(**kwargs),
-                request_options={"timeout": 30},
-            )
+        async def generate() -> str:
+            async with self.scheduler.reserve(
+                model_name, estimate_tokens(system, user, history), priority
+            ) as reservation:
+                model = self._get_model(model_name, system, config)
 
-            self._update_token_counts(response)
-            return cast(str, response.text)
+                chat = model.start_chat(history=history or [])  # type: ignore[arg-type]
+                response = await chat.send_message_async(
+                    user, request_options={"timeout": 30}
+                )
+
+                self._update_token_counts(response, reservation)
+                return cast(str, response.text)
+
+        return await self.in_flight.do(
+            prompt_key(model_name, config, "chat", system, history, user), generate
+        )
 
     async def count_tokens(self, text: str, model_name: str | None = None) -> int:
         """Count tokens for a given text."""
@@ -179,23 +547,69 @@ class GeminiClient:
         self, text: str, task_type: str = "RETRIEVAL_DOCUMENT"
     ) -> list[float]:
         """Generate vector embeddings for text."""
-        async with self.limiter:
+        if self.embed_batcher is not None:
+            # The batch it joins goes through the cache
+            return await self.embed_batcher.embed(text, task_type)
+        (cached,) = await self.embedding_cache.get_many(
+            EMBEDDING_MODEL, task_type, [text]
+        )
+        if cached is not None:
+            return cached
+        async with self.scheduler.reserve(
+            EMBEDDING_MODEL, estimate_tokens(text), self.priority
+        ):
+            self.models.bind_loop()
             # Note: embeddings use a different model family
             result = await genai.embed_content_async(  # type: ignore[attr-defined]
-                model="models/text-embedding-004", content=text, task_type=task_type
+                model=EMBEDDING_MODEL, content=text, task_type=task_type
+            )
+        embedding: list[float] = result["embedding"]
+        await self.embedding_cache.put_many(
+            EMBEDDING_MODEL, task_type, {text: embedding}
+        )
+        return embedding
+
+    async def embed_batch(
+        self, texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT"
+    ) -> list[list[float]]:
+        """
+        Embed many texts, EMBED_BATCH_SIZE per request and scheduler slot.
+
+        Cached texts are served from the embedding cache; only the distinct
+        misses are sent.
+        """
+        cached = await self.embedding_cache.get_many(EMBEDDING_MODEL, task_type, texts)
+        misses = list(
+            dict.fromkeys(
+                text for text, hit in zip(texts, cached, strict=True) if hit is None
             )
-            return result["embedding"]
+        )
+        computed: dict[str, list[float]] = {}
+        for start in range(0, len(misses), EMBED_BATCH_SIZE):
+            chunk = misses[start : start + EMBED_BATCH_SIZE]
+            async with self.scheduler.reserve(
+                EMBEDDING_MODEL, estimate_tokens(*chunk), self.priority
+            ):
+                self.models.bind_loop()
+                result = await genai.embed_content_async(  # type: ignore[attr-defined]
+                    model=EMBEDDING_MODEL, content=chunk, task_type=task_type
+                )
+            computed.update(zip(chunk, result["embedding"], strict=True))
+        await self.embedding_cache.put_many(EMBEDDING_MODEL, task_type, computed)
+        return [
+            hit if hit is not None else computed[text]
+            for text, hit in zip(texts, cached, strict=True)
+        ]
 
     async def stream_text(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
         """Streaming text generation."""
-        async with self.limiter:
-            model_name = kwargs.pop("model", self.default_model_name)
-            model = self._get_model(model_name)
+        model_name, priority, config = self._call_settings(kwargs)
+        async with self.scheduler.reserve(
+            model_name, estimate_tokens(prompt), priority
+        ):
+            model = self._get_model(model_name, generation_config=config)
 
-            config = GenerationConfig(**kwargs)
-            response = await model.generate_content_async(
-                prompt, generation_config=config, stream=True
-            )
+            response = await model.generate_content_async(prompt, stream=True)
 
             async for chunk in response:
                 if chunk.text:
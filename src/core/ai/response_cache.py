@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.infrastructure.redis import RedisProvider, redis_provider
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseKey(NamedTuple):
+    template: str
+    digest: str
+
+    @property
+    def redis_key(self) -> str:
+        # Template first so one prompt's entries can be found and evicted
+        return f"llm:{self.template}:{self.digest}"
+
+
+def _canonical(value: Any) -> Any:
+    """JSON stand-in for values json can't encode, identical in every process"""
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class ResponseCache:
+    """
+    Redis cache of LLM responses shared by every process.
+
+    A response is keyed by a sha256 over the canonical JSON of the model,
+    the prompt template id, the rendered prompt and the params the output
+    depends on (generation config, including any response schema). Unlike
+    the builtin hash(), which is salted per process, the key is the same in
+    every worker and replica and across restarts.
+
+    Redis failures count as misses; the response is then just generated.
+    """
+
+    def __init__(
+        self,
+        redis: RedisProvider | None = redis_provider,
+        default_ttl: int = settings.ai.RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.redis = redis
+        self.default_ttl = default_ttl
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def key(
+        self,
+        model: str,
+        template: str,
+        prompt: str,
+        params: dict[str, Any] | None = None,
+    ) -> ResponseKey:
+        payload = json.dumps(
+            [model, template, prompt, params or {}],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_canonical,
+        )
+        return ResponseKey(template, hashlib.sha256(payload.encode()).hexdigest())
+
+    async def get(self, key: ResponseKey) -> str | None:
+        cached = None
+        if self.redis is not None:
+            try:
+                cached = await self.redis.get(key.redis_key)
+            except Exception as e:
+                logger.debug(f"Response cache read failed: {e}")
+        if cached is None:
+            self.misses[key.template] += 1
+        else:
+            self.hits[key.template] += 1
+        return cached
+
+    async def set(self, key: ResponseKey, value: str, ttl: int | None = None) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key.redis_key, value, expire=ttl or self.default_ttl)
+        except Exception as e:
+            logger.debug(f"Response cache write failed: {e}")
+
+    async def get_or_generate(
+        self,
+        key: ResponseKey,
+        generate: Callable[[], Awaitable[str]],
+        ttl: int | None = None,
+    ) -> str:
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+        response = await generate()
+        await self.set(key, response, ttl)
+        return response
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hits and misses per template since start"""
+        return {
+            template: {"hits": self.hits[template], "misses": self.misses[template]}
+            for template in sorted(self.hits.keys() | self.misses.keys())
+        }
+
+
+# Shared by every AI module in the process
+response_cache = ResponseCache()
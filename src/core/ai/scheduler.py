@@ -0,0 +1,218 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Literal
+
+from google.api_core.exceptions import ResourceExhausted, TooManyRequests
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough tokens per character for Gemini's tokenizer on English text
+CHARS_PER_TOKEN = 4
+# Minimum time between two AIMD halvings of a model's concurrency
+BACKOFF_COOLDOWN_SECONDS = 1.0
+
+
+class Priority(IntEnum):
+    """Scheduling lane; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+def estimate_tokens(*parts: object) -> int:
+    """Cheap local estimate of the input tokens of a request."""
+    return sum(len(str(part)) for part in parts if part) // CHARS_PER_TOKEN + 1
+
+
+def is_quota_error(error: BaseException) -> bool:
+    return isinstance(error, ResourceExhausted | TooManyRequests)
+
+
+class _Bucket:
+    """Per-minute token bucket whose level may go negative after corrections"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self._rate = per_minute / 60
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, floor: float = 0.0) -> float:
+        """Seconds until `amount` can be taken leaving at least `floor`"""
+        self._refill()
+        # A request bigger than the bucket would otherwise never run
+        missing = min(amount + floor, self.capacity) - self.level
+        return max(missing, 0.0) / self._rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+
+class _ModelLane:
+    """
+    Admission control for one model: RPM and TPM buckets, priority-ordered
+    waiters and an AIMD concurrency limit.
+    """
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int, reserve: float):
+        self.requests = _Bucket(rpm)
+        self.tokens = _Bucket(tpm)
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.reserve = reserve
+        self._waiters: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._last_backoff = 0.0
+
+    async def acquire(self, tokens: int, priority: Priority) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), tokens, future))
+        self._pump()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the caller gave up
+                self.release("error")
+            raise
+
+    def release(self, outcome: Literal["ok", "throttled", "error"]) -> None:
+        self.in_flight -= 1
+        if outcome == "ok":
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        elif outcome == "throttled":
+            now = time.monotonic()
+            # Requests in flight when the quota ran out fail together;
+            # count them as one congestion signal
+            if now - self._last_backoff >= BACKOFF_COOLDOWN_SECONDS:
+                self.limit = max(1.0, self.limit / 2)
+                self._last_backoff = now
+        self._pump()
+
+    def _pump(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            priority, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= int(self.limit):
+                return
+            # Batch work leaves part of each bucket to interactive callers
+            share = self.reserve if priority == Priority.BATCH else 0.0
+            wait = max(
+                self.requests.wait_time(1, share * self.requests.capacity),
+                self.tokens.wait_time(tokens, share * self.tokens.capacity),
+            )
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._pump)
+                return
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(min(tokens, self.tokens.capacity))
+            self.in_flight += 1
+            future.set_result(None)
+
+
+class Reservation:
+    """An admitted request; settle() corrects its token estimate."""
+
+    def __init__(self, lane: _ModelLane, estimate: int):
+        self._lane = lane
+        self.estimate = estimate
+
+    def settle(self, actual_tokens: int) -> None:
+        self._lane.tokens.take(actual_tokens - self.estimate)
+        self.estimate = actual_tokens
+
+
+class GeminiScheduler:
+    """
+    Schedules Gemini calls per model instead of through one shared limiter.
+
+    Each model gets its own requests-per-minute and tokens-per-minute
+    buckets, so a flood of flash calls cannot starve pro calls. Waiters are
+    served interactive lane first, and batch callers may not dip into the
+    last `interactive_reserve` share of either bucket, keeping headroom for
+    latency-sensitive requests while batch work soaks up the rest.
+
+    Concurrency per model follows AIMD: it grows by one per window of
+    successful calls up to max_concurrency and halves on quota errors.
+    """
+
+    def __init__(
+        self,
+        rpm: int = settings.ai.RATE_LIMIT_RPM,
+        tpm: int = settings.ai.RATE_LIMIT_TPM,
+        max_concurrency: int = settings.ai.MAX_CONCURRENCY,
+        model_limits: dict[str, dict[str, int]] | None = None,
+        interactive_reserve: float = settings.ai.INTERACTIVE_RESERVE,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.model_limits = (
+            settings.ai.MODEL_RATE_LIMITS if model_limits is None else model_limits
+        )
+        self.interactive_reserve = interactive_reserve
+        self._lanes: dict[str, _ModelLane] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def lane(self, model: str) -> _ModelLane:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Waiters and timers of a previous loop can no longer run
+            self._lanes.clear()
+            self._loop = loop
+        lane = self._lanes.get(model)
+        if lane is None:
+            limits = self.model_limits.get(model, {})
+            lane = _ModelLane(
+                rpm=limits.get("rpm", self.rpm),
+                tpm=limits.get("tpm", self.tpm),
+                max_concurrency=limits.get("concurrency", self.max_concurrency),
+                reserve=self.interactive_reserve,
+            )
+            self._lanes[model] = lane
+        return lane
+
+    @asynccontextmanager
+    async def reserve(
+        self, model: str, tokens: int = 0, priority: Priority = Priority.INTERACTIVE
+    ) -> AsyncIterator[Reservation]:
+        """Wait for capacity on model and hold it for the block."""
+        lane = self.lane(model)
+        await lane.acquire(tokens, priority)
+        outcome: Literal["ok", "throttled", "error"] = "error"
+        try:
+            yield Reservation(lane, tokens)
+            outcome = "ok"
+        except Exception as e:
+            if is_quota_error(e):
+                outcome = "throttled"
+                logger.info(f"Quota exceeded for {model}; backing off")
+            raise
+        finally:
+            lane.release(outcome)
+
+
+# Shared by every GeminiClient in the process that has no explicit limits
+gemini_scheduler = GeminiScheduler()
@@ -65,6 +65,62 @@ class AISettings(BaseSettings):
     GEMINI_MODEL: str = "gemini-1.5-pro"
     EMBEDDING_MODEL: str = "text-embedding-004"
     RATE_LIMIT_RPM: int = Field(default=60, ge=1)
+    # Input tokens per minute and peak concurrent calls, per model
+    RATE_LIMIT_TPM: int = Field(default=1_000_000, ge=1)
+    MAX_CONCURRENCY: int = Field(default=8, ge=1)
+    # Per-model overrides, e.g. {"gemini-1.5-pro": {"rpm": 360, "tpm": 4000000}}
+    MODEL_RATE_LIMITS: dict[str, dict[str, int]] = Field(default_factory=dict)
+    # Share of each model's quota batch callers leave to interactive ones
+    INTERACTIVE_RESERVE: float = Field(default=0.2, ge=0, lt=1)
+    # GenerativeModel handles kept per process, by model/system/config
+    MODEL_CACHE_SIZE: int = Field(default=32, ge=1)
+    # Window for coalescing concurrent embed_text calls; 0 disables it
+    EMBED_BATCH_WINDOW_MS: float = Field(default=0.0, ge=0)
+    # Embedding cache: in-process LRU entries, and Redis entries' TTL and
+    # stored precision
+    EMBEDDING_CACHE_SIZE: int = Field(default=10_000, ge=0)
+    EMBEDDING_CACHE_TTL_SECONDS: int = Field(default=30 * 24 * 3600, ge=1)
+    EMBEDDING_CACHE_DTYPE: Literal["float16", "float32"] = "float16"
+    # LLM responses cached with cache_as= and no per-task TTL
+    RESPONSE_CACHE_TTL_SECONDS: int = Field(default=3600, ge=1)
+
+
+class ScraperSettings(BaseSettings):
+    """Outbound HTTP pooling and rate limits for job board scraping."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_prefix="SCRAPER_",
+        extra="ignore",
+    )
+
+    # Requests per second per host; keys match the host or any subdomain
+    RATE_LIMITS: dict[str, float] = {
+        "boards-api.greenhouse.io": 2.0,
+        "api.lever.co": 2.0,
+        "api.smartrecruiters.com": 2.0,
+        "bamboohr.com": 1.0,
+        "myworkdayjobs.com": 1.0,
+    }
+    DEFAULT_RATE: float = Field(default=2.0, gt=0)
+    # Requests a bucket may send back-to-back after being idle
+    BURST: int = Field(default=2, ge=1)
+
+    # Shared connection pool; keep-alive lets every scraper reuse warm TLS
+    CONNECTION_LIMIT: int = Field(default=100, ge=1)
+    CONNECTION_LIMIT_PER_HOST: int = Field(default=8, ge=1)
+    KEEPALIVE_SECONDS: float = Field(default=30.0, gt=0)
+    DNS_CACHE_TTL: int = Field(default=300, ge=0)
+
+    # Workday career sites crawled, as "{tenant}.{instance}/{site}" from
+    # https://{tenant}.{instance}.myworkdayjobs.com/{site}
+    WORKDAY_TENANTS: list[str] = [
+        "nvidia.wd5/NVIDIAExternalCareerSite",
+        "salesforce.wd12/External_Career_Site",
+        "adobe.wd5/external_experienced",
+        "workday.wd5/Workday",
+    ]
 
 
 class StorageSettings(BaseSettings):
@@ -127,6 +183,7 @@ class Settings(BaseSettings):
     redis: RedisSettings = Field(default_factory=RedisSettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     ai: AISettings = Field(default_factory=AISettings)
+    scraper: ScraperSettings = Field(default_factory=ScraperSettings)
     storage: StorageSettings = Field(default_factory=StorageSettings)
     keycloak: KeycloakSettings = Field(default_factory=KeycloakSettings)
     features: FeatureSettings = Field(default_factory=FeatureSettings)
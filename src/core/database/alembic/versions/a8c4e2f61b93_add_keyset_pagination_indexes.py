@@ -0,0 +1,72 @@
+"""add keyset pagination indexes
+
+Revision ID: a8c4e2f61b93
+Revises: f3b6d8e2a415
+Create Date: 2026-10-16 12:05:41.217309
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c4e2f61b93"
+down_revision: str | Sequence[str] | None = "f3b6d8e2a415"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_posted_at_id",
+            "jobs",
+            [sa.text("posted_at DESC NULLS LAST"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the (user_id, overall_score, id) index
+        op.create_index(
+            "ix_job_matches_user_id_overall_score_id",
+            "job_matches",
+            ["user_id", sa.text("overall_score DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_job_matches_user_id_overall_score",
+            table_name="job_matches",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_matches_user_id_overall_score",
+            "job_matches",
+            ["user_id", "overall_score"],
+            unique=False,
+            postgresql_ops={"overall_score": "DESC"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_job_matches_user_id_overall_score_id",
+            table_name="job_matches",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_jobs_posted_at_id",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
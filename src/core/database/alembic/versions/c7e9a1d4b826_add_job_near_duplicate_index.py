@@ -0,0 +1,70 @@
+"""add job near-duplicate index
+
+Revision ID: c7e9a1d4b826
+Revises: b5d1f7a39c20
+Create Date: 2026-10-16 14:21:08.553012
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e9a1d4b826"
+down_revision: str | Sequence[str] | None = "b5d1f7a39c20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jobs", sa.Column("minhash_signature", sa.ARRAY(sa.Integer()), nullable=True)
+    )
+    op.add_column("jobs", sa.Column("canonical_job_id", sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        "fk_jobs_canonical_job_id_jobs",
+        "jobs",
+        "jobs",
+        ["canonical_job_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_table(
+        "job_lsh_buckets",
+        sa.Column("band", sa.SmallInteger(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("job_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("band", "bucket", "job_id"),
+    )
+    op.create_index(
+        op.f("ix_job_lsh_buckets_job_id"), "job_lsh_buckets", ["job_id"], unique=False
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_jobs_canonical_job_id"),
+            "jobs",
+            ["canonical_job_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_jobs_canonical_job_id"),
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_index(op.f("ix_job_lsh_buckets_job_id"), table_name="job_lsh_buckets")
+    op.drop_table("job_lsh_buckets")
+    op.drop_constraint("fk_jobs_canonical_job_id_jobs", "jobs", type_="foreignkey")
+    op.drop_column("jobs", "canonical_job_id")
+    op.drop_column("jobs", "minhash_signature")
@@ -0,0 +1,76 @@
+"""add job normalized location and salary
+
+Revision ID: d2f8b4a6c913
+Revises: c7e9a1d4b826
+Create Date: 2026-10-16 20:12:41.307215
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f8b4a6c913"
+down_revision: str | Sequence[str] | None = "c7e9a1d4b826"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jobs", sa.Column("location_country", sa.String(length=2), nullable=True)
+    )
+    op.add_column(
+        "jobs", sa.Column("location_region", sa.String(length=10), nullable=True)
+    )
+    op.add_column(
+        "jobs", sa.Column("location_city", sa.String(length=100), nullable=True)
+    )
+    # Remote-only search no longer matches location text; the rest of the
+    # structured columns are filled by the normalize_jobs task
+    op.execute(
+        "UPDATE jobs SET work_setting = 'remote' "
+        "WHERE location ILIKE '%remote%' "
+        "AND work_setting IS DISTINCT FROM 'hybrid' "
+        "AND work_setting IS DISTINCT FROM 'remote'"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_location_country_region_city",
+            "jobs",
+            ["location_country", "location_region", "location_city"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_jobs_salary_max"),
+            "jobs",
+            ["salary_max"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_jobs_salary_max"),
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_jobs_location_country_region_city",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("jobs", "location_city")
+    op.drop_column("jobs", "location_region")
+    op.drop_column("jobs", "location_country")
@@ -0,0 +1,47 @@
+"""add job_matches upsert constraint and feed index
+
+Revision ID: d94f2a6b8c01
+Revises: c3d8e1f5a7b2
+Create Date: 2026-10-16 10:03:17.884520
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d94f2a6b8c01"
+down_revision: str | Sequence[str] | None = "c3d8e1f5a7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the most recent row per (user_id, job_id) before adding the constraint
+    op.execute(
+        """
+        DELETE FROM job_matches a
+        USING job_matches b
+        WHERE a.user_id = b.user_id
+          AND a.job_id = b.job_id
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+        """
+    )
+    op.create_unique_constraint(
+        "uq_job_matches_user_id_job_id", "job_matches", ["user_id", "job_id"]
+    )
+    op.create_index(
+        "ix_job_matches_user_id_overall_score",
+        "job_matches",
+        ["user_id", "overall_score"],
+        unique=False,
+        postgresql_ops={"overall_score": "DESC"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_matches_user_id_overall_score", table_name="job_matches")
+    op.drop_constraint("uq_job_matches_user_id_job_id", "job_matches", type_="unique")
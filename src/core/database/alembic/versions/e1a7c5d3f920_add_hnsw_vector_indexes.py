@@ -0,0 +1,58 @@
+"""add hnsw vector indexes
+
+Revision ID: e1a7c5d3f920
+Revises: d94f2a6b8c01
+Create Date: 2026-10-16 10:41:55.217309
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c5d3f920"
+down_revision: str | Sequence[str] | None = "d94f2a6b8c01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, column) for every cosine-distance search
+VECTOR_INDEXES = [
+    ("ix_jobs_description_embedding_hnsw", "jobs", "description_embedding"),
+    ("ix_personas_summary_embedding_hnsw", "personas", "summary_embedding"),
+    (
+        "ix_persona_experiences_experience_embedding_hnsw",
+        "persona_experiences",
+        "experience_embedding",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build concurrently so ingestion and search keep running
+    with op.get_context().autocommit_block():
+        for name, table, column in VECTOR_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={column: "vector_cosine_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in VECTOR_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
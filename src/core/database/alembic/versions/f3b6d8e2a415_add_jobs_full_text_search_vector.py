@@ -0,0 +1,60 @@
+"""add jobs full-text search vector
+
+Revision ID: f3b6d8e2a415
+Revises: e1a7c5d3f920
+Create Date: 2026-10-16 11:20:08.631742
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b6d8e2a415"
+down_revision: str | Sequence[str] | None = "e1a7c5d3f920"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: rewrites jobs once, then maintained by Postgres
+    op.add_column(
+        "jobs",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_search_vector",
+            "jobs",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_search_vector",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("jobs", "search_vector")
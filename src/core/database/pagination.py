@@ -0,0 +1,108 @@
+"""
+Keyset (cursor) pagination.
+
+A cursor is the sort key of the last row on a page, wrapped in an opaque
+url-safe token. The next page starts strictly after that key, so every
+page is an index range scan regardless of depth and rows inserted ahead
+of the cursor do not shift later pages.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, or_, tuple_
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or belongs to a different ordering"""
+
+
+@dataclass
+class Page(Generic[T]):  # noqa: UP046
+    items: list[T]
+    # None on the last page, or when the ordering has no keyset
+    next_cursor: str | None = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        raise ValueError(f"Unknown cursor value {value!r}")
+    return value
+
+
+def encode_cursor(order: str, key: Sequence[Any]) -> str:
+    """Opaque token for the sort key of the last row of a page"""
+    payload = {"o": order, "k": [_encode_value(v) for v in key]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order: str) -> list[Any]:
+    """Sort key from a cursor issued for the same ordering"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["o"] != order:
+            raise InvalidCursorError(
+                f"Cursor was issued for '{payload['o']}' order, not '{order}'"
+            )
+        return [_decode_value(v) for v in payload["k"]]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+
+def keyset_after(
+    columns: Sequence[ColumnElement[Any]],
+    key: Sequence[Any],
+    descending: bool = False,
+) -> ColumnElement[bool]:
+    """
+    Rows strictly after key in (columns...) order.
+
+    All columns must sort in the same direction and be non-null; the row
+    comparison lets Postgres use a matching composite index.
+    """
+    if descending:
+        return tuple_(*columns) < tuple_(*key)
+    return tuple_(*columns) > tuple_(*key)
+
+
+def nullable_keyset_after_desc(
+    column: ColumnElement[Any],
+    tiebreaker: ColumnElement[Any],
+    key: Sequence[Any],
+) -> ColumnElement[bool]:
+    """
+    Rows after key for ORDER BY column DESC NULLS LAST, tiebreaker DESC.
+
+    Rows with a value are followed by the null tail ordered by tiebreaker.
+    """
+    value, last_id = key
+    if value is None:
+        return and_(column.is_(None), tiebreaker < last_id)
+    return or_(
+        keyset_after([column, tiebreaker], [value, last_id], descending=True),
+        column.is_(None),
+    )
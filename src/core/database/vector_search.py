@@ -0,0 +1,77 @@
+"""
+pgvector query tuning.
+
+HNSW indexes return approximate nearest neighbours. These helpers let a
+repository tune recall per query (hnsw.ef_search) or force an exact scan,
+which is the baseline for recall measurements.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+VectorSearchMode = Literal["approximate", "exact"]
+
+# pgvector's default hnsw.ef_search; an HNSW scan yields at most this many rows
+DEFAULT_EF_SEARCH = 40
+MAX_EF_SEARCH = 1000
+
+
+def ef_search_for(rows_needed: int, ef_search: int | None = None) -> int | None:
+    """Explicit ef_search, or one large enough to return rows_needed rows"""
+    if ef_search is not None:
+        return ef_search
+    if rows_needed > DEFAULT_EF_SEARCH:
+        return min(rows_needed, MAX_EF_SEARCH)
+    return None
+
+
+@asynccontextmanager
+async def vector_search_settings(
+    session: AsyncSession,
+    mode: VectorSearchMode = "approximate",
+    ef_search: int | None = None,
+    iterative_scan: bool = False,
+) -> AsyncIterator[None]:
+    """
+    Apply pgvector planner settings to the queries run inside the block.
+
+    iterative_scan lets an HNSW scan keep going past ef_search candidates
+    when a WHERE clause (e.g. a keyset cursor) filters rows out, while
+    still returning them in exact distance order (pgvector >= 0.8).
+
+    Settings are transaction-local and restored on exit, so they do not
+    leak into later queries on the same session.
+    """
+    overrides: dict[str, str] = {}
+    if mode == "exact":
+        # Vector indexes only support index scans; disabling them forces
+        # a sequential scan with exact distances
+        overrides["enable_indexscan"] = "off"
+    if ef_search is not None:
+        overrides["hnsw.ef_search"] = str(ef_search)
+    if iterative_scan:
+        overrides["hnsw.iterative_scan"] = "strict_order"
+
+    previous: dict[str, str | None] = {}
+    for name, value in overrides.items():
+        result = await session.execute(
+            text(
+                "SELECT current_setting(:name, true), set_config(:name, :value, true)"
+            ),
+            {"name": name, "value": value},
+        )
+        previous[name] = result.scalar_one()
+
+    # On error the transaction is rolled back, which discards the settings
+    yield
+
+    for name, value in previous.items():
+        if value is not None:
+            await session.execute(
+                text("SELECT set_config(:name, :value, true)"),
+                {"name": name, "value": value},
+            )
@@ -1,8 +1,17 @@
 import asyncio
+import logging
 from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
+from sqlalchemy import event as orm_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session.info key of the events waiting for the transaction to commit
+PENDING_EVENTS = "pending_events"
 
 
 class Event(BaseModel):
@@ -12,6 +21,7 @@ class Event(BaseModel):
 class InternalEventBus:
     def __init__(self) -> None:
         self._subscribers: dict[type[Event], list[Callable[[Event], Any]]] = {}
+        self._deliveries: set[asyncio.Task[None]] = set()
 
     def subscribe(
         self, event_type: type[Event], handler: Callable[[Event], Any]
@@ -26,5 +36,35 @@ class InternalEventBus:
             tasks = [handler(event) for handler in self._subscribers[event_type]]
             await asyncio.gather(*tasks)
 
+    def publish_after_commit(self, session: AsyncSession, event: Event) -> None:
+        """
+        Publish event once the session's transaction commits.
+
+        Handlers then see the committed rows, e.g. a worker they queue
+        reads what the request wrote. A rollback drops the event.
+        """
+        session.info.setdefault(PENDING_EVENTS, []).append(event)
+        sync_session = session.sync_session
+        if not orm_event.contains(sync_session, "after_commit", self._after_commit):
+            orm_event.listen(sync_session, "after_commit", self._after_commit)
+            orm_event.listen(sync_session, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, session: Session) -> None:
+        # Runs inside AsyncSession.commit(), on the event loop's thread
+        loop = asyncio.get_running_loop()
+        for event in session.info.pop(PENDING_EVENTS, []):
+            delivery = loop.create_task(self._deliver(event))
+            self._deliveries.add(delivery)
+            delivery.add_done_callback(self._deliveries.discard)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(PENDING_EVENTS, None)
+
+    async def _deliver(self, event: Event) -> None:
+        try:
+            await self.publish(event)
+        except Exception as e:
+            logger.warning(f"Handler failed for {type(event).__name__}: {e}")
+
 
 event_bus = InternalEventBus()
@@ -15,6 +15,10 @@ class RedisProvider:
         self._url = settings.redis.URL
         self._pool: redis.ConnectionPool | None = None
         self._client: redis.Redis | None = None
+        # Same server without response decoding, for binary values
+        self._binary_pool: redis.ConnectionPool | None = None
+        self._binary_client: redis.Redis | None = None
+        self._scripts: dict[str, Any] = {}
 
     async def connect(self) -> None:
         """Initialize the Redis connection pool."""
@@ -23,6 +27,11 @@ class RedisProvider:
                 self._url, decode_responses=True, ssl=settings.redis.USE_SSL
             )
             self._client = redis.Redis(connection_pool=self._pool)
+            self._binary_pool = redis.ConnectionPool.from_url(
+                self._url, decode_responses=False, ssl=settings.redis.USE_SSL
+            )
+            self._binary_client = redis.Redis(connection_pool=self._binary_pool)
+            self._scripts = {}
             # Handle potential union type from ping() for Mypy
             await self._client.ping()  # type: ignore[misc]
             logger.info("Connected to Redis")
@@ -32,6 +41,8 @@ class RedisProvider:
 
     async def disconnect(self) -> None:
         """Close the Redis connection pool."""
+        if self._binary_pool:
+            await self._binary_pool.disconnect()
         if self._pool:
             await self._pool.disconnect()
             logger.info("Disconnected from Redis")
@@ -51,6 +62,35 @@ class RedisProvider:
             raise RuntimeError("Redis client not connected")
         await self._client.delete(key)
 
+    async def get_many_bytes(self, keys: list[str]) -> list[bytes | None]:
+        """Raw values of several keys in one round trip (MGET)."""
+        if not self._binary_client:
+            raise RuntimeError("Redis client not connected")
+        if not keys:
+            return []
+        return list(await self._binary_client.mget(keys))
+
+    async def set_many_bytes(
+        self, values: dict[str, bytes], expire: int | None = None
+    ) -> None:
+        """Store raw values in one pipelined round trip."""
+        if not self._binary_client:
+            raise RuntimeError("Redis client not connected")
+        if not values:
+            return
+        async with self._binary_client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
+    async def run_script(self, script: str, keys: list[str], args: list[Any]) -> Any:
+        """Run a Lua script atomically (EVALSHA, loading it on first use)."""
+        if not self._client:
+            raise RuntimeError("Redis client not connected")
+        if script not in self._scripts:
+            self._scripts[script] = self._client.register_script(script)
+        return await self._scripts[script](keys=keys, args=args)
+
     async def exists(self, key: str) -> bool:
         if not self._client:
             raise RuntimeError("Redis client not connected")
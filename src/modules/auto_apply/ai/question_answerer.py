@@ -1,4 +1,3 @@
-import hashlib
 import logging
 import os
 from enum import Enum
@@ -10,7 +9,13 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
-from src.core.infrastructure.redis import redis_provider
+from src.core.ai.embedding_cache import embedding_cache
+from src.core.ai.gemini_client import (
+    EMBEDDING_MODEL,
+    MODEL_CONFIGS,
+    RESPONSE_CACHE_TTLS,
+)
+from src.core.ai.response_cache import ResponseKey, response_cache
 from src.modules.persona.domain.models import Persona
 from src.modules.persona.domain.services import PersonaService
 
@@ -103,6 +108,9 @@ ANSWER:
 """
 
 
+ANSWER_CONFIG = MODEL_CONFIGS["question_answering"]
+
+
 class QuestionAnswerer:
     def __init__(self, persona_service: PersonaService):
         self._persona_service = persona_service
@@ -111,10 +119,12 @@ class QuestionAnswerer:
             logger.warning("GOOGLE_GEMINI_KEY not set. RAG service will fail.")
 
         self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash", google_api_key=self._api_key, temperature=0.4
+            model=ANSWER_CONFIG["model"],
+            google_api_key=self._api_key,
+            temperature=ANSWER_CONFIG["temperature"],
         )
         self.embeddings = GoogleGenerativeAIEmbeddings(  # type: ignore[call-arg]
-            model="models/text-embedding-004",
+            model=EMBEDDING_MODEL,
             google_api_key=self._api_key,
         )
         self.chain = (
@@ -134,7 +144,9 @@ class QuestionAnswerer:
         Generates an answer for a specific question using RAG.
         """
         # 1. Check Cache
-        cached = await self.get_cached_answer(question, user_id, job_context.get("id"))
+        cached = await self.get_cached_answer(
+            question, user_id, job_context.get("id"), char_limit
+        )
         if cached:
             return cached
 
@@ -161,7 +173,9 @@ class QuestionAnswerer:
             )
 
             # 5. Cache
-            await self._cache_answer(question, user_id, job_context.get("id"), response)
+            await self._cache_answer(
+                question, user_id, job_context.get("id"), char_limit, response
+            )
             return response
 
         except Exception as e:
@@ -208,25 +222,46 @@ class QuestionAnswerer:
         return QuestionType.CUSTOM
 
     async def get_cached_answer(
-        self, question: str, user_id: UUID, job_id: str | None
+        self, question: str, user_id: UUID, job_id: str | None, char_limit: int = 1000
     ) -> str | None:
         if not job_id:
             return None
-        key = self._generate_cache_key(question, user_id, job_id)
-        result = await redis_provider.get(key)
-        return cast(str | None, result)
+        return await response_cache.get(
+            self._cache_key(question, user_id, job_id, char_limit)
+        )
 
     async def _cache_answer(
-        self, question: str, user_id: UUID, job_id: str | None, answer: str
+        self,
+        question: str,
+        user_id: UUID,
+        job_id: str | None,
+        char_limit: int,
+        answer: str,
     ) -> None:
         if not job_id:
             return
-        key = self._generate_cache_key(question, user_id, job_id)
-        await redis_provider.set(key, answer, expire=604800)  # 7 days
+        await response_cache.set(
+            self._cache_key(question, user_id, job_id, char_limit),
+            answer,
+            ttl=RESPONSE_CACHE_TTLS["question_answering"],
+        )
 
-    def _generate_cache_key(self, question: str, user_id: UUID, job_id: str) -> str:
-        q_hash = hashlib.md5(question.encode()).hexdigest()
-        return f"answer:{user_id}:{job_id}:{q_hash}"
+    def _cache_key(
+        self, question: str, user_id: UUID, job_id: str, char_limit: int
+    ) -> ResponseKey:
+        # Looked up before the persona is retrieved, so the answer is keyed
+        # by whose it is and for which job rather than the rendered prompt
+        return response_cache.key(
+            ANSWER_CONFIG["model"],
+            "auto_apply.question_answer",
+            question,
+            {
+                "temperature": ANSWER_CONFIG["temperature"],
+                "user_id": str(user_id),
+                "job_id": job_id,
+                "char_limit": char_limit,
+            },
+        )
 
     async def _retrieve_context(
         self, question: str, q_type: QuestionType, persona: Persona
@@ -242,7 +277,9 @@ class QuestionAnswerer:
 
         # In-memory vector search for small personal datasets
         # Generate question embedding
-        q_embedding = await self.embeddings.aembed_query(question)
+        q_embedding = await embedding_cache.get_or_embed(
+            EMBEDDING_MODEL, "RETRIEVAL_QUERY", question, self.embeddings.aembed_query
+        )
 
         candidates: list[dict[str, Any]] = []
 
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import random
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 from pydantic import BaseModel, Field
@@ -18,6 +20,13 @@ from src.modules.persona.domain.models import Persona
 
 logger = logging.getLogger(__name__)
 
+GENERIC_PHRASES = ("i am writing", "great fit")
+TARGET_WORD_COUNTS = {
+    Length.SHORT: 150,
+    Length.MEDIUM: 250,
+    Length.COMPREHENSIVE: 400,
+}
+
 
 class CoverLetterPreferences(BaseModel):
     tone: Tone = Tone.PROFESSIONAL
@@ -30,12 +39,57 @@ class AlternativesList(BaseModel):
     alternatives: list[str]
 
 
+class QualityTracker:
+    """
+    Quality audit of a cover letter, updated chunk by chunk as it streams.
+
+    Phrases split across chunks are still found: the tail of the text seen
+    so far, one character shorter than the longest phrase or company name,
+    is searched together with each new chunk.
+    """
+
+    def __init__(self, job: Job, preferences: CoverLetterPreferences):
+        self._company = job.company.lower()
+        self._target_word_count = TARGET_WORD_COUNTS.get(preferences.length)
+        self._keep = max(len(p) for p in (self._company, *GENERIC_PHRASES)) - 1
+        self._tail = ""
+        self._in_word = False
+        self.word_count = 0
+        self.company_mentioned = False
+        self.generic_phrases_count = 0
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self.word_count += len(chunk.split())
+        if self._in_word and not chunk[0].isspace():
+            # The chunk continues the previous chunk's last word
+            self.word_count -= 1
+        self._in_word = not chunk[-1].isspace()
+
+        text = self._tail + chunk.lower()
+        self.company_mentioned = self.company_mentioned or self._company in text
+        # Phrases wholly inside the tail were counted with the previous chunk
+        self.generic_phrases_count += sum(
+            text.count(p) - self._tail.count(p) for p in GENERIC_PHRASES
+        )
+        self._tail = text[-self._keep :] if self._keep else ""
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "word_count": self.word_count,
+            "target_word_count": self._target_word_count,
+            "company_mentioned": self.company_mentioned,
+            "generic_phrases_count": self.generic_phrases_count,
+            "quality_score": max(0, 100 - (self.generic_phrases_count * 10)),
+        }
+
+
 class CoverLetterGenerator:
     """Service to generate and refine cover letters using Gemini AI."""
 
     def __init__(self, gemini_client: GeminiClient):
         self.client = gemini_client
-        self.cache_ttl = 3600  # 1 hour for transient generation parts
 
     async def _extract_company_research(self, job: Job) -> str:
         """Parses the job description to extract company-specific context."""
@@ -48,7 +102,10 @@ class CoverLetterGenerator:
         Return a concise summary (100 words max).
         """
         try:
-            return await self.client.generate_text(prompt)
+            # The same job is researched for every applicant
+            return await self.client.generate_text(
+                prompt, cache_as="cover_letter.company_research"
+            )
         except Exception as e:
             logger.warning(f"Failed to extract company research: {str(e)}")
             return "Company values focus on innovation and excellence."
@@ -66,58 +123,54 @@ class CoverLetterGenerator:
         self, content: str, job: Job, preferences: CoverLetterPreferences
     ) -> dict[str, Any]:
         """Automated quality audit for the generated cover letter."""
-        word_count = len(content.split())
+        tracker = QualityTracker(job, preferences)
+        tracker.feed(content)
+        return tracker.metrics()
 
-        # Simple checks
-        company_mentioned = job.company.lower() in content.lower()
-        generic_p_count = content.lower().count("i am writing") + content.lower().count(
-            "great fit"
+    def _choose_prompt_version(self) -> str:
+        # A/B Testing Logic: Randomly select a prompt version
+        return random.choice(["v1", "v2"])
+
+    async def _build_prompt(
+        self,
+        prompt_version: str,
+        job: Job,
+        persona: Persona,
+        preferences: CoverLetterPreferences,
+    ) -> str:
+        """Renders the prompt; company research runs while the rest is assembled."""
+        research = (
+            asyncio.create_task(self._extract_company_research(job))
+            if preferences.include_company_research
+            else None
         )
-
-        target_words = {
-            Length.SHORT: 150,
-            Length.MEDIUM: 250,
-            Length.COMPREHENSIVE: 400,
-        }
-
-        return {
-            "word_count": word_count,
-            "target_word_count": target_words.get(preferences.length),
-            "company_mentioned": company_mentioned,
-            "generic_phrases_count": generic_p_count,
-            "quality_score": max(0, 100 - (generic_p_count * 10)),
+        prompt_template = (
+            COVER_LETTER_PROMPT_V1 if prompt_version == "v1" else COVER_LETTER_PROMPT_V2
+        )
+        fields = {
+            "persona_summary": self._summarize_persona(persona),
+            "company_name": job.company,
+            "job_title": job.title,
+            "job_description": job.description[:1000],  # Truncate to save tokens
+            "requirements": ", ".join(job.raw_data.get("requirements", [])),
+            "tone": preferences.tone.value,
+            "length": preferences.length.value,
+            "emphasis": ", ".join([e.value for e in preferences.emphasis]),
+            "matched_qualifications": (
+                "High alignment with technical stack and leadership goals."
+            ),
         }
+        company_research = await research if research is not None else ""
+        return prompt_template.format(**fields, company_research=company_research)
 
     async def generate(
         self, job: Job, persona: Persona, preferences: CoverLetterPreferences
     ) -> dict[str, Any]:
         """Main entry point for generating a personalized cover letter."""
-        # A/B Testing Logic: Randomly select a prompt version
-        prompt_version = random.choice(["v1", "v2"])
-        prompt_template = (
-            COVER_LETTER_PROMPT_V1 if prompt_version == "v1" else COVER_LETTER_PROMPT_V2
-        )
-
-        company_research = ""
-        if preferences.include_company_research:
-            company_research = await self._extract_company_research(job)
+        prompt_version = self._choose_prompt_version()
+        prompt = await self._build_prompt(prompt_version, job, persona, preferences)
 
-        prompt = prompt_template.format(
-            persona_summary=self._summarize_persona(persona),
-            company_name=job.company,
-            job_title=job.title,
-            job_description=job.description[:1000],  # Truncate to save tokens
-            requirements=", ".join(job.raw_data.get("requirements", [])),
-            company_research=company_research,
-            tone=preferences.tone.value,
-            length=preferences.length.value,
-            emphasis=", ".join([e.value for e in preferences.emphasis]),
-            matched_qualifications=(
-                "High alignment with technical stack and leadership goals."
-            ),
-        )
-
-        content = await self.client.generate_text(prompt)
+        content = await self.client.generate_text(prompt, task="cover_letter")
         quality_metrics = self._score_quality(content, job, preferences)
 
         return {
@@ -127,6 +180,40 @@ class CoverLetterGenerator:
             "preferences": preferences.model_dump(),
         }
 
+    async def stream(
+        self, job: Job, persona: Persona, preferences: CoverLetterPreferences
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Generates a cover letter as a stream of events.
+
+        "start" is sent before any AI call, each "delta" carries a chunk of
+        the letter with the quality metrics so far, and "done" carries the
+        same result as generate().
+        """
+        prompt_version = self._choose_prompt_version()
+        yield {"event": "start", "data": {"prompt_v": prompt_version}}
+        prompt = await self._build_prompt(prompt_version, job, persona, preferences)
+
+        tracker = QualityTracker(job, preferences)
+        chunks: list[str] = []
+        async for chunk in self.client.stream_text(prompt, task="cover_letter"):
+            chunks.append(chunk)
+            tracker.feed(chunk)
+            yield {
+                "event": "delta",
+                "data": {"text": chunk, "quality_metrics": tracker.metrics()},
+            }
+
+        yield {
+            "event": "done",
+            "data": {
+                "content": "".join(chunks),
+                "prompt_v": prompt_version,
+                "quality_metrics": tracker.metrics(),
+                "preferences": preferences.model_dump(),
+            },
+        }
+
     async def regenerate_paragraph(
         self, full_content: str, paragraph_index: int, guidance: str, job: Job
     ) -> str:
@@ -0,0 +1,98 @@
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.middleware.auth import get_current_user
+from src.core.ai.gemini_client import GeminiClient
+from src.core.config import settings
+from src.core.database.connection import AsyncSessionLocal, get_db
+from src.modules.cover_letter.ai.generator import CoverLetterGenerator
+from src.modules.cover_letter.api.schemas import CoverLetterGenerateRequest
+from src.modules.cover_letter.domain.services import CoverLetterService
+from src.modules.cover_letter.infrastructure.repository import (
+    SQLAlchemyCoverLetterRepository,
+)
+from src.modules.job_search.infrastructure.repository import SQLAlchemyJobRepository
+from src.modules.persona.infrastructure.repository import SQLAlchemyPersonaRepository
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def get_cover_letter_generator() -> CoverLetterGenerator:
+    return CoverLetterGenerator(
+        GeminiClient(api_key=settings.ai.GEMINI_API_KEY or "")
+    )
+
+
+def _sse(event: dict[str, Any]) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+@router.post("/generate/stream")
+async def stream_cover_letter(
+    request: CoverLetterGenerateRequest,
+    current_user: dict[str, Any] = Depends(get_current_user),  # noqa: B008
+    db: AsyncSession = Depends(get_db),  # noqa: B008
+    generator: CoverLetterGenerator = Depends(get_cover_letter_generator),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Generates a cover letter as Server-Sent Events.
+
+    Events are "start", then one "delta" per chunk of text with the quality
+    metrics so far, then "done" with the stored letter's id, or "error".
+    The letter and its first version are written once, at the end.
+    """
+    user_id_str = current_user.get("sub")
+    if not user_id_str:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User ID not found in token",
+        )
+    job = await SQLAlchemyJobRepository(db).get_by_id(request.job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+    persona = await SQLAlchemyPersonaRepository(db).get_by_user_id(UUID(user_id_str))
+    if not persona:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Persona not found"
+        )
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event in generator.stream(job, persona, request.preferences):
+                if event["event"] == "done":
+                    # The request's session is not guaranteed to outlive the
+                    # response body, so the letter gets a session of its own
+                    async with AsyncSessionLocal() as session:
+                        service = CoverLetterService(
+                            SQLAlchemyCoverLetterRepository(session)
+                        )
+                        letter = await service.create_from_generation(
+                            job, persona, event["data"]
+                        )
+                        letter_id = letter.id
+                        await session.commit()
+                    event["data"]["id"] = str(letter_id)
+                yield _sse(event)
+        except Exception as e:
+            logger.error(f"Cover letter streaming failed: {e}")
+            yield _sse(
+                {"event": "error", "data": {"detail": "Cover letter generation failed"}}
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Proxies must pass chunks through as they are written
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
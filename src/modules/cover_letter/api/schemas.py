@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.modules.cover_letter.ai.generator import CoverLetterPreferences
+
+
+class CoverLetterGenerateRequest(BaseModel):
+    job_id: UUID
+    preferences: CoverLetterPreferences = Field(default_factory=CoverLetterPreferences)
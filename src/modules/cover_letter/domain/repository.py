@@ -0,0 +1,8 @@
+from typing import Protocol, runtime_checkable
+
+from src.modules.cover_letter.domain.models import CoverLetter
+
+
+@runtime_checkable
+class CoverLetterRepository(Protocol):
+    async def save(self, cover_letter: CoverLetter) -> CoverLetter: ...
@@ -0,0 +1,32 @@
+from typing import Any
+
+from src.modules.cover_letter.domain.models import CoverLetter, CoverLetterVersion
+from src.modules.cover_letter.domain.repository import CoverLetterRepository
+from src.modules.job_search.domain.models import Job
+from src.modules.persona.domain.models import Persona
+
+
+class CoverLetterService:
+    def __init__(self, repository: CoverLetterRepository):
+        self._repository = repository
+
+    async def create_from_generation(
+        self, job: Job, persona: Persona, result: dict[str, Any]
+    ) -> CoverLetter:
+        """Stores a generated letter and its first version in one write."""
+        cover_letter = CoverLetter(
+            user_id=persona.user_id,
+            job_id=job.id,
+            persona_id=persona.id,
+            content=result["content"],
+            preferences=result["preferences"],
+            quality_metrics=result["quality_metrics"],
+            versions=[
+                CoverLetterVersion(
+                    content=result["content"],
+                    prompt_id=result["prompt_v"],
+                    change_summary="Initial generation",
+                )
+            ],
+        )
+        return await self._repository.save(cover_letter)
@@ -0,0 +1,14 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.cover_letter.domain.models import CoverLetter
+from src.modules.cover_letter.domain.repository import CoverLetterRepository
+
+
+class SQLAlchemyCoverLetterRepository(CoverLetterRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def save(self, cover_letter: CoverLetter) -> CoverLetter:
+        self._session.add(cover_letter)
+        await self._session.flush()
+        return cover_letter
@@ -1,26 +1,38 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.middleware.auth import get_current_user
+from src.core.ai.gemini_client import GeminiClient
+from src.core.config import settings
 from src.core.database.connection import get_db
+from src.core.database.pagination import InvalidCursorError
 from src.modules.job_search.api.schemas import (
     JobMatchResponse,
     JobResponse,
 )
-from src.modules.job_search.domain.services import JobSearchService
+from src.modules.job_search.domain.repository import JobSearchOrder
+from src.modules.job_search.domain.services import (
+    JobSearchService,
+    SearchOrderError,
+)
 from src.modules.job_search.infrastructure.repository import SQLAlchemyJobRepository
 
 router = APIRouter()
 
+# Response header carrying the cursor for the next page, absent on the last one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 async def get_job_service(
     db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> JobSearchService:
     repository = SQLAlchemyJobRepository(db)
-    return JobSearchService(repository)
+    return JobSearchService(
+        repository, GeminiClient(api_key=settings.ai.GEMINI_API_KEY or "")
+    )
 
 
 @router.get("/jobs", response_model=list[JobResponse])
@@ -29,8 +41,12 @@ async def search_jobs(
     location: str | None = None,
     remote_only: bool = False,
     salary_min: int | None = None,
+    order: JobSearchOrder | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
+    *,
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user),  # noqa: B008
     service: JobSearchService = Depends(get_job_service),  # noqa: B008
 ) -> list[JobResponse]:
@@ -41,26 +57,54 @@ async def search_jobs(
     - **location**: Target location (city, state, or country)
     - **remote_only**: Filter to remote-only positions
     - **salary_min**: Minimum salary filter
+    - **order**: "recency" (default), "text_rank" for keyword relevance,
+      "vector" for semantic similarity to the query, or "hybrid" to fuse
+      keyword and semantic ranks (vector and hybrid require **query**)
+    - **cursor**: Value of the previous page's X-Next-Cursor header
     """
-    jobs = await service.search_jobs(
-        query=query,
-        location=location,
-        remote_only=remote_only,
-        salary_min=salary_min,
-        limit=limit,
-        offset=offset,
-    )
-    return [JobResponse.model_validate(j) for j in jobs]
+    try:
+        page = await service.search_jobs(
+            query=query,
+            location=location,
+            remote_only=remote_only,
+            salary_min=salary_min,
+            order=order,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    except SearchOrderError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [JobResponse.model_validate(j) for j in page.items]
 
 
 @router.get("/matches", response_model=list[JobMatchResponse])
 async def list_matches(
-    status: str | None = None,
+    match_status: str | None = Query(None, alias="status"),  # noqa: B008
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
+    *,
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user),  # noqa: B008
     service: JobSearchService = Depends(get_job_service),  # noqa: B008
 ) -> list[JobMatchResponse]:
+    """
+    List the user's precomputed matches, best first.
+
+    Matches are maintained in the background as jobs are ingested and the
+    persona changes, so this is a single indexed read. Pass the previous
+    page's X-Next-Cursor header as **cursor** to continue.
+    """
     user_id_str = current_user.get("sub")
     if not user_id_str:
         raise HTTPException(
@@ -68,10 +112,22 @@ async def list_matches(
             detail="User ID not found in token",
         )
 
-    matches = await service.get_user_matches(
-        user_id=UUID(user_id_str), status=status, limit=limit, offset=offset
-    )
-    return [JobMatchResponse.model_validate(m) for m in matches]
+    try:
+        page = await service.get_user_matches(
+            user_id=UUID(user_id_str),
+            status=match_status,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [JobMatchResponse.model_validate(m) for m in page.items]
 
 
 @router.post("/jobs/{job_id}/match", response_model=JobMatchResponse)
@@ -0,0 +1,190 @@
+"""
+Cross-source near-duplicate detection for jobs.
+
+The same role is often posted on several ATS boards and aggregators under
+different external_ids. Each job gets a MinHash signature over shingles
+of its normalized title and description. The signature is split into LSH
+bands and each band is hashed together with the normalized company, so
+only postings of the same company can collide. Colliding jobs whose
+estimated Jaccard similarity clears the threshold are linked to one
+canonical job; search and matching only see canonical rows.
+"""
+
+import hashlib
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+from src.modules.job_search.domain.repository import DedupCandidate, JobRepository
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs at 0.8 similarity collide with ~0.9 probability,
+# pairs at 0.5 with ~0.06
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+# Words per description shingle
+SHINGLE_SIZE = 3
+
+_PRIME = (1 << 31) - 1
+# Fixed seed: signatures are persisted and must be comparable across
+# processes and releases
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)
+
+_WORD = re.compile(r"[a-z0-9]+")
+_COMPANY_SUFFIXES = frozenset(
+    {"inc", "llc", "ltd", "gmbh", "corp", "corporation", "co", "plc", "ag", "sa"}
+    | {"bv", "limited", "company", "group", "se", "srl", "pty"}
+)
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def normalize_company(company: str) -> str:
+    """Company name without case, punctuation or legal suffixes"""
+    words = _words(company)
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def shingles(title: str, description: str) -> set[str]:
+    """Title words plus overlapping word n-grams of the description"""
+    result = {f"t:{word}" for word in _words(title)}
+    words = _words(description)
+    if len(words) < SHINGLE_SIZE:
+        result.update(f"d:{word}" for word in words)
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        result.add("d:" + " ".join(words[i : i + SHINGLE_SIZE]))
+    return result
+
+
+def minhash_signature(title: str, description: str) -> list[int]:
+    """NUM_PERM minimum hashes of the job's shingles; empty without text"""
+    features = shingles(title, description)
+    if not features:
+        return []
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest())
+            for s in features
+        ),
+        dtype=np.uint64,
+        count=len(features),
+    )
+    # Universal hashing (a*x + b) mod p; operands < 2^31 keep uint64 exact
+    permuted = (np.outer(hashes % _PRIME, _A) + _B) % _PRIME
+    return [int(v) for v in permuted.min(axis=0)]
+
+
+def estimated_similarity(a: list[int], b: list[int]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    if not a or len(a) != len(b):
+        return 0.0
+    return float(np.count_nonzero(np.asarray(a) == np.asarray(b))) / len(a)
+
+
+def lsh_buckets(signature: list[int], company: str) -> list[tuple[int, int]]:
+    """(band, bucket) keys of a signature, scoped to the company"""
+    if len(signature) != NUM_PERM:
+        return []
+    company_key = normalize_company(company).encode()
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(
+            company_key + b"\0" + np.asarray(rows, dtype="<u4").tobytes(),
+            digest_size=8,
+        ).digest()
+        # Signed to fit a Postgres BIGINT
+        buckets.append((band, int.from_bytes(digest, signed=True)))
+    return buckets
+
+
+@dataclass
+class DedupItem:
+    """A freshly written job to place in the duplicate index"""
+
+    id: UUID
+    company: str
+    signature: list[int]
+
+
+class JobDeduplicator:
+    """
+    Links newly written jobs to an existing canonical job they duplicate.
+
+    A job duplicates the most similar candidate above the threshold and
+    takes that candidate's canonical job. Jobs in the same batch are
+    indexed as they are processed, so copies within one crawl link too.
+    """
+
+    SIMILARITY_THRESHOLD = 0.8
+
+    def __init__(
+        self, job_repository: JobRepository, threshold: float = SIMILARITY_THRESHOLD
+    ):
+        self.job_repo = job_repository
+        self.threshold = threshold
+
+    async def link(self, items: Iterable[DedupItem]) -> dict[UUID, UUID | None]:
+        """Canonical job id per item (None for canonical ones), persisted"""
+        items = list(items)
+        buckets = {item.id: lsh_buckets(item.signature, item.company) for item in items}
+        signatures = {item.id: item.signature for item in items}
+        buckets = {job_id: keys for job_id, keys in buckets.items() if keys}
+        if not buckets:
+            return {}
+
+        index = await self.job_repo.find_duplicate_candidates(
+            sorted({key for keys in buckets.values() for key in keys})
+        )
+
+        links: dict[UUID, UUID | None] = {}
+        for job_id, keys in buckets.items():
+            canonical = self._canonical_for(job_id, signatures[job_id], keys, index)
+            links[job_id] = canonical
+            entry = DedupCandidate(job_id, canonical, signatures[job_id])
+            for key in keys:
+                index.setdefault(key, []).append(entry)
+
+        await self.job_repo.save_lsh_buckets(buckets)
+        await self.job_repo.link_duplicates(links)
+        duplicates = sum(1 for canonical in links.values() if canonical)
+        if duplicates:
+            logger.info(f"Linked {duplicates} of {len(links)} jobs as duplicates")
+        return links
+
+    def _canonical_for(
+        self,
+        job_id: UUID,
+        signature: list[int],
+        keys: list[tuple[int, int]],
+        index: dict[tuple[int, int], list[DedupCandidate]],
+    ) -> UUID | None:
+        best: tuple[float, DedupCandidate] | None = None
+        seen = {job_id}
+        for key in keys:
+            for candidate in index.get(key, []):
+                if candidate.id in seen:
+                    continue
+                seen.add(candidate.id)
+                similarity = estimated_similarity(signature, candidate.signature)
+                if similarity >= self.threshold and (
+                    best is None or similarity > best[0]
+                ):
+                    best = (similarity, candidate)
+        if best is None:
+            return None
+        canonical = best[1].canonical_job_id or best[1].id
+        # The candidate was a duplicate of this very job
+        return None if canonical == job_id else canonical
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import logging
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.modules.job_search.domain.ingestion import job_external_id
+from src.modules.job_search.domain.models import ScrapeCursor
+from src.modules.job_search.domain.repository import (
+    JobRepository,
+    ScrapeCursorRepository,
+)
+from src.modules.job_search.infrastructure.scrapers.base import (
+    BaseScraper,
+    BoardListing,
+    RawJob,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def posting_fingerprint(posting: dict) -> str:
+    """Content hash of a raw posting, independent of key order"""
+    raw = json.dumps(posting, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+@dataclass
+class BoardChanges:
+    """What changed on one board since its previous sync"""
+
+    source: str
+    board: str
+    new: list[RawJob] = field(default_factory=list)
+    changed: list[RawJob] = field(default_factory=list)
+    # external_ids no longer listed on the board
+    removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.changed or self.removed)
+
+
+class IncrementalSync:
+    """
+    Diffs each board against its persisted ScrapeCursor.
+
+    The cursor keeps a fingerprint per external_id, so a run emits only
+    new, changed and removed postings instead of everything within
+    posted_within_days. Unchanged boards are skipped earlier still, by
+    the conditional fetch in fetch_boards(). Removed
+    postings are marked expired on the jobs table.
+
+    A board's cursor is saved only after the consumer has taken its
+    changes, so a crash mid-run replays that board next time. For the same
+    reason the board's HTTP validators are held back until the caller has
+    committed its cursor and calls save_validators().
+    """
+
+    def __init__(
+        self,
+        scraper: BaseScraper,
+        cursor_repository: ScrapeCursorRepository,
+        job_repository: JobRepository,
+    ):
+        self.scraper = scraper
+        self.cursor_repo = cursor_repository
+        self.job_repo = job_repository
+        # Boards whose cursors are saved but maybe not yet committed
+        self._saved: list[BoardListing] = []
+
+    async def run(
+        self, boards: Iterable[str] | None = None
+    ) -> AsyncIterator[BoardChanges]:
+        source = self.scraper.source_name
+        cursors = await self.cursor_repo.get_for_source(source)
+
+        async for listing in self.scraper.fetch_boards(boards):
+            if listing.postings is None:
+                # Not modified since the last conditional fetch; there is
+                # nothing to persist before refreshing its validators
+                await self.scraper.save_validators(listing)
+                continue
+
+            cursor = cursors.get(listing.board) or ScrapeCursor(
+                source=source, board=listing.board, postings={}
+            )
+            changes, fingerprints = await self._diff(listing, cursor)
+            if changes:
+                yield changes
+
+            expired = await self.job_repo.expire_by_external_ids(
+                [job_external_id(source, eid) for eid in changes.removed]
+            )
+            cursor.postings = fingerprints
+            cursor.last_synced_at = datetime.now(UTC)
+            await self.cursor_repo.save(cursor)
+            self._saved.append(listing)
+            logger.info(
+                f"Synced {source}/{listing.board}: {len(changes.new)} new, "
+                f"{len(changes.changed)} changed, {expired} expired"
+            )
+
+    async def save_validators(self) -> None:
+        """
+        Store the validators of boards whose cursors have been saved.
+
+        Call after each commit of the session the cursors are saved in;
+        boards saved since the last call are then durable.
+        """
+        saved, self._saved = self._saved, []
+        for listing in saved:
+            await self.scraper.save_validators(listing)
+
+    async def _diff(
+        self, listing: BoardListing, cursor: ScrapeCursor
+    ) -> tuple[BoardChanges, dict[str, str]]:
+        previous = cursor.postings or {}
+        changes = BoardChanges(source=self.scraper.source_name, board=listing.board)
+        fingerprints: dict[str, str] = {}
+        modified: list[tuple[str, str, dict]] = []
+
+        for posting in listing.postings or []:
+            try:
+                external_id = self.scraper.external_id_for(posting, listing.board)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Skipping posting without id on {listing.board}: {e}")
+                continue
+
+            fingerprint = posting_fingerprint(posting)
+            if previous.get(external_id) == fingerprint:
+                fingerprints[external_id] = fingerprint
+            else:
+                modified.append((external_id, fingerprint, posting))
+
+        # Only new and changed postings need their HTML converted
+        await self.scraper.prepare_descriptions([posting for *_, posting in modified])
+
+        for external_id, fingerprint, posting in modified:
+            try:
+                raw_job = self.scraper.parse_posting(posting, listing.board)
+            except Exception as e:
+                logger.warning(f"Skipping malformed posting {external_id}: {e}")
+                # Keep the last good version so the job is not expired
+                if external_id in previous:
+                    fingerprints[external_id] = previous[external_id]
+                continue
+
+            fingerprints[external_id] = fingerprint
+            if external_id in previous:
+                changes.changed.append(raw_job)
+            else:
+                changes.new.append(raw_job)
+
+        changes.removed = [eid for eid in previous if eid not in fingerprints]
+        return changes, fingerprints
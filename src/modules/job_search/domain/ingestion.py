@@ -0,0 +1,157 @@
+import logging
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC
+from typing import Any
+from uuid import UUID
+
+from src.modules.job_search.domain.dedup import (
+    DedupItem,
+    JobDeduplicator,
+    minhash_signature,
+)
+from src.modules.job_search.domain.normalization import structured_job_fields
+from src.modules.job_search.domain.repository import JobRepository
+from src.modules.job_search.infrastructure.scrapers.base import RawJob
+
+logger = logging.getLogger(__name__)
+
+
+def job_external_id(source: str, external_id: str) -> str:
+    """jobs.external_id for a scraper posting id, unique across sources"""
+    return f"{source}:{external_id}"
+
+
+async def _aiter(
+    items: AsyncIterable[RawJob] | Iterable[RawJob],
+) -> AsyncIterator[RawJob]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+@dataclass
+class IngestedBatch:
+    """Outcome of writing one chunk of postings"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # Written jobs linked to an existing canonical job
+    duplicates: int = 0
+    # New jobs, and jobs whose title or description changed
+    needs_embedding: list[UUID] = field(default_factory=list)
+
+
+class JobIngestion:
+    """
+    Streams RawJobs into the jobs table in chunks.
+
+    Each chunk is normalized into rows and written with a single
+    INSERT ... ON CONFLICT (external_id) DO UPDATE, so a crawl costs one
+    round trip per BATCH_SIZE postings instead of one flush per job.
+    Written jobs then pass through the near-duplicate stage, which links
+    copies of a role seen on other sources to one canonical job.
+    """
+
+    # ~21 bind parameters per row; stays under asyncpg's 32767 limit
+    BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        batch_size: int = BATCH_SIZE,
+        deduplicate: bool = True,
+    ):
+        self.job_repo = job_repository
+        self.batch_size = batch_size
+        self.deduplicator = JobDeduplicator(job_repository) if deduplicate else None
+
+    async def ingest(
+        self, raw_jobs: AsyncIterable[RawJob] | Iterable[RawJob]
+    ) -> AsyncIterator[IngestedBatch]:
+        """Write postings chunk by chunk, yielding counts per chunk"""
+        chunk: list[RawJob] = []
+        async for raw_job in _aiter(raw_jobs):
+            chunk.append(raw_job)
+            if len(chunk) >= self.batch_size:
+                yield await self.ingest_batch(chunk)
+                chunk = []
+        if chunk:
+            yield await self.ingest_batch(chunk)
+
+    async def ingest_batch(self, raw_jobs: list[RawJob]) -> IngestedBatch:
+        # ON CONFLICT cannot touch the same row twice in one statement;
+        # the last occurrence of a posting wins
+        rows = {
+            row["external_id"]: row
+            for row in (self.to_row(raw_job) for raw_job in raw_jobs)
+        }
+        written = await self.job_repo.upsert_jobs(list(rows.values()))
+
+        batch = IngestedBatch()
+        for job in written:
+            if job.inserted:
+                batch.inserted += 1
+            else:
+                batch.updated += 1
+            if job.needs_embedding:
+                batch.needs_embedding.append(job.id)
+        batch.unchanged = len(rows) - len(written)
+
+        if self.deduplicator is not None:
+            links = await self.deduplicator.link(
+                DedupItem(
+                    id=job.id,
+                    company=rows[job.external_id]["company"],
+                    signature=rows[job.external_id]["minhash_signature"],
+                )
+                for job in written
+                if job.external_id in rows
+            )
+            batch.duplicates = sum(1 for canonical in links.values() if canonical)
+
+        logger.info(
+            f"Ingested {len(rows)} postings: {batch.inserted} inserted, "
+            f"{batch.updated} updated, {batch.unchanged} unchanged, "
+            f"{batch.duplicates} duplicates"
+        )
+        return batch
+
+    def to_row(self, raw_job: RawJob) -> dict[str, Any]:
+        """Normalize a RawJob into a jobs row"""
+        posted_at = raw_job.posted_date
+        if posted_at is not None and posted_at.tzinfo is not None:
+            # jobs.posted_at is a naive UTC timestamp
+            posted_at = posted_at.astimezone(UTC).replace(tzinfo=None)
+
+        title = raw_job.title[:255]
+        description = raw_job.description or ""
+        return {
+            "id": uuid.uuid4(),
+            "external_id": job_external_id(raw_job.source, raw_job.external_id),
+            "source": raw_job.source,
+            "url": raw_job.apply_url[:1024],
+            "title": title,
+            "company": raw_job.company_name[:255],
+            "location": raw_job.location[:255] or None,
+            "description": description,
+            "job_type": (raw_job.employment_type or "")[:50] or None,
+            **structured_job_fields(
+                raw_job.location,
+                description,
+                raw_job.remote_type,
+                salary_text=raw_job.salary_range,
+            ),
+            "raw_data": raw_job.raw_data,
+            # A posting seen again is live, even if it was expired before
+            "status": "active",
+            "posted_at": posted_at,
+            "expired_at": None,
+            "version": 1,
+            "minhash_signature": minhash_signature(title, description),
+        }
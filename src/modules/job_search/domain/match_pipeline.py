@@ -0,0 +1,120 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from src.modules.job_search.api.schemas import JobMatchAnalysis
+from src.modules.job_search.domain.matching import JobMatcher, MatchScore
+from src.modules.job_search.domain.models import Job
+from src.modules.job_search.domain.repository import JobRepository
+from src.modules.persona.domain.models import Persona
+from src.modules.persona.domain.repository import PersonaRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MatchPipeline:
+    """
+    Keeps the job_matches table precomputed so the match feed is a read.
+
+    New jobs are scored against the personas nearest to them (ANN pruning
+    on the persona summary embedding, or the mean experience embedding of
+    personas without one); a changed persona is rescored against its
+    nearest active jobs. Results are bulk upserted.
+    """
+
+    # Personas considered for each newly ingested job
+    PERSONAS_PER_JOB = 500
+    # Matches kept in a persona's feed after a rescore
+    MATCHES_PER_PERSONA = 100
+    # Scores below this are not stored
+    MIN_STORED_SCORE = 50.0
+
+    def __init__(
+        self,
+        matcher: JobMatcher,
+        job_repository: JobRepository,
+        persona_repository: PersonaRepository,
+    ):
+        self.matcher = matcher
+        self.job_repo = job_repository
+        self.persona_repo = persona_repository
+
+    async def score_new_jobs(self, job_ids: list[UUID]) -> int:
+        """Score freshly ingested jobs against their nearest personas"""
+        jobs = await self.job_repo.get_by_ids(job_ids)
+
+        # Group candidate jobs per persona so each persona is scored in one batch
+        personas: dict[UUID, Persona] = {}
+        jobs_by_persona: dict[UUID, list[Job]] = {}
+        for job in jobs:
+            if (
+                job.status != "active"
+                or job.canonical_job_id is not None
+                or job.description_embedding is None
+            ):
+                continue
+            nearest = await self.persona_repo.get_nearest_by_embedding(
+                [float(x) for x in job.description_embedding],
+                limit=self.PERSONAS_PER_JOB,
+            )
+            for persona in nearest:
+                personas[persona.id] = persona
+                jobs_by_persona.setdefault(persona.id, []).append(job)
+
+        rows: list[dict[str, Any]] = []
+        for persona_id, persona_jobs in jobs_by_persona.items():
+            persona = personas[persona_id]
+            scores = await self.matcher.score_jobs(persona, persona_jobs)
+            rows.extend(
+                self._to_row(persona.user_id, job, score)
+                for job, score in zip(persona_jobs, scores, strict=True)
+                if score.overall_score >= self.MIN_STORED_SCORE
+            )
+
+        await self.job_repo.upsert_matches(rows)
+        logger.info(
+            f"Scored {len(jobs)} new jobs against {len(personas)} personas, "
+            f"stored {len(rows)} matches"
+        )
+        return len(rows)
+
+    async def rescore_persona(self, user_id: UUID) -> int:
+        """Recompute a user's feed after their persona changed"""
+        persona = await self.persona_repo.get_by_user_id(user_id)
+        if not persona:
+            return 0
+
+        matches = await self.matcher.rank_jobs_for_persona(
+            persona,
+            limit=self.MATCHES_PER_PERSONA,
+            min_score=self.MIN_STORED_SCORE,
+        )
+        rows = [self._to_row(user_id, job, score) for job, score in matches]
+
+        await self.job_repo.upsert_matches(rows)
+        pruned = await self.job_repo.prune_user_matches(
+            user_id, [job.id for job, _ in matches]
+        )
+        logger.info(
+            f"Rescored persona for user {user_id}: "
+            f"{len(rows)} matches stored, {pruned} pruned"
+        )
+        return len(rows)
+
+    def _to_row(self, user_id: UUID, job: Job, score: MatchScore) -> dict[str, Any]:
+        analysis = JobMatchAnalysis(
+            fit_explanation=" ".join(score.explanation),
+            matching_skills=score.matching_skills,
+            missing_skills=score.missing_skills,
+            skills_match_count=len(score.matching_skills),
+            total_required_skills=len(score.matching_skills)
+            + len(score.missing_skills),
+        )
+        return {
+            "user_id": user_id,
+            "job_id": job.id,
+            "overall_score": round(score.overall_score),
+            "vector_score": score.experience_score / 100,
+            "analysis": analysis.model_dump(),
+            "status": "pending",
+        }
@@ -1,6 +1,8 @@
+import logging
 from dataclasses import dataclass
 from uuid import UUID
 
+import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
 from src.core.ai.gemini_client import (
@@ -9,14 +11,26 @@ from src.core.ai.gemini_client import (
 
 # Job model from job_search/domain/models presumably
 from src.modules.job_search.domain.models import Job
-from src.modules.job_search.domain.repository import JobRepository
+from src.modules.job_search.domain.repository import (
+    JobRepository,
+    SkillEmbeddingRepository,
+)
+from src.modules.job_search.domain.skill_vocabulary import SkillVocabulary
 
 # In a real scenario, we'd import actual models.
 # Using placeholders or assuming structure based on previous context.
 # We need basic interfaces for Persona and Job to make this work.
-from src.modules.persona.domain.models import Persona
+from src.modules.persona.domain.models import Persona, RemotePreference
 from src.modules.persona.domain.repository import PersonaRepository
 
+logger = logging.getLogger(__name__)
+
+# Relative weight of a job skill by importance
+SKILL_IMPORTANCE = {"required": 1.0, "preferred": 0.5, "nice_to_have": 0.2}
+
+# Proficiency assumed for a matched skill (1-5 scale)
+DEFAULT_PROFICIENCY = 3.0
+
 
 @dataclass
 class MatchScore:
@@ -44,15 +58,23 @@ class JobMatcher:
         "salary_mismatch": -20,
     }
 
+    # Minimum cosine similarity for a semantic skill match ("k8s"/"Kubernetes")
+    SEMANTIC_SKILL_THRESHOLD = 0.8
+
     def __init__(
         self,
         embedding_service: GeminiClient,
         persona_repository: PersonaRepository,
         job_repository: JobRepository,
+        skill_vocabulary: SkillVocabulary | None = None,
+        skill_repository: SkillEmbeddingRepository | None = None,
     ):
         self.embedding_service = embedding_service
         self.persona_repo = persona_repository
         self.job_repo = job_repository
+        # Semantic skill matching is enabled by passing a vocabulary
+        self.skill_vocabulary = skill_vocabulary
+        self.skill_repo = skill_repository
 
     async def calculate_match(self, user_id: UUID, job_id: UUID) -> MatchScore:
         """Calculate match score between user and job"""
@@ -126,23 +148,17 @@ class JobMatcher:
     ) -> tuple[float, list[str], list[str]]:
         """Score skill match using embeddings and keyword matching"""
 
-        # Extract required skills from job - Placeholder assuming job has skills list
-        # If job.skills is raw text, we'd need extraction. Assuming list for now.
-        # Extract required skills from job - Placeholder
-        # Job model doesn't have skills relation yet, checking raw_data or description
-        job_skills = job.raw_data.get("skills", []) if job.raw_data else []
-        # Convert to dict with importance if available, else assume required
-        job_skills_dict = (
-            dict.fromkeys(job_skills, "required")
-            if isinstance(job_skills, list)
-            else {}
-        )
+        job_skills_dict = self._job_skills(job)
 
         user_skills = (
             {s.name.lower(): s.proficiency_level for s in persona.skills}
             if persona.skills
             else {}
         )
+        semantic = await self._semantic_skill_matches(
+            list(user_skills),
+            [s.lower() for s in job_skills_dict if s.lower() not in user_skills],
+        )
 
         matching = []
         missing = []
@@ -151,58 +167,77 @@ class JobMatcher:
 
         for skill, importance in job_skills_dict.items():
             skill_lower = skill.lower()
-            weight = {"required": 1.0, "preferred": 0.5, "nice_to_have": 0.2}.get(
-                importance, 1.0
-            )
+            weight = SKILL_IMPORTANCE.get(importance, 1.0)
             total_weight += weight
 
+            # proficiency is often enum or 1-5, assuming 1-5 or normalizing
+            # If enum, we need mapping. Assuming int 1-5 for now or 3 default
+            proficiency = DEFAULT_PROFICIENCY  # Placeholder if not int
+            proficiency_factor = proficiency / 5.0
+
             # Check direct match
             if skill_lower in user_skills:
-                # proficiency is often enum or 1-5, assuming 1-5 or normalizing
-                # If enum, we need mapping. Assuming int 1-5 for now or 3 default
-                proficiency = 3.0  # Default/Placeholder if not int
-                proficiency_factor = proficiency / 5.0
                 weighted_match += weight * proficiency_factor
                 matching.append(skill)
+            elif skill_lower in semantic:
+                # Semantic match, discounted by similarity
+                weighted_match += weight * proficiency_factor * semantic[skill_lower]
+                matching.append(skill)
             else:
-                # Check semantic similarity logic here
-                # For MVP optimization, we skip per-skill embedding call
-                # to avoid N*M calls
-                # And assume keyword match is primary.
-                # Ideally: cached embeddings for standard skills.
                 missing.append(skill)
 
         score = (weighted_match / total_weight * 100) if total_weight > 0 else 50
 
         return score, matching, missing
 
+    async def _semantic_skill_matches(
+        self, user_skills: list[str], job_skills: list[str]
+    ) -> dict[str, float]:
+        """Best similarity per job skill, for those above the threshold"""
+        if self.skill_vocabulary is None or not user_skills or not job_skills:
+            return {}
+
+        try:
+            await self.skill_vocabulary.ensure(
+                [*user_skills, *job_skills], self.embedding_service, self.skill_repo
+            )
+        except Exception as e:
+            logger.warning(f"Skill vocabulary unavailable: {e}")
+            return {}
+
+        # One (job skills x user skills) product instead of N*M API calls
+        best = self.skill_vocabulary.similarity(job_skills, user_skills).max(axis=1)
+        return {
+            skill: float(score)
+            for skill, score in zip(job_skills, best, strict=True)
+            if score >= self.SEMANTIC_SKILL_THRESHOLD
+        }
+
     async def _score_experience(self, persona: Persona, job: Job) -> float:
         """Score experience relevance using vector similarity"""
 
         if not job.description:
             return 50.0
 
-        # Get job embedding
-        try:
-            job_embedding = await self.embedding_service.embed_text(
-                f"{job.title} {job.description}"
-            )
-        except Exception:
-            return 50.0  # Fallback
+        # Prefer the embedding stored at ingest over a fresh API call
+        job_embedding = job.description_embedding
+        if job_embedding is None:
+            try:
+                job_embedding = await self.embedding_service.embed_text(
+                    f"{job.title} {job.description}"
+                )
+            except Exception:
+                return 50.0  # Fallback
 
         # Get experience embeddings
         experience_scores: list[float] = []
 
         experiences = persona.experiences or []
-        for _exp in experiences:
-            # We assume exp has embedding field pre-calculated
-            # If not, we might need to calculate on fly (costly) or skip
-            # Assuming 'description_embedding' exists on Experience model
-            # Re-using prompt logic structure
-            exp_embedding = None
-            # Placeholder for accessing embedding from experience object
-
-            if exp_embedding:
+        for exp in experiences:
+            # Embeddings are pre-calculated when the experience is saved
+            exp_embedding = exp.experience_embedding
+
+            if exp_embedding is not None:
                 similarity = cosine_similarity([job_embedding], [exp_embedding])[0][0]
                 experience_scores.append(similarity)
 
@@ -226,8 +261,7 @@ class JobMatcher:
         score = 100
 
         # Location match
-        # Assuming job.is_remote exists
-        if hasattr(job, "is_remote") and job.is_remote:
+        if self._is_remote(job):
             # Logic for remote preference
             pass
         else:
@@ -238,6 +272,20 @@ class JobMatcher:
 
         return max(0, min(100, score))
 
+    def _job_skills(self, job: Job) -> dict[str, str]:
+        """Map each skill listed on the job to its importance"""
+        # Job model doesn't have skills relation yet, checking raw_data
+        job_skills = job.raw_data.get("skills", []) if job.raw_data else []
+        # Convert to dict with importance if available, else assume required
+        return (
+            dict.fromkeys(job_skills, "required")
+            if isinstance(job_skills, list)
+            else {}
+        )
+
+    def _is_remote(self, job: Job) -> bool:
+        return bool(getattr(job, "is_remote", False)) or job.work_setting == "remote"
+
     async def _score_culture(self, persona: Persona, job: Job) -> float:
         """Score culture fit using semantic similarity"""
         _ = persona
@@ -265,6 +313,169 @@ class JobMatcher:
         _ = candidates
         return 0.0
 
+    async def score_jobs(self, persona: Persona, jobs: list[Job]) -> list[MatchScore]:
+        """Score many jobs against one persona in a single vectorized pass.
+
+        Relies on the embeddings stored on jobs and experiences, so no
+        repository or embedding calls are made beyond filling the skill
+        vocabulary. Jobs without a stored embedding get the neutral
+        experience score.
+        """
+        if not jobs:
+            return []
+
+        user_skills = {s.name.lower() for s in persona.skills or []}
+        job_skills = {
+            s.lower() for job in jobs for s in self._job_skills(job)
+        } - user_skills
+        semantic = await self._semantic_skill_matches(
+            list(user_skills), sorted(job_skills)
+        )
+
+        skills_scores, matching, missing = self._batch_score_skills(
+            persona, jobs, semantic
+        )
+        experience_scores = self._batch_score_experience(persona, jobs)
+        preferences_scores = self._batch_score_preferences(persona, jobs)
+        culture_scores = np.full(len(jobs), 50.0)  # Mirrors _score_culture
+        penalties = np.array(
+            [self._check_hard_requirements(persona, job) for job in jobs],
+            dtype=float,
+        )
+
+        raw_scores = (
+            self.WEIGHTS["skills"] * skills_scores
+            + self.WEIGHTS["experience"] * experience_scores
+            + self.WEIGHTS["preferences"] * preferences_scores
+            + self.WEIGHTS["culture"] * culture_scores
+        )
+        final_scores = np.clip(raw_scores + penalties, 0, 100)
+
+        results = []
+        for i in range(len(jobs)):
+            if penalties[i] <= -100:
+                results.append(
+                    MatchScore(
+                        overall_score=0,
+                        skills_score=0,
+                        experience_score=0,
+                        preferences_score=0,
+                        culture_score=0,
+                        explanation=["Does not meet visa/authorization requirements"],
+                        matching_skills=[],
+                        missing_skills=[],
+                    )
+                )
+                continue
+
+            results.append(
+                MatchScore(
+                    overall_score=round(float(final_scores[i]), 1),
+                    skills_score=round(float(skills_scores[i]), 1),
+                    experience_score=round(float(experience_scores[i]), 1),
+                    preferences_score=round(float(preferences_scores[i]), 1),
+                    culture_score=round(float(culture_scores[i]), 1),
+                    explanation=self._generate_explanations(
+                        skills_scores[i],
+                        experience_scores[i],
+                        preferences_scores[i],
+                        culture_scores[i],
+                        matching[i],
+                        missing[i],
+                    ),
+                    matching_skills=matching[i],
+                    missing_skills=missing[i],
+                )
+            )
+
+        return results
+
+    def _batch_score_skills(
+        self, persona: Persona, jobs: list[Job], semantic: dict[str, float]
+    ) -> tuple[np.ndarray, list[list[str]], list[list[str]]]:
+        """Skill scores for all jobs as one (jobs x vocabulary) product"""
+        user_skills = {s.name.lower() for s in persona.skills or []}
+        job_skills = [self._job_skills(job) for job in jobs]
+
+        vocabulary: dict[str, int] = {}
+        for skills in job_skills:
+            for skill in skills:
+                vocabulary.setdefault(skill.lower(), len(vocabulary))
+
+        weights = np.zeros((len(jobs), len(vocabulary)))
+        for row, skills in enumerate(job_skills):
+            for skill, importance in skills.items():
+                weights[row, vocabulary[skill.lower()]] += SKILL_IMPORTANCE.get(
+                    importance, 1.0
+                )
+
+        proficiency = np.zeros(len(vocabulary))
+        for skill, col in vocabulary.items():
+            if skill in user_skills:
+                proficiency[col] = DEFAULT_PROFICIENCY / 5.0
+            elif skill in semantic:
+                proficiency[col] = DEFAULT_PROFICIENCY / 5.0 * semantic[skill]
+
+        weighted_match = weights @ proficiency
+        total_weight = weights.sum(axis=1)
+        scores = np.full(len(jobs), 50.0)
+        has_skills = total_weight > 0
+        scores[has_skills] = weighted_match[has_skills] / total_weight[has_skills] * 100
+
+        matched = user_skills | semantic.keys()
+        matching = [
+            [s for s in skills if s.lower() in matched] for skills in job_skills
+        ]
+        missing = [
+            [s for s in skills if s.lower() not in matched] for skills in job_skills
+        ]
+        return scores, matching, missing
+
+    def _batch_score_experience(self, persona: Persona, jobs: list[Job]) -> np.ndarray:
+        """Experience scores from stored job and experience embeddings"""
+        scores = np.full(len(jobs), 50.0)
+
+        rows = [
+            i
+            for i, job in enumerate(jobs)
+            if job.description and job.description_embedding is not None
+        ]
+        if not rows:
+            return scores
+
+        experience_vectors = [
+            exp.experience_embedding
+            for exp in persona.experiences or []
+            if exp.experience_embedding is not None
+        ]
+        if not experience_vectors:
+            scores[rows] = 30.0  # Minimum score if no experience
+            return scores
+
+        job_matrix = _normalize_rows(
+            np.asarray([jobs[i].description_embedding for i in rows], dtype=float)
+        )
+        experience_matrix = _normalize_rows(np.asarray(experience_vectors, dtype=float))
+        similarity = job_matrix @ experience_matrix.T
+
+        # Use top 3 most relevant experiences
+        top_k = min(3, similarity.shape[1])
+        top_scores = -np.partition(-similarity, top_k - 1, axis=1)[:, :top_k]
+        scores[rows] = top_scores.mean(axis=1) * 100
+        return scores
+
+    def _batch_score_preferences(self, persona: Persona, jobs: list[Job]) -> np.ndarray:
+        """Preference scores for all jobs, see _score_preferences"""
+        scores = np.full(len(jobs), 100.0)
+        if not persona.career_preference:
+            return scores
+
+        if persona.remote_preference == RemotePreference.REMOTE:
+            remote = np.array([self._is_remote(job) for job in jobs])
+            scores[~remote] -= 30
+
+        return np.clip(scores, 0, 100)
+
     async def get_top_matches(
         self, user_id: UUID, limit: int = 50, min_score: float = 60.0
     ) -> list[tuple[Job, MatchScore]]:
@@ -274,15 +485,22 @@ class JobMatcher:
         if not persona:
             return []
 
-        # Get candidate jobs using vector search
+        return await self.rank_jobs_for_persona(persona, limit, min_score)
+
+    async def rank_jobs_for_persona(
+        self, persona: Persona, limit: int = 50, min_score: float = 60.0
+    ) -> list[tuple[Job, MatchScore]]:
+        """Rank candidate jobs for an already loaded persona"""
+
+        # One query for candidates, then score them all in memory
         candidate_jobs = await self._get_candidate_jobs(persona, limit * 3)
+        scores = await self.score_jobs(persona, candidate_jobs)
 
-        # Score each candidate
-        matches = []
-        for job in candidate_jobs:
-            score = await self.calculate_match(user_id, job.id)
-            if score.overall_score >= min_score:
-                matches.append((job, score))
+        matches = [
+            (job, score)
+            for job, score in zip(candidate_jobs, scores, strict=True)
+            if score.overall_score >= min_score
+        ]
 
         # Sort by score descending
         matches.sort(key=lambda x: x[1].overall_score, reverse=True)
@@ -292,22 +510,30 @@ class JobMatcher:
     async def _get_candidate_jobs(self, persona: Persona, limit: int) -> list[Job]:
         """Use vector search to find candidate jobs"""
 
-        # Search query from title preferences
-        # Persona model doesn't have summary text, only embedding
-        search_query = (
-            persona.career_preference.target_titles[0]
-            if persona.career_preference and persona.career_preference.target_titles
-            else "Job Search"
-        )
-
-        try:
-            query_embedding = await self.embedding_service.embed_text(search_query)
-        except Exception:
-            return []
-
-        # Vector search in pgvector
-        # Assuming repository has search_jobs with embedding support
-        return await self.job_repo.search_jobs(
-            embedding=query_embedding,
+        # Query with the persona's stored vectors, never a fresh embedding
+        return await self.job_repo.get_match_candidates(
+            embedding=self._persona_query_vector(persona),
             limit=limit,
         )
+
+    def _persona_query_vector(self, persona: Persona) -> list[float] | None:
+        """Summary embedding, else the mean of the experience embeddings"""
+        if persona.summary_embedding is not None:
+            return [float(x) for x in persona.summary_embedding]
+
+        experience_vectors = [
+            exp.experience_embedding
+            for exp in persona.experiences or []
+            if exp.experience_embedding is not None
+        ]
+        if not experience_vectors:
+            return None
+        mean_vector = np.asarray(experience_vectors, dtype=float).mean(axis=0)
+        return [float(x) for x in mean_vector]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving zero rows untouched"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
@@ -3,15 +3,58 @@ from datetime import datetime
 from typing import Any
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database.base_model import BaseModel
+from src.core.database.base_model import Base, BaseModel
+
+# Text search configuration used by the jobs.search_vector column
+TEXT_SEARCH_CONFIG = "english"
+
+# Length of the skill_embeddings.name column
+SKILL_NAME_MAX_LENGTH = 100
 
 
 class Job(BaseModel):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_description_embedding_hnsw",
+            "description_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"description_embedding": "vector_cosine_ops"},
+        ),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination for recency order: (posted_at, id)
+        Index(
+            "ix_jobs_posted_at_id",
+            text("posted_at DESC NULLS LAST"),
+            text("id DESC"),
+        ),
+        # Location filters at country, region or city granularity
+        Index(
+            "ix_jobs_location_country_region_city",
+            "location_country",
+            "location_region",
+            "location_city",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -25,14 +68,31 @@ class Job(BaseModel):
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     company: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     location: Mapped[str | None] = mapped_column(String(255), index=True)
+    # First place named by location: ISO 3166-1 country, region code, city
+    location_country: Mapped[str | None] = mapped_column(String(2))
+    location_region: Mapped[str | None] = mapped_column(String(10))
+    location_city: Mapped[str | None] = mapped_column(String(100))
 
     description: Mapped[str] = mapped_column(Text, nullable=False)
     description_embedding: Mapped[Any | None] = mapped_column(
         Vector(768)
     )  # Gemini 768-dim
 
+    # Weighted full-text document: title (A), company (B), description (C)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    # Annual pay range; salary_max is set whenever salary_min is
     salary_min: Mapped[float | None] = mapped_column(Float)
-    salary_max: Mapped[float | None] = mapped_column(Float)
+    salary_max: Mapped[float | None] = mapped_column(Float, index=True)
     salary_currency: Mapped[str | None] = mapped_column(String(10))
 
     job_type: Mapped[str | None] = mapped_column(
@@ -49,9 +109,44 @@ class Job(BaseModel):
     posted_at: Mapped[datetime | None] = mapped_column(DateTime, index=True)
     expired_at: Mapped[datetime | None] = mapped_column(DateTime)
 
+    # Near-duplicate detection: MinHash of title/company/description, and
+    # the job this one duplicates (null when the job is canonical)
+    minhash_signature: Mapped[list[int] | None] = mapped_column(
+        ARRAY(Integer), deferred=True
+    )
+    canonical_job_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), index=True
+    )
+
+
+class JobLshBucket(Base):
+    """LSH band bucket of a job's MinHash signature, for duplicate lookup."""
+
+    __tablename__ = "job_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
 
 class JobMatch(BaseModel):
     __tablename__ = "job_matches"
+    __table_args__ = (
+        # One row per user/job so the match pipeline can bulk upsert
+        UniqueConstraint("user_id", "job_id", name="uq_job_matches_user_id_job_id"),
+        # Serves the per-user feed ordered and keyset-paged by (score, id)
+        Index(
+            "ix_job_matches_user_id_overall_score_id",
+            "user_id",
+            text("overall_score DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -75,3 +170,30 @@ class JobMatch(BaseModel):
 
     # Relationships
     job = relationship("Job", backref="matches")
+
+
+class SkillEmbedding(BaseModel):
+    """Vocabulary of normalized skill names and their embeddings."""
+
+    __tablename__ = "skill_embeddings"
+
+    name: Mapped[str] = mapped_column(
+        String(SKILL_NAME_MAX_LENGTH), unique=True, nullable=False
+    )
+    embedding: Mapped[Any] = mapped_column(Vector(768), nullable=False)
+
+
+class ScrapeCursor(BaseModel):
+    """Incremental sync state for one ATS board."""
+
+    __tablename__ = "scrape_cursors"
+    __table_args__ = (
+        UniqueConstraint("source", "board", name="uq_scrape_cursors_source_board"),
+    )
+
+    source: Mapped[str] = mapped_column(String(100), nullable=False)
+    board: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # external_id -> content fingerprint of every posting on the last sync
+    postings: Mapped[dict[str, str]] = mapped_column(JSONB, default={})
+    last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
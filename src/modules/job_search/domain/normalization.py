@@ -0,0 +1,569 @@
+"""
+Location and salary normalization for job postings.
+
+Postings describe places and pay as free text ("SF, CA or Remote (US)",
+"$120k – $150k per year"). Ingestion resolves them once against a small
+in-memory gazetteer and a set of precompiled salary patterns, and stores
+the result in structured columns (country/region/city, annual salary
+range), so search filters on those columns instead of matching text.
+
+Search queries go through the same resolver, so "New York" finds jobs
+stored as "New York, NY" and "NYC, New York, United States" alike.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any
+
+# --- Gazetteer -------------------------------------------------------------
+
+# ISO 3166-1 alpha-2 code -> names and aliases
+_COUNTRIES: dict[str, tuple[str, ...]] = {
+    "US": ("united states", "united states of america", "usa", "us", "u s", "u s a"),
+    "CA": ("canada",),
+    "MX": ("mexico",),
+    "BR": ("brazil", "brasil"),
+    "AR": ("argentina",),
+    "CO": ("colombia",),
+    "CL": ("chile",),
+    "GB": ("united kingdom", "uk", "u k", "great britain", "england", "scotland"),
+    "IE": ("ireland",),
+    "DE": ("germany", "deutschland"),
+    "FR": ("france",),
+    "NL": ("netherlands", "the netherlands", "holland"),
+    "BE": ("belgium",),
+    "LU": ("luxembourg",),
+    "CH": ("switzerland",),
+    "AT": ("austria", "osterreich"),
+    "ES": ("spain", "espana"),
+    "PT": ("portugal",),
+    "IT": ("italy", "italia"),
+    "SE": ("sweden",),
+    "NO": ("norway",),
+    "DK": ("denmark",),
+    "FI": ("finland",),
+    "PL": ("poland", "polska"),
+    "CZ": ("czech republic", "czechia"),
+    "RO": ("romania",),
+    "GR": ("greece",),
+    "UA": ("ukraine",),
+    "TR": ("turkey", "turkiye"),
+    "IL": ("israel",),
+    "AE": ("united arab emirates", "uae"),
+    "IN": ("india",),
+    "SG": ("singapore",),
+    "JP": ("japan",),
+    "KR": ("south korea", "korea"),
+    "CN": ("china",),
+    "HK": ("hong kong",),
+    "TW": ("taiwan",),
+    "PH": ("philippines",),
+    "AU": ("australia",),
+    "NZ": ("new zealand",),
+    "ZA": ("south africa",),
+    "NG": ("nigeria",),
+    "KE": ("kenya",),
+    "EG": ("egypt",),
+}
+
+# (country, region code) -> names; two-letter codes are matched as aliases
+_REGIONS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("US", "AL"): ("alabama",),
+    ("US", "AK"): ("alaska",),
+    ("US", "AZ"): ("arizona",),
+    ("US", "AR"): ("arkansas",),
+    ("US", "CA"): ("california",),
+    ("US", "CO"): ("colorado",),
+    ("US", "CT"): ("connecticut",),
+    ("US", "DE"): ("delaware",),
+    ("US", "DC"): ("district of columbia",),
+    ("US", "FL"): ("florida",),
+    ("US", "GA"): ("georgia",),
+    ("US", "HI"): ("hawaii",),
+    ("US", "ID"): ("idaho",),
+    ("US", "IL"): ("illinois",),
+    ("US", "IN"): ("indiana",),
+    ("US", "IA"): ("iowa",),
+    ("US", "KS"): ("kansas",),
+    ("US", "KY"): ("kentucky",),
+    ("US", "LA"): ("louisiana",),
+    ("US", "ME"): ("maine",),
+    ("US", "MD"): ("maryland",),
+    ("US", "MA"): ("massachusetts",),
+    ("US", "MI"): ("michigan",),
+    ("US", "MN"): ("minnesota",),
+    ("US", "MS"): ("mississippi",),
+    ("US", "MO"): ("missouri",),
+    ("US", "MT"): ("montana",),
+    ("US", "NE"): ("nebraska",),
+    ("US", "NV"): ("nevada",),
+    ("US", "NH"): ("new hampshire",),
+    ("US", "NJ"): ("new jersey",),
+    ("US", "NM"): ("new mexico",),
+    ("US", "NY"): ("new york", "new york state"),
+    ("US", "NC"): ("north carolina",),
+    ("US", "ND"): ("north dakota",),
+    ("US", "OH"): ("ohio",),
+    ("US", "OK"): ("oklahoma",),
+    ("US", "OR"): ("oregon",),
+    ("US", "PA"): ("pennsylvania",),
+    ("US", "RI"): ("rhode island",),
+    ("US", "SC"): ("south carolina",),
+    ("US", "SD"): ("south dakota",),
+    ("US", "TN"): ("tennessee",),
+    ("US", "TX"): ("texas",),
+    ("US", "UT"): ("utah",),
+    ("US", "VT"): ("vermont",),
+    ("US", "VA"): ("virginia",),
+    ("US", "WA"): ("washington", "washington state"),
+    ("US", "WV"): ("west virginia",),
+    ("US", "WI"): ("wisconsin",),
+    ("US", "WY"): ("wyoming",),
+    ("CA", "AB"): ("alberta",),
+    ("CA", "BC"): ("british columbia",),
+    ("CA", "MB"): ("manitoba",),
+    ("CA", "NS"): ("nova scotia",),
+    ("CA", "ON"): ("ontario",),
+    ("CA", "QC"): ("quebec",),
+    ("AU", "NSW"): ("new south wales",),
+    ("AU", "VIC"): ("victoria",),
+    ("AU", "QLD"): ("queensland",),
+    ("AU", "WA"): ("western australia",),
+}
+
+# Canonical city name, region code (or None), country -> aliases. When a
+# name is shared, the first entry wins unless the text names the region
+# or country.
+_CITIES: tuple[tuple[str, str | None, str, tuple[str, ...]], ...] = (
+    ("New York", "NY", "US", ("nyc", "new york city", "manhattan", "brooklyn")),
+    ("San Francisco", "CA", "US", ("sf", "san francisco bay area", "bay area")),
+    ("Los Angeles", "CA", "US", ("la",)),
+    ("San Jose", "CA", "US", ()),
+    ("San Diego", "CA", "US", ()),
+    ("Mountain View", "CA", "US", ()),
+    ("Palo Alto", "CA", "US", ()),
+    ("Sunnyvale", "CA", "US", ()),
+    ("Santa Clara", "CA", "US", ()),
+    ("Menlo Park", "CA", "US", ()),
+    ("Oakland", "CA", "US", ()),
+    ("Irvine", "CA", "US", ()),
+    ("Seattle", "WA", "US", ()),
+    ("Bellevue", "WA", "US", ()),
+    ("Redmond", "WA", "US", ()),
+    ("Portland", "OR", "US", ()),
+    ("Austin", "TX", "US", ()),
+    ("Dallas", "TX", "US", ()),
+    ("Houston", "TX", "US", ()),
+    ("Boston", "MA", "US", ()),
+    ("Cambridge", "MA", "US", ()),
+    ("Chicago", "IL", "US", ()),
+    ("Denver", "CO", "US", ()),
+    ("Boulder", "CO", "US", ()),
+    ("Atlanta", "GA", "US", ()),
+    ("Miami", "FL", "US", ()),
+    ("Washington", "DC", "US", ("washington dc", "washington d c")),
+    ("Philadelphia", "PA", "US", ()),
+    ("Pittsburgh", "PA", "US", ()),
+    ("Minneapolis", "MN", "US", ()),
+    ("Detroit", "MI", "US", ()),
+    ("Phoenix", "AZ", "US", ()),
+    ("Salt Lake City", "UT", "US", ()),
+    ("Raleigh", "NC", "US", ()),
+    ("Nashville", "TN", "US", ()),
+    ("Toronto", "ON", "CA", ()),
+    ("Ottawa", "ON", "CA", ()),
+    ("Waterloo", "ON", "CA", ()),
+    ("Vancouver", "BC", "CA", ()),
+    ("Montreal", "QC", "CA", ()),
+    ("Calgary", "AB", "CA", ()),
+    ("Mexico City", None, "MX", ("cdmx", "ciudad de mexico")),
+    ("Sao Paulo", None, "BR", ()),
+    ("Buenos Aires", None, "AR", ()),
+    ("Bogota", None, "CO", ()),
+    ("London", None, "GB", ()),
+    ("Manchester", None, "GB", ()),
+    ("Edinburgh", None, "GB", ()),
+    ("Cambridge", None, "GB", ()),
+    ("Dublin", None, "IE", ()),
+    ("Berlin", None, "DE", ()),
+    ("Munich", None, "DE", ("munchen",)),
+    ("Hamburg", None, "DE", ()),
+    ("Frankfurt", None, "DE", ("frankfurt am main",)),
+    ("Cologne", None, "DE", ("koln",)),
+    ("Paris", None, "FR", ()),
+    ("Amsterdam", None, "NL", ()),
+    ("Rotterdam", None, "NL", ()),
+    ("Brussels", None, "BE", ("bruxelles",)),
+    ("Zurich", None, "CH", ()),
+    ("Geneva", None, "CH", ("geneve",)),
+    ("Vienna", None, "AT", ("wien",)),
+    ("Madrid", None, "ES", ()),
+    ("Barcelona", None, "ES", ()),
+    ("Lisbon", None, "PT", ("lisboa",)),
+    ("Milan", None, "IT", ("milano",)),
+    ("Rome", None, "IT", ("roma",)),
+    ("Stockholm", None, "SE", ()),
+    ("Oslo", None, "NO", ()),
+    ("Copenhagen", None, "DK", ("kobenhavn",)),
+    ("Helsinki", None, "FI", ()),
+    ("Warsaw", None, "PL", ("warszawa",)),
+    ("Krakow", None, "PL", ()),
+    ("Prague", None, "CZ", ("praha",)),
+    ("Bucharest", None, "RO", ()),
+    ("Kyiv", None, "UA", ("kiev",)),
+    ("Istanbul", None, "TR", ()),
+    ("Tel Aviv", None, "IL", ("tel aviv yafo",)),
+    ("Dubai", None, "AE", ()),
+    ("Bangalore", None, "IN", ("bengaluru",)),
+    ("Hyderabad", None, "IN", ()),
+    ("Mumbai", None, "IN", ()),
+    ("Pune", None, "IN", ()),
+    ("Gurgaon", None, "IN", ("gurugram",)),
+    ("Singapore", None, "SG", ()),
+    ("Tokyo", None, "JP", ()),
+    ("Seoul", None, "KR", ()),
+    ("Shanghai", None, "CN", ()),
+    ("Beijing", None, "CN", ()),
+    ("Hong Kong", None, "HK", ()),
+    ("Taipei", None, "TW", ()),
+    ("Manila", None, "PH", ()),
+    ("Sydney", "NSW", "AU", ()),
+    ("Melbourne", "VIC", "AU", ()),
+    ("Brisbane", "QLD", "AU", ()),
+    ("Auckland", None, "NZ", ()),
+    ("Cape Town", None, "ZA", ()),
+    ("Johannesburg", None, "ZA", ()),
+    ("Lagos", None, "NG", ()),
+    ("Nairobi", None, "KE", ()),
+    ("Cairo", None, "EG", ()),
+)
+
+_REMOTE = re.compile(
+    r"\b(?:remote|anywhere|work from home|wfh|distributed|telecommute|"
+    r"home based|virtual)\b"
+)
+# Separate alternative places: "SF or NYC", "Berlin; London", "A | B"
+_ALTERNATIVES = re.compile(r"\s*(?:[;|/]|\bor\b|\band\b|&)\s*")
+# Separate the parts of one place: "Austin, TX", "Remote - US", "Paris (FR)"
+_PARTS = re.compile(r"\s*(?:,|\s-\s|[()\[\]])\s*")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase ASCII words separated by single spaces"""
+    ascii_text = (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    )
+    return _NON_WORD.sub(" ", ascii_text.lower()).strip()
+
+
+def _build_index() -> tuple[
+    dict[str, str],
+    dict[str, list[tuple[str, str]]],
+    dict[str, list[tuple[str, str | None, str]]],
+]:
+    countries = {
+        normalize_key(alias): code
+        for code, aliases in _COUNTRIES.items()
+        for alias in aliases
+    }
+    regions: dict[str, list[tuple[str, str]]] = {}
+    for (country, code), names in _REGIONS.items():
+        for name in (code, *names):
+            regions.setdefault(normalize_key(name), []).append((country, code))
+    cities: dict[str, list[tuple[str, str | None, str]]] = {}
+    for name, region, country, aliases in _CITIES:
+        for alias in (name, *aliases):
+            cities.setdefault(normalize_key(alias), []).append((name, region, country))
+    return countries, regions, cities
+
+
+_COUNTRY_INDEX, _REGION_INDEX, _CITY_INDEX = _build_index()
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    """A resolved place; coarser levels are always set when finer ones are"""
+
+    country: str
+    region: str | None = None
+    city: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedLocation:
+    remote: bool
+    # In the order the text lists them
+    places: tuple[Place, ...]
+
+    @property
+    def primary(self) -> Place | None:
+        return self.places[0] if self.places else None
+
+
+def _resolve_place(parts: list[str]) -> Place | None:
+    """
+    One place from the parts of e.g. "Austin, TX, USA".
+
+    Parts are read from the most general (last) to the most specific, so
+    "New York, NY" is the city once NY has taken the region.
+    """
+    country: str | None = None
+    region: str | None = None
+    region_part: str | None = None
+    city: tuple[str, str | None, str] | None = None
+    for part in reversed(parts):
+        if country is None and region is None and part in _COUNTRY_INDEX:
+            country = _COUNTRY_INDEX[part]
+            continue
+        # A lone name that is both ("New York") is taken as the city
+        lone_city = len(parts) == 1 and part in _CITY_INDEX
+        if region is None and part in _REGION_INDEX and not lone_city:
+            matches = [m for m in _REGION_INDEX[part] if country in (None, m[0])]
+            if matches:
+                country, region = matches[0]
+                region_part = part
+                continue
+        if city is None and part in _CITY_INDEX:
+            candidates = _CITY_INDEX[part]
+            matches = [
+                m
+                for m in candidates
+                if country in (None, m[2]) and region in (None, m[1])
+            ]
+            # "Toronto, CA" and "Pune, IN" use country codes that are also
+            # US state codes
+            if not matches and region_part is not None:
+                matches = [m for m in candidates if m[2] == region_part.upper()]
+            if matches:
+                city = matches[0]
+                country, region = city[2], city[1]
+    if city is not None:
+        return Place(city[2], city[1], city[0])
+    if country is not None:
+        return Place(country, region)
+    return None
+
+
+def normalize_location(text: str | None) -> NormalizedLocation:
+    """Places named in a location string, and whether it allows remote work"""
+    if not text:
+        return NormalizedLocation(remote=False, places=())
+    key = normalize_key(text)
+    places: list[Place] = []
+    for alternative in _ALTERNATIVES.split(text):
+        parts = [normalize_key(p) for p in _PARTS.split(alternative)]
+        place = _resolve_place([p for p in parts if p and not _REMOTE.fullmatch(p)])
+        if place is not None and place not in places:
+            places.append(place)
+    return NormalizedLocation(remote=bool(_REMOTE.search(key)), places=tuple(places))
+
+
+# --- Salary ----------------------------------------------------------------
+
+# Multipliers to an annual amount
+HOURS_PER_YEAR = 2080
+PERIOD_FACTORS = {
+    "hour": HOURS_PER_YEAR,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+# Annual amounts outside this range are parse errors, not salaries
+_ANNUAL_BOUNDS = (1_000, 5_000_000)
+# Unlabelled amounts up to this are taken as hourly
+_MAX_HOURLY = 500
+
+_SYMBOLS = {
+    "us$": "USD",
+    "ca$": "CAD",
+    "c$": "CAD",
+    "au$": "AUD",
+    "a$": "AUD",
+    "nz$": "NZD",
+    "s$": "SGD",
+    "$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "¥": "JPY",
+    "₹": "INR",
+    "zł": "PLN",
+}
+_CODES = [
+    *("USD", "EUR", "GBP", "CAD", "AUD", "NZD", "CHF", "SEK", "NOK", "DKK"),
+    *("PLN", "CZK", "INR", "SGD", "JPY", "ILS", "BRL", "MXN", "ZAR"),
+]
+
+_CURRENCY = "|".join(
+    [re.escape(s) for s in sorted(_SYMBOLS, key=len, reverse=True)] + _CODES
+)
+# Thousands may be grouped with commas, dots or (narrow) spaces
+_AMOUNT = r"\d{1,3}(?:[,.\u00a0\u202f ]\d{3})+(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?"
+_SALARY = re.compile(
+    rf"""
+    (?P<cur1>{_CURRENCY})?\s*
+    (?P<low>{_AMOUNT})\s*(?P<k1>[kK])?\s*(?P<code1>{"|".join(_CODES)})?
+    (?:
+        \s*(?:-|–|—|to)\s*
+        (?P<cur2>{_CURRENCY})?\s*
+        (?P<high>{_AMOUNT})\s*(?P<k2>[kK])?
+    )?
+    \s*(?P<code2>{"|".join(_CODES)})?\b
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_PERIOD = re.compile(
+    r"""
+    [\s,]*(?:
+        (?:per|a|an|/|each|every)\s*[-\s]?
+        (?P<unit>hour|hr|h|day|week|wk|month|mo|year|yr|annum)\b
+      | (?P<adverb>hourly|daily|weekly|monthly|yearly|annually|annual)\b
+      | (?P<pa>p\.?\s?a)\b
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_PERIOD_WORDS = {
+    "hour": "hour",
+    "hr": "hour",
+    "h": "hour",
+    "hourly": "hour",
+    "day": "day",
+    "daily": "day",
+    "week": "week",
+    "wk": "week",
+    "weekly": "week",
+    "month": "month",
+    "mo": "month",
+    "monthly": "month",
+    "year": "year",
+    "yr": "year",
+    "annum": "year",
+    "yearly": "year",
+    "annually": "year",
+    "annual": "year",
+}
+# How far after the amounts a period label is looked for
+_PERIOD_WINDOW = 24
+
+
+@dataclass(frozen=True, slots=True)
+class SalaryRange:
+    """A pay range as stated, in currency units per period"""
+
+    minimum: float
+    maximum: float
+    currency: str | None
+    period: str
+
+    @property
+    def annual(self) -> tuple[float, float]:
+        factor = PERIOD_FACTORS[self.period]
+        return self.minimum * factor, self.maximum * factor
+
+
+def _amount(text: str) -> float:
+    digits = re.sub(r"[\s\u00a0\u202f]", "", text)
+    # A last group of exactly three digits is a thousands group ("120,000",
+    # "120.000"); one or two digits are decimals ("52.50", "52,5")
+    last = max(digits.rfind(","), digits.rfind("."))
+    if last != -1 and len(digits) - last - 1 != 3:
+        return float(re.sub(r"[,.]", "", digits[:last]) + "." + digits[last + 1 :])
+    return float(re.sub(r"[,.]", "", digits))
+
+
+def _currency(*labels: str | None) -> str | None:
+    for label in labels:
+        if label:
+            return _SYMBOLS.get(label.lower()) or label.upper()
+    return None
+
+
+def _period(text: str, pos: int) -> str | None:
+    match = _PERIOD.match(text, pos, pos + _PERIOD_WINDOW)
+    if match is None:
+        return None
+    if match.group("pa") is not None:
+        return "year"
+    return _PERIOD_WORDS[(match.group("unit") or match.group("adverb")).lower()]
+
+
+def parse_salary(text: str | None, free_text: bool = True) -> SalaryRange | None:
+    """
+    First pay range stated in the text.
+
+    In free text (descriptions) amounts only count with a currency and
+    either a range or a period label, so "5-7 years" or "a $5,000
+    stipend" are not pay. Structured salary fields pass free_text=False.
+    Without a period label, amounts up to _MAX_HOURLY are hourly and
+    larger ones yearly.
+    """
+    if not text:
+        return None
+    for match in _SALARY.finditer(text):
+        currency = _currency(
+            match.group("cur1"),
+            match.group("cur2"),
+            match.group("code1"),
+            match.group("code2"),
+        )
+        period = _period(text, match.end())
+        if free_text and (currency is None or not (match.group("high") or period)):
+            continue
+
+        low = _amount(match.group("low"))
+        high = _amount(match.group("high")) if match.group("high") else low
+        if match.group("k2") or (match.group("k1") and not match.group("high")):
+            high *= 1000
+            # "120-150k" abbreviates both ends
+            if match.group("k1") or low < 1000 <= high:
+                low *= 1000
+        elif match.group("k1"):
+            low *= 1000
+        if low > high:
+            low, high = high, low
+
+        salary = SalaryRange(
+            low, high, currency, period or ("hour" if high <= _MAX_HOURLY else "year")
+        )
+        annual_low, annual_high = salary.annual
+        if _ANNUAL_BOUNDS[0] <= annual_low and annual_high <= _ANNUAL_BOUNDS[1]:
+            return salary
+    return None
+
+
+# --- Job columns -----------------------------------------------------------
+
+
+def structured_job_fields(
+    location: str | None,
+    description: str,
+    work_setting: str | None,
+    salary_text: str | None = None,
+) -> dict[str, Any]:
+    """
+    Structured jobs columns derived from a posting's free text.
+
+    The location's first place fills location_country/region/city; a
+    remote location marks the job remote unless it is already hybrid.
+    Pay comes from the ATS salary field when there is one, else from the
+    description, and is stored as an annual range.
+    """
+    normalized = normalize_location(location)
+    place = normalized.primary
+    if normalized.remote and work_setting != "hybrid":
+        work_setting = "remote"
+
+    salary = parse_salary(salary_text, free_text=False) or parse_salary(description)
+    annual = salary.annual if salary else (None, None)
+    return {
+        "location_country": place.country if place else None,
+        "location_region": place.region if place else None,
+        "location_city": place.city if place else None,
+        "work_setting": work_setting,
+        "salary_min": annual[0],
+        "salary_max": annual[1],
+        "salary_currency": salary.currency if salary else None,
+    }
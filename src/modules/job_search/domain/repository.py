@@ -1,29 +1,107 @@
-from typing import Protocol, runtime_checkable
+from typing import Any, Literal, NamedTuple, Protocol, runtime_checkable
 from uuid import UUID
 
-from src.modules.job_search.domain.models import Job, JobMatch
+from src.core.database.pagination import Page
+from src.core.database.vector_search import VectorSearchMode
+from src.modules.job_search.domain.models import Job, JobMatch, ScrapeCursor
+
+JobSearchOrder = Literal["recency", "text_rank", "vector", "hybrid"]
+
+
+class UpsertedJob(NamedTuple):
+    """A row written by a bulk job upsert"""
+
+    id: UUID
+    inserted: bool
+    # No description embedding yet: new, or title/description changed
+    needs_embedding: bool
+    external_id: str | None = None
+
+
+class DedupCandidate(NamedTuple):
+    """A job found in the LSH index"""
+
+    id: UUID
+    canonical_job_id: UUID | None
+    signature: list[int]
 
 
 @runtime_checkable
 class JobRepository(Protocol):
     async def get_by_id(self, job_id: UUID) -> Job | None: ...
 
+    async def get_by_ids(self, job_ids: list[UUID]) -> list[Job]: ...
+
     async def get_by_external_id(self, external_id: str) -> Job | None: ...
 
     async def save(self, job: Job) -> Job: ...
 
+    async def expire_by_external_ids(self, external_ids: list[str]) -> int: ...
+
+    async def upsert_jobs(self, rows: list[dict[str, Any]]) -> list[UpsertedJob]: ...
+
+    async def find_duplicate_candidates(
+        self, buckets: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], list[DedupCandidate]]: ...
+
+    async def save_lsh_buckets(
+        self, buckets: dict[UUID, list[tuple[int, int]]]
+    ) -> None: ...
+
+    async def link_duplicates(self, links: dict[UUID, UUID | None]) -> None: ...
+
+    async def get_batch_after(self, after: UUID | None, limit: int) -> list[Job]: ...
+
+    async def update_jobs(self, values: list[dict[str, Any]]) -> None: ...
+
     async def search_jobs(
         self,
         query: str | None = None,
         embedding: list[float] | None = None,
+        location: str | None = None,
+        remote_only: bool = False,
+        salary_min: int | None = None,
         limit: int = 20,
         offset: int = 0,
+        search_mode: VectorSearchMode = "approximate",
+        ef_search: int | None = None,
+        order: JobSearchOrder | None = None,
+        cursor: str | None = None,
+    ) -> Page[Job]: ...
+
+    async def get_match_candidates(
+        self, embedding: list[float] | None = None, limit: int = 150
     ) -> list[Job]: ...
 
     async def get_match(self, user_id: UUID, job_id: UUID) -> JobMatch | None: ...
 
     async def save_match(self, match: JobMatch) -> JobMatch: ...
 
+    async def upsert_matches(self, matches: list[dict[str, Any]]) -> None: ...
+
+    async def prune_user_matches(
+        self, user_id: UUID, keep_job_ids: list[UUID]
+    ) -> int: ...
+
     async def get_user_matches(
-        self, user_id: UUID, status: str | None = None, limit: int = 20, offset: int = 0
-    ) -> list[JobMatch]: ...
+        self,
+        user_id: UUID,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[JobMatch]: ...
+
+
+@runtime_checkable
+class SkillEmbeddingRepository(Protocol):
+    async def get_many(self, names: list[str]) -> dict[str, list[float]]: ...
+
+    async def save_many(self, embeddings: dict[str, list[float]]) -> None: ...
+
+
+@runtime_checkable
+class ScrapeCursorRepository(Protocol):
+    async def get_for_source(self, source: str) -> dict[str, ScrapeCursor]: ...
+
+    async def save(self, cursor: ScrapeCursor) -> ScrapeCursor: ...
@@ -1,13 +1,23 @@
 from uuid import UUID
 
+from src.core.ai.gemini_client import GeminiClient
+from src.core.database.pagination import Page
+from src.core.database.vector_search import VectorSearchMode
 from src.modules.job_search.api.schemas import JobMatchAnalysis
 from src.modules.job_search.domain.models import Job, JobMatch
-from src.modules.job_search.domain.repository import JobRepository
+from src.modules.job_search.domain.repository import JobRepository, JobSearchOrder
+
+
+class SearchOrderError(ValueError):
+    """The requested ranking cannot be computed from the inputs"""
 
 
 class JobSearchService:
-    def __init__(self, repository: JobRepository):
+    def __init__(
+        self, repository: JobRepository, embedding_service: GeminiClient | None = None
+    ):
         self._repository = repository
+        self._embedding_service = embedding_service
 
     async def get_job(self, job_id: UUID) -> Job | None:
         return await self._repository.get_by_id(job_id)
@@ -21,7 +31,21 @@ class JobSearchService:
         salary_min: int | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Job]:
+        search_mode: VectorSearchMode = "approximate",
+        ef_search: int | None = None,
+        order: JobSearchOrder | None = None,
+        cursor: str | None = None,
+    ) -> Page[Job]:
+        """
+        Search jobs; vector and hybrid order embed the query when no
+        embedding is given, and raise SearchOrderError without one.
+        """
+        if order in ("vector", "hybrid") and embedding is None:
+            if not query or self._embedding_service is None:
+                raise SearchOrderError(f"'{order}' order needs a search query")
+            embedding = await self._embedding_service.embed_text(
+                query, task_type="RETRIEVAL_QUERY"
+            )
         return await self._repository.search_jobs(
             query=query,
             embedding=embedding,
@@ -30,12 +54,23 @@ class JobSearchService:
             salary_min=salary_min,
             limit=limit,
             offset=offset,
+            search_mode=search_mode,
+            ef_search=ef_search,
+            order=order,
+            cursor=cursor,
         )
 
     async def get_user_matches(
-        self, user_id: UUID, status: str | None = None, limit: int = 20, offset: int = 0
-    ) -> list[JobMatch]:
-        return await self._repository.get_user_matches(user_id, status, limit, offset)
+        self,
+        user_id: UUID,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[JobMatch]:
+        return await self._repository.get_user_matches(
+            user_id, status, limit, offset, cursor
+        )
 
     async def update_match_status(self, match_id: UUID, status: str) -> JobMatch:
         # In a real app, we'd fetch the match by ID first.
@@ -0,0 +1,108 @@
+import logging
+import re
+from collections.abc import Iterable
+
+import numpy as np
+
+from src.core.ai.gemini_client import GeminiClient
+from src.modules.job_search.domain.models import SKILL_NAME_MAX_LENGTH
+from src.modules.job_search.domain.repository import SkillEmbeddingRepository
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 768
+
+
+def normalize_skill(name: str) -> str:
+    """Canonical lookup key for a skill name"""
+    return re.sub(r"\s+", " ", name).strip().lower()
+
+
+class SkillVocabulary:
+    """
+    In-process matrix of normalized skill names and unit-length embeddings.
+
+    Rows are filled lazily: first from the skill_embeddings table, then via
+    the embedding service for skills never seen before. Each skill is
+    embedded once and then shared by every request in the process.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self._index: dict[str, int] = {}
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_skill(name) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    async def ensure(
+        self,
+        names: Iterable[str],
+        embedding_service: GeminiClient,
+        repository: SkillEmbeddingRepository | None = None,
+    ) -> None:
+        """
+        Load or embed every name not yet in the matrix.
+
+        Names longer than the skill_embeddings column are scraped noise
+        rather than skills; they are skipped so a single one cannot fail
+        the INSERT and abort the caller's transaction.
+        """
+        missing = [
+            name
+            for name in dict.fromkeys(normalize_skill(n) for n in names)
+            if name and len(name) <= SKILL_NAME_MAX_LENGTH and name not in self._index
+        ]
+        if not missing:
+            return
+
+        found = await repository.get_many(missing) if repository else {}
+
+        new_embeddings: dict[str, list[float]] = {}
+        to_embed = [name for name in missing if name not in found]
+        if to_embed:
+            try:
+                vectors = await embedding_service.embed_batch(
+                    to_embed, task_type="SEMANTIC_SIMILARITY"
+                )
+                new_embeddings = dict(zip(to_embed, vectors, strict=True))
+            except Exception as e:
+                logger.warning(f"Failed to embed {len(to_embed)} skills: {e}")
+
+        if repository and new_embeddings:
+            await repository.save_many(new_embeddings)
+
+        self._add({**found, **new_embeddings})
+
+    def vectors(self, names: list[str]) -> np.ndarray:
+        """Unit vectors for names; unknown names get a zero row"""
+        rows = np.zeros((len(names), self._matrix.shape[1]), dtype=np.float32)
+        for i, name in enumerate(names):
+            idx = self._index.get(normalize_skill(name))
+            if idx is not None:
+                rows[i] = self._matrix[idx]
+        return rows
+
+    def similarity(self, left: list[str], right: list[str]) -> np.ndarray:
+        """Cosine similarity matrix of shape (len(left), len(right))"""
+        return self.vectors(left) @ self.vectors(right).T
+
+    def _add(self, embeddings: dict[str, list[float]]) -> None:
+        new_names = [name for name in embeddings if name not in self._index]
+        if not new_names:
+            return
+
+        block = np.asarray([embeddings[n] for n in new_names], dtype=np.float32)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        offset = len(self._index)
+        self._matrix = np.vstack([self._matrix, block / norms])
+        for i, name in enumerate(new_names):
+            self._index[name] = offset + i
+
+
+# Process-wide vocabulary shared across requests
+skill_vocabulary = SkillVocabulary()
@@ -0,0 +1,24 @@
+import asyncio
+import logging
+
+from src.core.events.event_bus import Event, event_bus
+from src.modules.persona.events.events import PersonaUpdated
+from src.workers.tasks.job_matching import rescore_persona_matches
+
+logger = logging.getLogger(__name__)
+
+
+async def on_persona_updated(event: Event) -> None:
+    """Queue a rescore of the user's precomputed matches."""
+    if not isinstance(event, PersonaUpdated):
+        return
+    try:
+        # .delay() talks to the broker synchronously
+        await asyncio.to_thread(rescore_persona_matches.delay, str(event.user_id))
+    except Exception as e:
+        # Matches are refreshed on the next change; never fail the save
+        logger.warning(f"Failed to queue match rescore for {event.user_id}: {e}")
+
+
+def register_handlers() -> None:
+    event_bus.subscribe(PersonaUpdated, on_persona_updated)
@@ -1,11 +1,86 @@
+from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    ColumnElement,
+    Row,
+    Select,
+    SmallInteger,
+    bindparam,
+    case,
+    delete,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from src.modules.job_search.domain.models import Job, JobMatch
-from src.modules.job_search.domain.repository import JobRepository
+from src.core.database.pagination import (
+    InvalidCursorError,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    nullable_keyset_after_desc,
+)
+from src.core.database.vector_search import (
+    VectorSearchMode,
+    ef_search_for,
+    vector_search_settings,
+)
+from src.modules.job_search.domain.models import (
+    SKILL_NAME_MAX_LENGTH,
+    TEXT_SEARCH_CONFIG,
+    Job,
+    JobLshBucket,
+    JobMatch,
+    ScrapeCursor,
+    SkillEmbedding,
+)
+from src.modules.job_search.domain.normalization import normalize_location
+from src.modules.job_search.domain.repository import (
+    DedupCandidate,
+    JobRepository,
+    JobSearchOrder,
+    ScrapeCursorRepository,
+    SkillEmbeddingRepository,
+    UpsertedJob,
+)
+
+# Columns an ingest upsert refreshes; a row is only rewritten if one differs
+UPSERT_JOB_COLUMNS = (
+    "source",
+    "url",
+    "title",
+    "company",
+    "location",
+    "location_country",
+    "location_region",
+    "location_city",
+    "description",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "job_type",
+    "work_setting",
+    "status",
+    "posted_at",
+    "expired_at",
+    "minhash_signature",
+)
+
+# Rows taken from each ranking before fusion
+HYBRID_CANDIDATE_POOL = 100
+# Reciprocal-rank fusion constant: score = sum(1 / (RRF_K + rank))
+RRF_K = 60
 
 
 class SQLAlchemyJobRepository(JobRepository):
@@ -18,6 +93,14 @@ class SQLAlchemyJobRepository(JobRepository):
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, job_ids: list[UUID]) -> list[Job]:
+        if not job_ids:
+            return []
+        result = await self._session.execute(
+            select(Job).where(Job.id.in_(job_ids), Job.deleted_at.is_(None))
+        )
+        return list(result.scalars().all())
+
     async def get_by_external_id(self, external_id: str) -> Job | None:
         result = await self._session.execute(
             select(Job).where(Job.external_id == external_id, Job.deleted_at.is_(None))
@@ -29,6 +112,186 @@ class SQLAlchemyJobRepository(JobRepository):
         await self._session.flush()
         return job
 
+    async def upsert_jobs(self, rows: list[dict[str, Any]]) -> list[UpsertedJob]:
+        """
+        Insert or refresh jobs by external_id in one statement.
+
+        Rows whose columns are all unchanged are skipped and not returned.
+        A changed title or description clears the stored embedding.
+        """
+        if not rows:
+            return []
+        stmt = insert(Job).values(rows)
+        excluded = stmt.excluded
+        text_changed = tuple_(Job.title, Job.description).is_distinct_from(
+            tuple_(excluded.title, excluded.description)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["external_id"],
+            set_={
+                **{column: excluded[column] for column in UPSERT_JOB_COLUMNS},
+                "raw_data": excluded.raw_data,
+                "description_embedding": case(
+                    (text_changed, None), else_=Job.description_embedding
+                ),
+                "updated_at": func.now(),
+                "deleted_at": None,
+                "version": Job.version + 1,
+            },
+            where=tuple_(
+                *(getattr(Job, column) for column in UPSERT_JOB_COLUMNS),
+                Job.deleted_at,
+            ).is_distinct_from(
+                tuple_(*(excluded[column] for column in UPSERT_JOB_COLUMNS), None)
+            ),
+        ).returning(
+            Job.id,
+            # xmax is 0 only for freshly inserted tuples
+            literal_column("xmax = 0").label("inserted"),
+            Job.description_embedding.is_(None).label("needs_embedding"),
+            Job.external_id,
+        )
+        result = await self._session.execute(stmt)
+        return [UpsertedJob(*row) for row in result.all()]
+
+    async def find_duplicate_candidates(
+        self, buckets: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], list[DedupCandidate]]:
+        """Live jobs in any of the LSH buckets, grouped by bucket"""
+        if not buckets:
+            return {}
+        # Two array parameters instead of a bind pair per bucket
+        keys = (
+            func.unnest(
+                bindparam("bands", [b for b, _ in buckets], ARRAY(SmallInteger)),
+                bindparam("buckets", [k for _, k in buckets], ARRAY(BigInteger)),
+            )
+            .table_valued("band", "bucket")
+            .render_derived()
+        )
+        stmt = (
+            select(
+                JobLshBucket.band,
+                JobLshBucket.bucket,
+                Job.id,
+                Job.canonical_job_id,
+                Job.minhash_signature,
+            )
+            .join(
+                keys,
+                (JobLshBucket.band == keys.c.band)
+                & (JobLshBucket.bucket == keys.c.bucket),
+            )
+            .join(Job, Job.id == JobLshBucket.job_id)
+            .where(Job.deleted_at.is_(None), Job.status == "active")
+        )
+        result = await self._session.execute(stmt)
+        candidates: dict[tuple[int, int], list[DedupCandidate]] = {}
+        for band, bucket, job_id, canonical_job_id, signature in result.all():
+            candidates.setdefault((band, bucket), []).append(
+                DedupCandidate(job_id, canonical_job_id, list(signature or []))
+            )
+        return candidates
+
+    async def save_lsh_buckets(
+        self, buckets: dict[UUID, list[tuple[int, int]]]
+    ) -> None:
+        """Replace the LSH buckets of the given jobs"""
+        if not buckets:
+            return
+        await self._session.execute(
+            delete(JobLshBucket).where(JobLshBucket.job_id.in_(list(buckets)))
+        )
+        rows = [
+            {"job_id": job_id, "band": band, "bucket": bucket}
+            for job_id, keys in buckets.items()
+            for band, bucket in keys
+        ]
+        if rows:
+            await self._session.execute(insert(JobLshBucket), rows)
+
+    async def get_batch_after(self, after: UUID | None, limit: int) -> list[Job]:
+        """Live jobs in id order after the given id, for backfills"""
+        stmt = select(Job).where(Job.deleted_at.is_(None)).order_by(Job.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(Job.id > after)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def update_jobs(self, values: list[dict[str, Any]]) -> None:
+        """Bulk UPDATE by primary key; each dict holds "id" and new values"""
+        if values:
+            await self._session.execute(update(Job), values)
+
+    async def link_duplicates(self, links: dict[UUID, UUID | None]) -> None:
+        """
+        Point jobs at their canonical job (None marks them canonical).
+
+        Jobs that duplicated a job which is now itself a duplicate are
+        moved to the new canonical, so links never chain.
+        """
+        if not links:
+            return
+        await self._session.execute(
+            update(Job),
+            [
+                {"id": job_id, "canonical_job_id": canonical}
+                for job_id, canonical in links.items()
+            ],
+        )
+        demoted = {
+            job_id: canonical for job_id, canonical in links.items() if canonical
+        }
+        if demoted:
+            await self._session.execute(
+                update(Job)
+                .where(Job.canonical_job_id.in_(list(demoted)))
+                .values(canonical_job_id=case(demoted, value=Job.canonical_job_id))
+            )
+
+    async def expire_by_external_ids(self, external_ids: list[str]) -> int:
+        """Mark active jobs as expired once they leave their board"""
+        if not external_ids:
+            return 0
+        result = await self._session.execute(
+            update(Job)
+            .where(
+                Job.external_id.in_(external_ids),
+                Job.status == "active",
+                Job.deleted_at.is_(None),
+            )
+            # jobs.expired_at is a naive UTC timestamp
+            .values(status="expired", expired_at=datetime.now(UTC).replace(tzinfo=None))
+            .returning(Job.id)
+        )
+        expired = list(result.scalars().all())
+        await self._promote_duplicates(expired)
+        return len(expired)
+
+    async def _promote_duplicates(self, job_ids: list[UUID]) -> None:
+        """Make the newest live duplicate of each expired job canonical"""
+        if not job_ids:
+            return
+        result = await self._session.execute(
+            select(Job.canonical_job_id, Job.id)
+            .where(
+                Job.canonical_job_id.in_(job_ids),
+                Job.status == "active",
+                Job.deleted_at.is_(None),
+            )
+            .distinct(Job.canonical_job_id)
+            .order_by(Job.canonical_job_id, Job.posted_at.desc().nulls_last(), Job.id)
+        )
+        successors = dict(result.tuples().all())
+        if not successors:
+            return
+        await self.link_duplicates(dict.fromkeys(successors.values()))
+        await self._session.execute(
+            update(Job)
+            .where(Job.canonical_job_id.in_(list(successors)))
+            .values(canonical_job_id=case(successors, value=Job.canonical_job_id))
+        )
+
     async def search_jobs(
         self,
         query: str | None = None,
@@ -38,42 +301,261 @@ class SQLAlchemyJobRepository(JobRepository):
         salary_min: int | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Job]:
-        stmt = select(Job).where(Job.deleted_at.is_(None))
+        search_mode: VectorSearchMode = "approximate",
+        ef_search: int | None = None,
+        order: JobSearchOrder | None = None,
+        cursor: str | None = None,
+    ) -> Page[Job]:
+        """
+        Search jobs with full-text and structured filters.
+
+        order picks the ranking: "recency", "text_rank" (ts_rank over the
+        weighted search_vector), "vector" (cosine distance) or "hybrid"
+        (reciprocal-rank fusion of text and vector ranks). By default the
+        ranking is vector when an embedding is given, else recency.
+
+        Recency and vector pages carry a next_cursor; passing it back
+        continues after the last row, keyed on (posted_at, id) or
+        (distance, id), and offset is ignored. Text and hybrid rankings
+        page by offset only.
+
+        For vector ranking, search_mode="exact" bypasses the HNSW index and
+        ef_search tunes recall of the approximate scan.
+        """
+        order = self._resolve_order(order, query, embedding)
+        if cursor and order not in ("recency", "vector"):
+            raise InvalidCursorError(
+                f"Cursor pagination is not supported for '{order}'"
+            )
+        key = decode_cursor(cursor, order) if cursor else None
+        if key is not None:
+            offset = 0
+
+        filters = self._search_filters(location, remote_only, salary_min)
+        ts_query = func.websearch_to_tsquery(
+            literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig"), query or ""
+        )
+
+        if order == "hybrid" and embedding is not None:
+            jobs = await self._hybrid_search(
+                ts_query, embedding, filters, limit, offset, search_mode, ef_search
+            )
+            return Page(jobs)
+
+        stmt = select(Job).where(*filters)
 
-        # Text search filter
+        # Text search filter, served by the GIN index on search_vector
         if query:
-            stmt = stmt.where(
-                (Job.title.ilike(f"%{query}%"))
-                | (Job.company.ilike(f"%{query}%"))
-                | (Job.description.ilike(f"%{query}%"))
+            stmt = stmt.where(Job.search_vector.bool_op("@@")(ts_query))
+
+        if order == "text_rank":
+            stmt = stmt.order_by(
+                func.ts_rank(Job.search_vector, ts_query).desc(), Job.id
+            )
+            result = await self._session.execute(stmt.limit(limit).offset(offset))
+            return Page(list(result.scalars().all()))
+
+        if order == "recency":
+            stmt = stmt.order_by(Job.posted_at.desc().nulls_last(), Job.id.desc())
+            if key is not None:
+                stmt = stmt.where(
+                    nullable_keyset_after_desc(Job.posted_at, Job.id, key)
+                )
+            # One extra row tells whether another page exists
+            result = await self._session.execute(stmt.limit(limit + 1).offset(offset))
+            jobs = list(result.scalars().all())
+            next_cursor = None
+            if len(jobs) > limit:
+                jobs = jobs[:limit]
+                next_cursor = encode_cursor(order, [jobs[-1].posted_at, jobs[-1].id])
+            return Page(jobs, next_cursor)
+
+        # Vector similarity search using pgvector. The distance is the only
+        # ORDER BY key: with an id tiebreaker PG16 will not use the HNSW
+        # index and sorts every row instead. Ties are ordered by id below.
+        distance = Job.description_embedding.cosine_distance(embedding)
+        stmt = (
+            stmt.add_columns(distance.label("distance"))
+            .where(Job.description_embedding.is_not(None))
+            .order_by(distance)
+        )
+        if key is not None:
+            stmt = stmt.where(keyset_after([distance, Job.id], key))
+        async with vector_search_settings(
+            self._session,
+            mode=search_mode,
+            ef_search=ef_search_for(limit + 1 + offset, ef_search),
+            # Rows before the cursor are filtered after the index scan
+            iterative_scan=key is not None,
+        ):
+            result = await self._session.execute(stmt.limit(limit + 1).offset(offset))
+            rows = sorted(result.all(), key=lambda row: (row.distance, row.Job.id))
+            if offset == 0 and 0 < limit < len(rows):
+                rows = await self._complete_distance_tie(stmt, distance, rows, limit)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(order, [rows[-1].distance, rows[-1].Job.id])
+        return Page([row.Job for row in rows], next_cursor)
+
+    async def _complete_distance_tie(
+        self,
+        stmt: Select[Any],
+        distance: ColumnElement[Any],
+        rows: list[Row[Any]],
+        limit: int,
+    ) -> list[Row[Any]]:
+        """
+        Rows in (distance, id) order when equal distances straddle the page.
+
+        The index scan cuts a group of equal distances (e.g. duplicate
+        descriptions) at an arbitrary row, so the page could end on a higher
+        id than a tied row left for later and the cursor would skip it.
+        """
+        tied = rows[limit].distance
+        if rows[limit - 1].distance != tied:
+            return rows
+        ties = stmt.where(distance == tied).order_by(None).order_by(Job.id)
+        result = await self._session.execute(ties.limit(limit + 1))
+        return [row for row in rows if row.distance < tied] + list(result.all())
+
+    async def _hybrid_search(
+        self,
+        ts_query: ColumnElement[Any],
+        embedding: list[float],
+        filters: list[ColumnElement[bool]],
+        limit: int,
+        offset: int,
+        search_mode: VectorSearchMode,
+        ef_search: int | None = None,
+    ) -> list[Job]:
+        """Fuse text and vector rankings with RRF in a single statement"""
+        pool = max(HYBRID_CANDIDATE_POOL, limit + offset)
+
+        text_rank = func.ts_rank(Job.search_vector, ts_query)
+        text_hits = (
+            select(
+                Job.id,
+                func.row_number().over(order_by=text_rank.desc()).label("rank"),
+            )
+            .where(*filters, Job.search_vector.bool_op("@@")(ts_query))
+            .order_by(text_rank.desc())
+            .limit(pool)
+            .cte("text_hits")
+        )
+
+        distance = Job.description_embedding.cosine_distance(embedding)
+        vector_hits = (
+            select(Job.id, func.row_number().over(order_by=distance).label("rank"))
+            .where(*filters, Job.description_embedding.is_not(None))
+            .order_by(distance)
+            .limit(pool)
+            .cte("vector_hits")
+        )
+
+        hits = union_all(
+            select(text_hits.c.id, text_hits.c.rank),
+            select(vector_hits.c.id, vector_hits.c.rank),
+        ).subquery("hits")
+        fused = (
+            select(
+                hits.c.id,
+                func.sum(1.0 / (RRF_K + hits.c.rank)).label("score"),
             )
+            .group_by(hits.c.id)
+            .subquery("fused")
+        )
 
-        # Location filter
+        stmt = (
+            select(Job)
+            .join(fused, fused.c.id == Job.id)
+            .order_by(fused.c.score.desc(), Job.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        async with vector_search_settings(
+            self._session,
+            mode=search_mode,
+            ef_search=ef_search_for(pool, ef_search),
+        ):
+            result = await self._session.execute(stmt)
+            return list(result.scalars().all())
+
+    def _resolve_order(
+        self,
+        order: JobSearchOrder | None,
+        query: str | None,
+        embedding: list[float] | None,
+    ) -> JobSearchOrder:
+        """Requested ranking, downgraded when its inputs are missing"""
+        has_text = bool(query)
+        has_vector = embedding is not None
+        if order is None:
+            return "vector" if has_vector else "recency"
+        if order == "hybrid" and not (has_text and has_vector):
+            return "vector" if has_vector else "text_rank" if has_text else "recency"
+        if (order == "vector" and not has_vector) or (
+            order == "text_rank" and not has_text
+        ):
+            return "recency"
+        return order
+
+    def _search_filters(
+        self, location: str | None, remote_only: bool, salary_min: int | None
+    ) -> list[ColumnElement[bool]]:
+        # Near-duplicates of another job are represented by their canonical
+        filters: list[ColumnElement[bool]] = [
+            Job.deleted_at.is_(None),
+            Job.canonical_job_id.is_(None),
+        ]
+
+        # Location filter on the normalized place, at the granularity the
+        # query names; text the gazetteer does not know is matched as text
         if location:
-            stmt = stmt.where(Job.location.ilike(f"%{location}%"))
+            place = normalize_location(location).primary
+            if place is None:
+                filters.append(Job.location.ilike(f"%{location}%"))
+            else:
+                filters.append(Job.location_country == place.country)
+                if place.region:
+                    filters.append(Job.location_region == place.region)
+                if place.city:
+                    filters.append(Job.location_city == place.city)
 
-        # Remote-only filter
+        # Remote-only filter; ingestion marks jobs with remote locations
         if remote_only:
-            stmt = stmt.where(
-                (Job.work_setting == "remote") | (Job.location.ilike("%remote%"))
-            )
+            filters.append(Job.work_setting == "remote")
 
-        # Minimum salary filter
+        # Minimum salary filter; salary_max >= salary_min for every job
         if salary_min:
-            stmt = stmt.where(
-                (Job.salary_min >= salary_min) | (Job.salary_max >= salary_min)
-            )
+            filters.append(Job.salary_max >= salary_min)
+
+        return filters
+
+    async def get_match_candidates(
+        self, embedding: list[float] | None = None, limit: int = 150
+    ) -> list[Job]:
+        """Active jobs nearest to the embedding, with their stored vectors"""
+        stmt = select(Job).where(
+            Job.deleted_at.is_(None),
+            Job.status == "active",
+            Job.canonical_job_id.is_(None),
+        )
 
-        # Ordering: vector similarity or recency
-        if embedding:
-            # Vector similarity search using pgvector
-            stmt = stmt.order_by(Job.description_embedding.cosine_distance(embedding))
-        else:
+        if embedding is None:
             stmt = stmt.order_by(Job.posted_at.desc())
+            result = await self._session.execute(stmt.limit(limit))
+            return list(result.scalars().all())
 
-        result = await self._session.execute(stmt.limit(limit).offset(offset))
-        return list(result.scalars().all())
+        stmt = stmt.where(Job.description_embedding.is_not(None)).order_by(
+            Job.description_embedding.cosine_distance(embedding)
+        )
+        async with vector_search_settings(
+            self._session, ef_search=ef_search_for(limit)
+        ):
+            result = await self._session.execute(stmt.limit(limit))
+            return list(result.scalars().all())
 
     async def get_match(self, user_id: UUID, job_id: UUID) -> JobMatch | None:
         result = await self._session.execute(
@@ -92,9 +574,47 @@ class SQLAlchemyJobRepository(JobRepository):
         await self._session.flush()
         return match
 
+    async def upsert_matches(self, matches: list[dict[str, Any]]) -> None:
+        """Insert or refresh scores in one statement, keeping user status"""
+        if not matches:
+            return
+        stmt = insert(JobMatch)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_job_matches_user_id_job_id",
+            set_={
+                "overall_score": stmt.excluded.overall_score,
+                "vector_score": stmt.excluded.vector_score,
+                "analysis": stmt.excluded.analysis,
+                "updated_at": func.now(),
+                "deleted_at": None,
+                "version": JobMatch.version + 1,
+            },
+        )
+        await self._session.execute(stmt, matches)
+
+    async def prune_user_matches(self, user_id: UUID, keep_job_ids: list[UUID]) -> int:
+        """Soft-delete pending matches that fell out of the user's feed"""
+        result = await self._session.execute(
+            update(JobMatch)
+            .where(
+                JobMatch.user_id == user_id,
+                JobMatch.status == "pending",
+                JobMatch.deleted_at.is_(None),
+                JobMatch.job_id.not_in(keep_job_ids),
+            )
+            .values(deleted_at=datetime.now(UTC))
+        )
+        return int(result.rowcount or 0)
+
     async def get_user_matches(
-        self, user_id: UUID, status: str | None = None, limit: int = 20, offset: int = 0
-    ) -> list[JobMatch]:
+        self,
+        user_id: UUID,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> Page[JobMatch]:
+        """User's matches best first, keyset-paged on (overall_score, id)"""
         stmt = (
             select(JobMatch)
             .where(JobMatch.user_id == user_id, JobMatch.deleted_at.is_(None))
@@ -104,7 +624,75 @@ class SQLAlchemyJobRepository(JobRepository):
         if status:
             stmt = stmt.where(JobMatch.status == status)
 
-        stmt = stmt.order_by(JobMatch.overall_score.desc())
+        if cursor:
+            key = decode_cursor(cursor, "score")
+            stmt = stmt.where(
+                keyset_after(
+                    [JobMatch.overall_score, JobMatch.id], key, descending=True
+                )
+            )
+            offset = 0
 
-        result = await self._session.execute(stmt.limit(limit).offset(offset))
-        return list(result.scalars().all())
+        stmt = stmt.order_by(JobMatch.overall_score.desc(), JobMatch.id.desc())
+
+        result = await self._session.execute(stmt.limit(limit + 1).offset(offset))
+        matches = list(result.scalars().all())
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            next_cursor = encode_cursor(
+                "score", [matches[-1].overall_score, matches[-1].id]
+            )
+        return Page(matches, next_cursor)
+
+
+class SQLAlchemySkillEmbeddingRepository(SkillEmbeddingRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_many(self, names: list[str]) -> dict[str, list[float]]:
+        if not names:
+            return {}
+        result = await self._session.execute(
+            select(SkillEmbedding.name, SkillEmbedding.embedding).where(
+                SkillEmbedding.name.in_(names), SkillEmbedding.deleted_at.is_(None)
+            )
+        )
+        return {name: list(embedding) for name, embedding in result.all()}
+
+    async def save_many(self, embeddings: dict[str, list[float]]) -> None:
+        # An over-long name would fail the whole INSERT, and the transaction
+        embeddings = {
+            name: embedding
+            for name, embedding in embeddings.items()
+            if len(name) <= SKILL_NAME_MAX_LENGTH
+        }
+        if not embeddings:
+            return
+        # Concurrent workers may embed the same new skill; first write wins
+        stmt = insert(SkillEmbedding).on_conflict_do_nothing(index_elements=["name"])
+        await self._session.execute(
+            stmt,
+            [
+                {"name": name, "embedding": embedding}
+                for name, embedding in embeddings.items()
+            ],
+        )
+
+
+class SQLAlchemyScrapeCursorRepository(ScrapeCursorRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_for_source(self, source: str) -> dict[str, ScrapeCursor]:
+        result = await self._session.execute(
+            select(ScrapeCursor).where(
+                ScrapeCursor.source == source, ScrapeCursor.deleted_at.is_(None)
+            )
+        )
+        return {cursor.board: cursor for cursor in result.scalars().all()}
+
+    async def save(self, cursor: ScrapeCursor) -> ScrapeCursor:
+        self._session.add(cursor)
+        await self._session.flush()
+        return cursor
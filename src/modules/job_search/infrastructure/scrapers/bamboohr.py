@@ -29,36 +29,42 @@ class BambooHRScraper(BaseScraper):
         _ = remote_only
         _ = posted_within_days
 
-        for company in self.COMPANY_BOARDS:
-            try:
-                jobs = await self._get_company_jobs(company)
-                for job in jobs:
-                    if not self._matches_keywords(job, keywords):
-                        continue
-                    # BambooHR JSON is limited, location needs parsing
-                    if location and not self._matches_location(job, location):
-                        continue
-
-                    # BambooHR public feed often lacks dates, assume recent?
-                    # Or skip date check if missing.
-                    if job.get("date"):
-                        # Date parsing depends on format
-                        pass
-
-                    yield self._to_raw_job(job, company)
-            except Exception as e:
-                self.logger.warning(f"Failed to scrape {company}: {e}")
-                continue
-
-    async def _get_company_jobs(self, company: str) -> list[dict]:
+        async def scrape_board(company: str) -> list[RawJob]:
+            return [
+                self._to_raw_job(job, company)
+                for job in await self._get_company_jobs(company)
+                if self._matches_filters(job, keywords, location)
+            ]
+
+        async for job in self._fan_out_boards(self.COMPANY_BOARDS, scrape_board):
+            yield job
+
+    def _matches_filters(
+        self, job: dict, keywords: list[str], location: str | None
+    ) -> bool:
+        if not self._matches_keywords(job, keywords):
+            return False
+        # BambooHR JSON is limited, location needs parsing
+        if location and not self._matches_location(job, location):
+            return False
+
+        # BambooHR public feed often lacks dates, assume recent?
+        # Or skip date check if missing.
+        if job.get("date"):
+            # Date parsing depends on format
+            pass
+
+        return True
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
         url = f"https://{company}.bamboohr.com/jobs/embed/?json=1"
-        try:
-            data = await self._make_request(url)
-            return data.get("jobs", []) if isinstance(data, dict) else []
-        except ScraperError:
-            return []
-        except Exception:
-            return []
+        # None when the board is unchanged since the last crawl
+        data = await self._make_request(url, conditional=True)
+        if data is None:
+            return None
+        if not isinstance(data, dict):
+            raise ScraperError(f"Unexpected BambooHR response for {company}")
+        return data.get("jobs", [])
 
     async def get_job_details(self, external_id: str) -> RawJob:
         # BambooHR embed feed doesn't give full details easily
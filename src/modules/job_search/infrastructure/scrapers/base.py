@@ -1,13 +1,43 @@
+import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 import aiohttp
 from pydantic import BaseModel
 
-from src.modules.job_search.infrastructure.scrapers.rate_limiter import RateLimiter
+from src.modules.job_search.domain.normalization import (
+    normalize_location,
+    parse_salary,
+)
+from src.modules.job_search.infrastructure.scrapers.html_text import (
+    html_text_service,
+)
+from src.modules.job_search.infrastructure.scrapers.http_client import (
+    client_timeout,
+)
+from src.modules.job_search.infrastructure.scrapers.rate_limiter import (
+    RateLimiter,
+    parse_retry_after,
+)
+from src.modules.job_search.infrastructure.scrapers.validator_cache import (
+    CachedValidators,
+    ResponseValidatorCache,
+    body_digest,
+)
+
+T = TypeVar("T")
+
+# Validators fetched for the board being listed, held until it is persisted
+_staged_validators: ContextVar[dict[str, CachedValidators] | None] = ContextVar(
+    "staged_validators", default=None
+)
 
 
 @dataclass
@@ -29,6 +59,18 @@ class RawJob:
     raw_data: dict  # Original response for debugging
 
 
+@dataclass
+class BoardListing:
+    """Every posting currently on one company board"""
+
+    board: str
+    # Raw postings as returned by the ATS; None when the board is unchanged
+    # since the last conditional fetch
+    postings: list[dict] | None
+    # Validators from this fetch, not yet stored; see save_validators()
+    validators: dict[str, CachedValidators] = field(default_factory=dict)
+
+
 class ScraperConfig(BaseModel):
     """Configuration for scrapers"""
 
@@ -37,6 +79,10 @@ class ScraperConfig(BaseModel):
     )
     timeout_seconds: int = 30
     proxy_url: str | None = None
+    # Boards fetched at once; requests are still paced by the RateLimiter
+    max_concurrent_boards: int = 8
+    # Retries of a request answered with 429, after honouring Retry-After
+    max_rate_limit_retries: int = 2
 
 
 class ScraperError(Exception):
@@ -48,15 +94,20 @@ class ScraperError(Exception):
 class BaseScraper(ABC):
     """Base class for all job scrapers"""
 
+    # Company boards crawled by board-based ATS scrapers
+    COMPANY_BOARDS: list[str] = []
+
     def __init__(
         self,
         http_client: aiohttp.ClientSession,
         rate_limiter: RateLimiter,
         config: ScraperConfig,
+        validator_cache: ResponseValidatorCache | None = None,
     ):
         self.http = http_client
         self.rate_limiter = rate_limiter
         self.config = config
+        self.validator_cache = validator_cache
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @property
@@ -87,34 +138,217 @@ class BaseScraper(ABC):
         """Get full details for a specific job"""
         pass
 
-    async def _make_request(self, url: str, method: str = "GET", **kwargs) -> dict:
-        """Make rate-limited HTTP request"""
-        await self.rate_limiter.acquire(self.source_name)
+    async def _make_request(
+        self, url: str, method: str = "GET", conditional: bool = False, **kwargs
+    ) -> Any:
+        """
+        Make rate-limited HTTP request.
+
+        With conditional=True and a validator cache configured, the request
+        carries If-None-Match / If-Modified-Since and returns None when the
+        resource is unchanged since the last fetch (a 304, or a body with
+        the same digest), without parsing it. While fetch_boards() lists a
+        board, the new validators are staged on its BoardListing instead of
+        stored.
+
+        Requests are paced per host, so every scraper hitting the same ATS
+        shares one budget. A 429 slows that host down for Retry-After and
+        the request is retried up to config.max_rate_limit_retries times.
+        """
+        host = urlsplit(url).hostname or self.source_name
 
         headers = kwargs.pop("headers", {})
         headers["User-Agent"] = self.config.user_agent
 
+        cache = self.validator_cache if conditional else None
+        cached = await cache.get(url) if cache else None
+        if cached:
+            headers.update(cached.request_headers())
+
         kwargs["headers"] = headers
+        kwargs.setdefault("timeout", client_timeout(self.config.timeout_seconds))
 
         # Merge proxy from config if not explicit
         if self.config.proxy_url and "proxy" not in kwargs:
             kwargs["proxy"] = self.config.proxy_url
 
         try:
-            async with self.http.request(method, url, **kwargs) as response:
-                response.raise_for_status()
-                return await response.json()
+            for attempt in range(self.config.max_rate_limit_retries + 1):
+                await self.rate_limiter.acquire(host)
+                async with self.http.request(method, url, **kwargs) as response:
+                    if (
+                        response.status == 429
+                        and attempt < self.config.max_rate_limit_retries
+                    ):
+                        await self.rate_limiter.penalize(
+                            host, parse_retry_after(response.headers.get("Retry-After"))
+                        )
+                        continue
+                    if cached and response.status == 304:
+                        self.logger.debug(f"Not modified: {url}")
+                        return None
+                    response.raise_for_status()
+                    if not cache:
+                        return await response.json()
+
+                    body = await response.read()
+                    validators = CachedValidators(
+                        digest=body_digest(body),
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                    break
         except aiohttp.ClientError as e:
             self.logger.error(f"Request failed: {url} - {e}")
             raise ScraperError(f"Failed to fetch {url}") from e
 
+        unchanged = cached is not None and cached.digest == validators.digest
+        data = None if unchanged else json.loads(body)
+        # Refresh validators even when unchanged; the server may have
+        # started sending an ETag, or rotated it
+        staged = _staged_validators.get()
+        if staged is not None:
+            staged[url] = validators
+        else:
+            await cache.set(url, validators)
+        if unchanged:
+            self.logger.debug(f"Unchanged body: {url}")
+        return data
+
+    async def fetch_boards(
+        self, boards: Iterable[str] | None = None
+    ) -> AsyncIterator[BoardListing]:
+        """
+        Full listing of each board, concurrently, as each one finishes.
+
+        Boards that fail to fetch are logged and skipped, so a missing
+        listing never looks like a board whose postings were all removed.
+
+        Validators of conditional requests are staged on each listing and
+        only stored by save_validators(), once the consumer has persisted
+        the board. Otherwise a crash in between would make the next run
+        see the board as unchanged and lose its changes.
+        """
+
+        async def fetch(board: str) -> list[BoardListing]:
+            # Each board runs in its own task, so its context is its own
+            staged: dict[str, CachedValidators] = {}
+            _staged_validators.set(staged)
+            postings = await self._fetch_board(board)
+            return [BoardListing(board, postings, staged)]
+
+        async for listing in self._fan_out_boards(
+            self.COMPANY_BOARDS if boards is None else boards, fetch
+        ):
+            yield listing
+
+    async def save_validators(self, listing: BoardListing) -> None:
+        """Store the validators staged while listing a board"""
+        if self.validator_cache is None:
+            return
+        for url, validators in listing.validators.items():
+            await self.validator_cache.set(url, validators)
+        listing.validators.clear()
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
+        """Raw postings on a board, None if unchanged; raises on failure"""
+        raise NotImplementedError(f"{self.source_name} has no board listings")
+
+    async def _get_company_jobs(self, company: str) -> list[dict]:
+        """Postings on a board; empty when unchanged or on any failure"""
+        try:
+            return await self._fetch_board(company) or []
+        except Exception as e:
+            self.logger.debug(f"No listing for {company}: {e}")
+            return []
+
+    def parse_posting(self, posting: dict, board: str) -> RawJob:
+        """RawJob for a posting from a board listing"""
+        return self._to_raw_job(posting, board)
+
+    def external_id_for(self, posting: dict, board: str) -> str:
+        return f"{board}:{posting['id']}"
+
+    def posting_timestamp(self, posting: dict) -> datetime | None:
+        """Source timestamp of a posting, used for the posted_within_days cutoff"""
+        _ = posting
+        return None
+
+    def _to_raw_job(self, data: dict, company: str) -> RawJob:
+        raise NotImplementedError(f"{self.source_name} has no board listings")
+
+    def _description_html(self, posting: dict) -> str:
+        """HTML description of a posting, for sources that send markup"""
+        _ = posting
+        return ""
+
+    async def prepare_descriptions(self, postings: list[dict]) -> None:
+        """
+        Convert the postings' HTML to text off the event loop.
+
+        Call before building RawJobs in bulk; _clean_html then serves
+        each description from the shared memo.
+        """
+        await html_text_service.clean_many(
+            html for html in map(self._description_html, postings) if html
+        )
+
+    def _clean_html(self, html: str) -> str:
+        """Strip HTML tags and clean whitespace"""
+        return html_text_service.clean(html)
+
+    async def _fan_out_boards(
+        self,
+        boards: Iterable[str],
+        scrape_board: Callable[[str], Awaitable[list[T]]],
+    ) -> AsyncIterator[T]:
+        """
+        Scrape boards concurrently and yield results as each board finishes.
+
+        At most config.max_concurrent_boards boards are in flight. A board
+        that fails is logged and skipped without affecting the others.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_boards)
+
+        async def run(board: str) -> list[T]:
+            async with semaphore:
+                try:
+                    return await scrape_board(board)
+                except Exception as e:
+                    self.logger.warning(f"Failed to scrape {board}: {e}")
+                    return []
+
+        tasks = [asyncio.create_task(run(board)) for board in boards]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for job in await finished:
+                    yield job
+        finally:
+            # The consumer may stop early; don't leave boards fetching
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _normalize_location(self, raw_location: str) -> dict:
         """Normalize location string to structured data"""
-        # Placeholder for normalization logic
-        return {"raw": raw_location}
+        normalized = normalize_location(raw_location)
+        place = normalized.primary
+        return {
+            "raw": raw_location,
+            "country": place.country if place else None,
+            "region": place.region if place else None,
+            "city": place.city if place else None,
+            "remote": normalized.remote,
+        }
 
     def _parse_salary(self, raw_salary: str) -> dict | None:
         """Parse salary string to structured range"""
-        # Placeholder
-        _ = raw_salary
-        return None
+        salary = parse_salary(raw_salary, free_text=False)
+        if salary is None:
+            return None
+        return {
+            "min": salary.minimum,
+            "max": salary.maximum,
+            "currency": salary.currency,
+            "period": salary.period,
+        }
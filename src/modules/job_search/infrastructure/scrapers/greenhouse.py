@@ -1,8 +1,6 @@
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 
-import bs4
-
 from src.modules.job_search.infrastructure.scrapers.base import (
     BaseScraper,
     RawJob,
@@ -45,53 +43,60 @@ class GreenhouseScraper(BaseScraper):
 
         cutoff_date = datetime.now(UTC) - timedelta(days=posted_within_days)
 
-        for company in self.COMPANY_BOARDS:
-            try:
-                jobs = await self._get_company_jobs(company)
-
-                for job in jobs:
-                    # Filter by keywords
-                    if not self._matches_keywords(job, keywords):
-                        continue
-
-                    # Filter by location
-                    if location and not self._matches_location(job, location):
-                        continue
-
-                    # Filter by remote
-                    if remote_only and not self._is_remote(job):
-                        continue
-
-                    # Filter by date (Greenhouse 'updated_at' is robust)
-                    if job.get("updated_at"):
-                        # Handle varied formats if needed, but usually ISO
-                        try:
-                            job_date = datetime.fromisoformat(
-                                job["updated_at"].replace("Z", "+00:00")
-                            )
-                            if job_date < cutoff_date:
-                                continue
-                        except ValueError:
-                            pass  # Skip date check if format fails
-
-                    yield self._to_raw_job(job, company)
-
-            except Exception as e:
-                self.logger.warning(f"Failed to scrape {company}: {e}")
-                continue
-
-    async def _get_company_jobs(self, company: str) -> list[dict]:
+        async def scrape_board(company: str) -> list[RawJob]:
+            jobs = [
+                job
+                for job in await self._get_company_jobs(company)
+                if self._matches_filters(
+                    job, keywords, location, remote_only, cutoff_date
+                )
+            ]
+            await self.prepare_descriptions(jobs)
+            return [self._to_raw_job(job, company) for job in jobs]
+
+        async for job in self._fan_out_boards(self.COMPANY_BOARDS, scrape_board):
+            yield job
+
+    def _matches_filters(
+        self,
+        job: dict,
+        keywords: list[str],
+        location: str | None,
+        remote_only: bool,
+        cutoff_date: datetime,
+    ) -> bool:
+        # Filter by keywords
+        if not self._matches_keywords(job, keywords):
+            return False
+
+        # Filter by location
+        if location and not self._matches_location(job, location):
+            return False
+
+        # Filter by remote
+        if remote_only and not self._is_remote(job):
+            return False
+
+        # Filter by date (Greenhouse 'updated_at' is robust)
+        job_date = self.posting_timestamp(job)
+        return job_date is None or job_date >= cutoff_date
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
         """Get all jobs for a specific company board"""
         url = f"{self.base_url}/{company}/jobs"
-
+        data = await self._make_request(url, conditional=True)
+        if data is None:  # Board unchanged since the last crawl
+            return None
+        return data.get("jobs", [])
+
+    def posting_timestamp(self, posting: dict) -> datetime | None:
+        if not posting.get("updated_at"):
+            return None
+        # Handle varied formats if needed, but usually ISO
         try:
-            data = await self._make_request(url)
-            return data.get("jobs", [])
-        except ScraperError:
-            return []
-        # Greenhouse sometimes wraps differently or returns 404 if company invalid
-        except Exception:
-            return []
+            return datetime.fromisoformat(posting["updated_at"].replace("Z", "+00:00"))
+        except ValueError:
+            return None
 
     async def get_job_details(self, external_id: str) -> RawJob:
         """Get full job details including description"""
@@ -104,6 +109,7 @@ class GreenhouseScraper(BaseScraper):
         url = f"{self.base_url}/{company}/jobs/{job_id}"
         data = await self._make_request(url)
 
+        await self.prepare_descriptions([data])
         return self._to_raw_job(data, company)
 
     def _to_raw_job(self, data: dict, company: str) -> RawJob:
@@ -128,12 +134,8 @@ class GreenhouseScraper(BaseScraper):
             raw_data=data,
         )
 
-    def _clean_html(self, html: str) -> str:
-        """Strip HTML tags and clean whitespace"""
-        if not html:
-            return ""
-        soup = bs4.BeautifulSoup(html, "html.parser")
-        return soup.get_text(separator="\n", strip=True)
+    def _description_html(self, posting: dict) -> str:
+        return posting.get("content", "")
 
     def _extract_requirements(self, content: str) -> list[str]:
         """Extract requirements from job description"""
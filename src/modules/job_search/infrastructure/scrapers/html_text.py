@@ -0,0 +1,186 @@
+"""
+HTML-to-text conversion for scraped job descriptions.
+
+Uses the fastest parser available (selectolax, then lxml, then
+BeautifulSoup's html.parser), runs large batches in a process pool so a
+big board does not stall the event loop, and memoizes results by content
+hash since the same description is seen on every crawl.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import bs4
+
+logger = logging.getLogger(__name__)
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None  # type: ignore[assignment,misc]
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None  # type: ignore[assignment]
+
+if HTMLParser is not None:
+    BACKEND = "selectolax"
+elif lxml_html is not None:
+    BACKEND = "lxml"
+else:
+    BACKEND = "html.parser"
+
+
+def html_to_text(html: str) -> str:
+    """Visible text of an HTML fragment, one stripped text node per line"""
+    if not html:
+        return ""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css("script, style"):
+            node.decompose()
+        return tree.text(separator="\n", strip=True)
+    if lxml_html is not None:
+        try:
+            root = lxml_html.fragment_fromstring(html, create_parent="div")
+        except Exception:  # lxml rejects some inputs, e.g. bare XML declarations
+            root = None
+        if root is not None:
+            for node in root.iter("script", "style"):
+                node.drop_tree()
+            return "\n".join(t.strip() for t in root.itertext() if t.strip())
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    return soup.get_text(separator="\n", strip=True)
+
+
+def _html_to_text_batch(documents: list[str]) -> list[str]:
+    return [html_to_text(html) for html in documents]
+
+
+def _content_key(html: str) -> bytes:
+    return hashlib.blake2b(html.encode(), digest_size=16).digest()
+
+
+class HtmlTextService:
+    """
+    Memoized, pooled HTML-to-text conversion shared by the scrapers.
+
+    clean_many() converts a batch off the event loop and fills the memo,
+    so the synchronous clean() used while building RawJobs is a lookup.
+    """
+
+    # Batches smaller than this are converted inline; a pool round trip
+    # costs more than parsing a few short fragments
+    INLINE_MAX_CHARS = 20_000
+    # Documents per task submitted to the pool
+    CHUNK_SIZE = 64
+
+    def __init__(self, max_workers: int | None = None, memo_size: int = 8192):
+        self.max_workers = max_workers
+        self.memo_size = memo_size
+        self._memo: OrderedDict[bytes, str] = OrderedDict()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_failed = False
+
+    def clean(self, html: str) -> str:
+        """Text for html, from the memo when it was seen before"""
+        if not html:
+            return ""
+        key = _content_key(html)
+        text = self._memo_get(key)
+        if text is None:
+            text = html_to_text(html)
+            self._memo_put(key, text)
+        return text
+
+    async def clean_many(self, documents: Iterable[str]) -> list[str]:
+        """Texts for a batch of documents, converted off the event loop"""
+        batch = list(documents)
+
+        pending: dict[bytes, str] = {}
+        for html in batch:
+            if not html:
+                continue
+            key = _content_key(html)
+            if key not in pending and self._memo_get(key) is None:
+                pending[key] = html
+
+        if pending:
+            texts = await self._convert(list(pending.values()))
+            for key, text in zip(pending, texts, strict=True):
+                self._memo_put(key, text)
+
+        return [self.clean(html) for html in batch]
+
+    async def _convert(self, documents: list[str]) -> list[str]:
+        if sum(len(html) for html in documents) <= self.INLINE_MAX_CHARS:
+            return _html_to_text_batch(documents)
+
+        loop = asyncio.get_running_loop()
+        chunks = [
+            documents[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(documents), self.CHUNK_SIZE)
+        ]
+        executor = self._executor()
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _html_to_text_batch, chunk)
+                    for chunk in chunks
+                )
+            )
+        except (BrokenProcessPool, OSError, RuntimeError, AssertionError) as e:
+            # The pool failed to start its workers; fall back to threads,
+            # which still free the loop
+            logger.warning(f"HTML process pool unavailable, using threads: {e}")
+            self._pool_failed = True
+            self.shutdown()
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_html_to_text_batch, chunk) for chunk in chunks)
+            )
+        return [text for chunk in results for text in chunk]
+
+    def _executor(self) -> Executor | None:
+        """Process pool, or None (the loop's default thread pool)"""
+        if self._pool_failed:
+            return None
+        if multiprocessing.current_process().daemon:
+            # Daemonic processes (e.g. Celery prefork children) may not have
+            # children; spawning pool workers would raise AssertionError
+            self._pool_failed = True
+            return None
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Cannot start HTML process pool: {e}")
+                self._pool_failed = True
+        return self._pool
+
+    def _memo_get(self, key: bytes) -> str | None:
+        text = self._memo.get(key)
+        if text is not None:
+            self._memo.move_to_end(key)
+        return text
+
+    def _memo_put(self, key: bytes, text: str) -> None:
+        self._memo[key] = text
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Process-wide service shared by all scrapers
+html_text_service = HtmlTextService()
@@ -0,0 +1,95 @@
+"""
+Process-wide HTTP session for the scrapers.
+
+One aiohttp.ClientSession over one TCPConnector is shared by every
+scraper in the process, so board fetches, retries and later tasks reuse
+warm keep-alive (and TLS) connections and cached DNS answers instead of
+handshaking per task. A session is bound to the event loop it was created
+on; asking from a different loop replaces it.
+"""
+
+import asyncio
+import logging
+
+import aiohttp
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # noqa: F401  # aiohttp decodes br responses when present
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+def client_timeout(timeout_seconds: float) -> aiohttp.ClientTimeout:
+    """Overall deadline per request, with a tighter bound on connecting"""
+    return aiohttp.ClientTimeout(
+        total=timeout_seconds,
+        connect=min(10.0, timeout_seconds),
+        sock_read=timeout_seconds,
+    )
+
+
+class ScraperHttpClient:
+    """Lazily created, loop-bound shared ClientSession"""
+
+    DEFAULT_TIMEOUT_SECONDS = 30
+
+    def __init__(self):
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _connector(self) -> aiohttp.TCPConnector:
+        config = settings.scraper
+        return aiohttp.TCPConnector(
+            limit=config.CONNECTION_LIMIT,
+            limit_per_host=config.CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=config.KEEPALIVE_SECONDS,
+            use_dns_cache=config.DNS_CACHE_TTL > 0,
+            ttl_dns_cache=config.DNS_CACHE_TTL or None,
+        )
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Shared session for the running loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed:
+            if self._loop is loop:
+                return self._session
+            # The old loop is gone or elsewhere; its sockets cannot be
+            # reused from here
+            logger.debug("Event loop changed, replacing scraper HTTP session")
+            self.reset()
+
+        self._session = aiohttp.ClientSession(
+            connector=self._connector(),
+            timeout=client_timeout(self.DEFAULT_TIMEOUT_SECONDS),
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            auto_decompress=True,
+        )
+        self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session; must run on the loop that created it"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def reset(self) -> None:
+        """
+        Forget the session without closing it.
+
+        For a forked child or a dead loop, where the inherited session
+        cannot be awaited on.
+        """
+        self._session = None
+        self._loop = None
+
+
+# Shared by all scrapers in the process
+scraper_http = ScraperHttpClient()
@@ -1,8 +1,6 @@
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 
-import bs4
-
 from src.modules.job_search.infrastructure.scrapers.base import (
     BaseScraper,
     RawJob,
@@ -39,43 +37,58 @@ class LeverScraper(BaseScraper):
     ) -> AsyncIterator[RawJob]:
         cutoff_date = datetime.now(UTC) - timedelta(days=posted_within_days)
 
-        for company in self.COMPANY_BOARDS:
-            try:
-                jobs = await self._get_company_jobs(company)
-                for job in jobs:
-                    if not self._matches_keywords(job, keywords):
-                        continue
-                    if location and not self._matches_location(job, location):
-                        continue
-                    if remote_only and not self._is_remote(job):
-                        continue
-
-                    # Lever timestamp is milliseconds integer
-                    created_at = job.get("createdAt")
-                    if created_at:
-                        job_date = datetime.fromtimestamp(created_at / 1000, tz=UTC)
-                        if job_date < cutoff_date:
-                            continue
-
-                    yield self._to_raw_job(job, company)
-            except Exception as e:
-                self.logger.warning(f"Failed to scrape {company}: {e}")
-                continue
-
-    async def _get_company_jobs(self, company: str) -> list[dict]:
+        async def scrape_board(company: str) -> list[RawJob]:
+            jobs = [
+                job
+                for job in await self._get_company_jobs(company)
+                if self._matches_filters(
+                    job, keywords, location, remote_only, cutoff_date
+                )
+            ]
+            await self.prepare_descriptions(jobs)
+            return [self._to_raw_job(job, company) for job in jobs]
+
+        async for job in self._fan_out_boards(self.COMPANY_BOARDS, scrape_board):
+            yield job
+
+    def _matches_filters(
+        self,
+        job: dict,
+        keywords: list[str],
+        location: str | None,
+        remote_only: bool,
+        cutoff_date: datetime,
+    ) -> bool:
+        if not self._matches_keywords(job, keywords):
+            return False
+        if location and not self._matches_location(job, location):
+            return False
+        if remote_only and not self._is_remote(job):
+            return False
+
+        job_date = self.posting_timestamp(job)
+        return job_date is None or job_date >= cutoff_date
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
         url = f"{self.base_url}/{company}?mode=json"
-        try:
-            data = await self._make_request(url)
-            return data if isinstance(data, list) else []
-        except ScraperError:
-            return []
-        except Exception:
-            return []
+        # None when the board is unchanged since the last crawl
+        data = await self._make_request(url, conditional=True)
+        if data is None:
+            return None
+        if not isinstance(data, list):
+            raise ScraperError(f"Unexpected Lever response for {company}")
+        return data
+
+    def posting_timestamp(self, posting: dict) -> datetime | None:
+        # Lever timestamp is milliseconds integer
+        created_at = posting.get("createdAt")
+        return datetime.fromtimestamp(created_at / 1000, tz=UTC) if created_at else None
 
     async def get_job_details(self, external_id: str) -> RawJob:
         company, job_id = external_id.split(":")
         url = f"{self.base_url}/{company}/{job_id}"
         data = await self._make_request(url)
+        await self.prepare_descriptions([data])
         return self._to_raw_job(data, company)
 
     def _to_raw_job(self, data: dict, company: str) -> RawJob:
@@ -85,11 +98,9 @@ class LeverScraper(BaseScraper):
             title=data["text"],
             company_name=company.title(),  # Lever JSON often omits company name
             location=data.get("categories", {}).get("location", ""),
-            description=self._clean_html(
-                data.get("descriptionPlain", data.get("description", ""))
-            ),
+            description=self._clean_html(self._description_html(data)),
             requirements=[],
-            salary_range=None,
+            salary_range=self._salary_range(data),
             posted_date=datetime.fromtimestamp(data["createdAt"] / 1000, tz=UTC)
             if data.get("createdAt")
             else None,
@@ -99,11 +110,18 @@ class LeverScraper(BaseScraper):
             raw_data=data,
         )
 
-    def _clean_html(self, html: str) -> str:
-        if not html:
-            return ""
-        soup = bs4.BeautifulSoup(html, "html.parser")
-        return soup.get_text(separator="\n", strip=True)
+    def _salary_range(self, data: dict) -> str | None:
+        """Lever's salaryRange as text, e.g. "USD 90000 - 120000 per-year-salary" """
+        salary = data.get("salaryRange")
+        if not salary or salary.get("min") is None:
+            return None
+        return (
+            f"{salary.get('currency', '')} {salary['min']} - "
+            f"{salary.get('max', salary['min'])} {salary.get('interval', '')}"
+        ).strip()
+
+    def _description_html(self, posting: dict) -> str:
+        return posting.get("descriptionPlain", posting.get("description", ""))
 
     def _matches_keywords(self, job: dict, keywords: list[str]) -> bool:
         title = job.get("text", "").lower()
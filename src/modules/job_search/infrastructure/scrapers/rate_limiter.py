@@ -1,6 +1,48 @@
 
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
 from aiolimiter import AsyncLimiter
 
+from src.core.config import settings
+from src.core.infrastructure.redis import redis_provider
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_bucket(host: str) -> tuple[str, float]:
+    """
+    Bucket name and requests/second for a host.
+
+    A configured key matches the host itself or any subdomain, so all
+    *.bamboohr.com tenants share the "bamboohr.com" budget.
+    """
+    host = host.lower()
+    for pattern, rate in settings.scraper.RATE_LIMITS.items():
+        if host == pattern or host.endswith(f".{pattern}"):
+            return pattern, rate
+    return host, settings.scraper.DEFAULT_RATE
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=UTC)
+    return max(0.0, (until - datetime.now(UTC)).total_seconds())
+
 
 class RateLimiter:
     """
@@ -10,21 +52,165 @@ class RateLimiter:
 
     def __init__(self):
         self._limiters: dict[str, AsyncLimiter] = {}
-        # Default policy: 2 requests per second to be safe
-        self._default_rate = 2
-        self._default_period = 1.0
+        # Bucket -> monotonic time until which the host asked us to back off
+        self._blocked_until: dict[str, float] = {}
 
     def configure(self, source: str, rate: float, period: float = 1.0):
         """Configure custom rate limit for a specific source"""
         self._limiters[source] = AsyncLimiter(rate, period)
 
     def _get_limiter(self, source: str) -> AsyncLimiter:
-        if source not in self._limiters:
-            self._limiters[source] = AsyncLimiter(
-                self._default_rate, self._default_period
-            )
-        return self._limiters[source]
+        bucket, rate = resolve_bucket(source)
+        if source in self._limiters:
+            return self._limiters[source]
+        if bucket not in self._limiters:
+            self._limiters[bucket] = AsyncLimiter(rate, 1.0)
+        return self._limiters[bucket]
 
     async def acquire(self, source: str):
         """Acquire a token for the specified source"""
+        bucket, _ = resolve_bucket(source)
+        delay = self._blocked_until.get(bucket, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
         await self._get_limiter(source).acquire()
+
+    async def penalize(self, source: str, retry_after: float | None = None):
+        """Back off after a 429 from the source"""
+        bucket, _ = resolve_bucket(source)
+        until = time.monotonic() + (retry_after or 1.0)
+        self._blocked_until[bucket] = max(self._blocked_until.get(bucket, 0.0), until)
+
+
+# KEYS[1] bucket hash
+# ARGV rate (tokens/s), burst, recovery_ms, ttl_ms
+# Returns milliseconds to wait; 0 means a token was taken.
+ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = now_parts[1] * 1000 + math.floor(now_parts[2] / 1000)
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local recovery = tonumber(ARGV[3])
+
+local b = redis.call('HMGET', KEYS[1],
+    'tokens', 'ts', 'blocked_until', 'factor', 'penalized_at')
+local blocked_until = tonumber(b[3]) or 0
+if now < blocked_until then
+    return blocked_until - now
+end
+
+-- After a 429 the rate is scaled down, then recovers linearly to full
+local factor = tonumber(b[4]) or 1
+if factor < 1 then
+    local penalized_at = tonumber(b[5]) or now
+    factor = math.min(1, factor + (now - penalized_at) / recovery)
+end
+rate = rate * factor
+
+local tokens = tonumber(b[1])
+local ts = tonumber(b[2])
+if tokens == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return wait
+"""
+
+# KEYS[1] bucket hash
+# ARGV retry_after_ms, min_factor, recovery_ms, ttl_ms
+PENALIZE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = now_parts[1] * 1000 + math.floor(now_parts[2] / 1000)
+local recovery = tonumber(ARGV[3])
+
+local b = redis.call('HMGET', KEYS[1], 'factor', 'penalized_at', 'blocked_until')
+local factor = tonumber(b[1]) or 1
+if factor < 1 then
+    factor = math.min(1, factor + (now - (tonumber(b[2]) or now)) / recovery)
+end
+factor = math.max(tonumber(ARGV[2]), factor / 2)
+
+local blocked_until = math.max(tonumber(b[3]) or 0, now + tonumber(ARGV[1]))
+redis.call('HSET', KEYS[1], 'factor', tostring(factor), 'penalized_at', now,
+    'blocked_until', blocked_until, 'tokens', '0', 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return blocked_until - now
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Token bucket per host shared by every worker process through Redis.
+
+    Each acquire runs one atomic Lua script against the Redis clock, so N
+    Celery workers together stay within the configured rate instead of N
+    times it. A 429 halves the bucket's rate (down to MIN_FACTOR) and
+    blocks it for Retry-After; the rate then climbs back to full over
+    RECOVERY_SECONDS. If Redis is unreachable, the in-process limiter
+    inherited from RateLimiter takes over.
+    """
+
+    KEY_PREFIX = "scraper:ratelimit"
+    MIN_FACTOR = 0.1
+    # Time to recover from MIN_FACTOR back to the full rate
+    RECOVERY_SECONDS = 300
+    DEFAULT_RETRY_AFTER = 5.0
+
+    def _key(self, bucket: str) -> str:
+        return f"{self.KEY_PREFIX}:{bucket}"
+
+    def _ttl_ms(self) -> int:
+        return self.RECOVERY_SECONDS * 1000 * 2
+
+    async def acquire(self, source: str):
+        """Acquire a token for the specified source"""
+        bucket, rate = resolve_bucket(source)
+        while True:
+            try:
+                wait_ms = await redis_provider.run_script(
+                    ACQUIRE_SCRIPT,
+                    keys=[self._key(bucket)],
+                    args=[
+                        rate,
+                        settings.scraper.BURST,
+                        self.RECOVERY_SECONDS * 1000 / (1 - self.MIN_FACTOR),
+                        self._ttl_ms(),
+                    ],
+                )
+            except Exception as e:
+                logger.debug(f"Redis rate limiter unavailable for {bucket}: {e}")
+                await super().acquire(source)
+                return
+            if not wait_ms:
+                return
+            await asyncio.sleep(int(wait_ms) / 1000)
+
+    async def penalize(self, source: str, retry_after: float | None = None):
+        """Back off after a 429 from the source"""
+        bucket, _ = resolve_bucket(source)
+        retry_after = retry_after or self.DEFAULT_RETRY_AFTER
+        try:
+            await redis_provider.run_script(
+                PENALIZE_SCRIPT,
+                keys=[self._key(bucket)],
+                args=[
+                    int(retry_after * 1000),
+                    self.MIN_FACTOR,
+                    self.RECOVERY_SECONDS * 1000 / (1 - self.MIN_FACTOR),
+                    self._ttl_ms(),
+                ],
+            )
+            logger.warning(f"Rate limited by {bucket}, backing off {retry_after}s")
+        except Exception as e:
+            logger.debug(f"Redis rate limiter unavailable for {bucket}: {e}")
+        await super().penalize(source, retry_after)
@@ -4,7 +4,6 @@ from datetime import UTC, datetime, timedelta
 from src.modules.job_search.infrastructure.scrapers.base import (
     BaseScraper,
     RawJob,
-    ScraperError,
 )
 
 
@@ -25,41 +24,52 @@ class SmartRecruitersScraper(BaseScraper):
     ) -> AsyncIterator[RawJob]:
         cutoff_date = datetime.now(UTC) - timedelta(days=posted_within_days)
 
-        for company in self.COMPANY_BOARDS:
-            try:
-                jobs = await self._get_company_jobs(company)
-                for job in jobs:
-                    if not self._matches_keywords(job, keywords):
-                        continue
-                    if location and not self._matches_location(job, location):
-                        continue
-                    if remote_only and not self._is_remote(job):
-                        continue
-
-                    if job.get("releasedDate"):
-                        try:
-                            job_date = datetime.fromisoformat(
-                                job["releasedDate"].replace("Z", "+00:00")
-                            )
-                            if job_date < cutoff_date:
-                                continue
-                        except ValueError:
-                            pass
-
-                    yield self._to_raw_job(job, company)
-            except Exception as e:
-                self.logger.warning(f"Failed to scrape {company}: {e}")
-                continue
-
-    async def _get_company_jobs(self, company: str) -> list[dict]:
+        async def scrape_board(company: str) -> list[RawJob]:
+            return [
+                self._to_raw_job(job, company)
+                for job in await self._get_company_jobs(company)
+                if self._matches_filters(
+                    job, keywords, location, remote_only, cutoff_date
+                )
+            ]
+
+        async for job in self._fan_out_boards(self.COMPANY_BOARDS, scrape_board):
+            yield job
+
+    def _matches_filters(
+        self,
+        job: dict,
+        keywords: list[str],
+        location: str | None,
+        remote_only: bool,
+        cutoff_date: datetime,
+    ) -> bool:
+        if not self._matches_keywords(job, keywords):
+            return False
+        if location and not self._matches_location(job, location):
+            return False
+        if remote_only and not self._is_remote(job):
+            return False
+
+        job_date = self.posting_timestamp(job)
+        return job_date is None or job_date >= cutoff_date
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
         url = f"{self.base_url}/{company}/postings"
+        data = await self._make_request(url, conditional=True)
+        if data is None:  # Board unchanged since the last crawl
+            return None
+        return data.get("content", [])
+
+    def posting_timestamp(self, posting: dict) -> datetime | None:
+        if not posting.get("releasedDate"):
+            return None
         try:
-            data = await self._make_request(url)
-            return data.get("content", [])
-        except ScraperError:
-            return []
-        except Exception:
-            return []
+            return datetime.fromisoformat(
+                posting["releasedDate"].replace("Z", "+00:00")
+            )
+        except ValueError:
+            return None
 
     async def get_job_details(self, external_id: str) -> RawJob:
         company, job_id = external_id.split(":")
@@ -0,0 +1,75 @@
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+
+from src.core.infrastructure.redis import redis_provider
+
+logger = logging.getLogger(__name__)
+
+
+def body_digest(body: bytes) -> str:
+    """Stable fingerprint of a response body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+@dataclass
+class CachedValidators:
+    """HTTP validators and body digest from the last fetch of a URL"""
+
+    digest: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseValidatorCache:
+    """
+    Per-URL ETag / Last-Modified / body digest store in Redis.
+
+    Lets a scraper send conditional requests and recognise an unchanged
+    board without parsing it. "Unchanged" is relative to the last fetch
+    through the same namespace, so each consumer that needs the full
+    contents of a board (rather than only changes) should use its own.
+
+    Redis being unavailable degrades to unconditional requests.
+    """
+
+    KEY_PREFIX = "scraper:validators"
+    DEFAULT_TTL = 7 * 24 * 3600  # 7 days
+
+    def __init__(self, namespace: str = "crawl", ttl: int = DEFAULT_TTL):
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def _key(self, url: str) -> str:
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
+        return f"{self.KEY_PREFIX}:{self.namespace}:{url_hash}"
+
+    async def get(self, url: str) -> CachedValidators | None:
+        try:
+            cached = await redis_provider.get(self._key(url))
+        except Exception as e:
+            logger.debug(f"Validator cache read failed for {url}: {e}")
+            return None
+        if not cached:
+            return None
+        try:
+            return CachedValidators(**json.loads(cached))
+        except (TypeError, ValueError):
+            return None
+
+    async def set(self, url: str, validators: CachedValidators) -> None:
+        try:
+            await redis_provider.set(
+                self._key(url), json.dumps(asdict(validators)), expire=self.ttl
+            )
+        except Exception as e:
+            logger.debug(f"Validator cache write failed for {url}: {e}")
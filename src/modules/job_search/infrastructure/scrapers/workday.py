@@ -1,26 +1,90 @@
+import asyncio
+import re
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
+from src.core.config import settings
 from src.modules.job_search.infrastructure.scrapers.base import (
     BaseScraper,
     RawJob,
     ScraperError,
 )
 
+_POSTED_DAYS_AGO = re.compile(r"posted\s+(\d+)\+?\s+days?\s+ago", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class WorkdayTenant:
+    """A Workday career site, parsed from "{tenant}.{instance}/{site}" """
+
+    tenant: str
+    instance: str
+    site: str
+
+    @classmethod
+    def parse(cls, board: str) -> "WorkdayTenant":
+        try:
+            host, site = board.split("/", 1)
+            tenant, instance = host.split(".", 1)
+        except ValueError as e:
+            raise ScraperError(f"Invalid Workday board '{board}'") from e
+        return cls(tenant, instance, site)
+
+    @property
+    def host(self) -> str:
+        return f"{self.tenant}.{self.instance}.myworkdayjobs.com"
+
+    @property
+    def api_url(self) -> str:
+        return f"https://{self.host}/wday/cxs/{self.tenant}/{self.site}"
+
+    def posting_url(self, external_path: str) -> str:
+        return f"https://{self.host}/en-US/{self.site}{external_path}"
+
+
+def parse_posted_on(posted_on: str | None, today: datetime) -> datetime | None:
+    """
+    Absolute date from Workday's relative "Posted 3 Days Ago" labels.
+
+    "Posted 30+ Days Ago" only bounds the date, so it yields None.
+    """
+    if not posted_on:
+        return None
+    label = posted_on.lower()
+    day = today.replace(hour=0, minute=0, second=0, microsecond=0)
+    if "today" in label:
+        return day
+    if "yesterday" in label:
+        return day - timedelta(days=1)
+    match = _POSTED_DAYS_AGO.search(label)
+    if match and "+" not in label:
+        return day - timedelta(days=int(match.group(1)))
+    return None
+
 
 class WorkdayScraper(BaseScraper):
     """
-    Scraper for Workday.
-    Note: Workday does not have a public unified API for job boards.
-    Each company has a unique tenant URL and structure.
-    This scraper is a stub/skeleton for tenant-specific implementations.
+    Scraper for Workday career sites via the CXS JSON API.
+
+    Each tenant's site exposes POST {site}/jobs (paged search, at most
+    PAGE_SIZE per page) and GET {site}{externalPath} (one posting with its
+    description). Search pages are streamed; descriptions are fetched
+    concurrently only for postings that are new or changed.
+
+    Boards are "{tenant}.{instance}/{site}", configured under
+    SCRAPER_WORKDAY_TENANTS.
     """
 
     source_name = "workday"
-    base_url = "https://wd5.myworkdaysite.com/recruiting"  # Example common base
+    base_url = "https://{tenant}.{instance}.myworkdayjobs.com/wday/cxs"
 
-    # Workday scraping is complex and often requires Selenium/Playwright
-    # due to heavy JS and anti-bot.
-    # This implementation is a placeholder.
+    COMPANY_BOARDS = settings.scraper.WORKDAY_TENANTS
+
+    # Workday rejects search pages larger than 20
+    PAGE_SIZE = 20
+    # Detail requests in flight per board; the rate limiter still paces them
+    DETAIL_CONCURRENCY = 4
 
     async def search_jobs(
         self,
@@ -29,15 +93,197 @@ class WorkdayScraper(BaseScraper):
         remote_only: bool = False,
         posted_within_days: int = 7,
     ) -> AsyncIterator[RawJob]:
-        # Stub implementation
-        _ = keywords
-        _ = location
-        _ = remote_only
-        _ = posted_within_days
-        self.logger.warning("Workday scraper is a stub. No jobs will be returned.")
-        return
-        yield  # Empty generator
+        """Search across all configured Workday tenants"""
+
+        cutoff_date = datetime.now(UTC) - timedelta(days=posted_within_days)
+
+        async def scrape_board(board: str) -> list[RawJob]:
+            # Workday's full-text search narrows the pages for one keyword;
+            # several keywords are matched locally on the title instead
+            search_text = keywords[0] if len(keywords) == 1 else ""
+            jobs = []
+            async for page in self._iter_pages(board, search_text):
+                jobs.extend(
+                    job
+                    for job in page
+                    if self._matches_filters(
+                        job, keywords, location, remote_only, cutoff_date
+                    )
+                )
+            await self.prepare_descriptions(jobs)
+            return [
+                self._to_raw_job(job, board) for job in jobs if "jobPostingInfo" in job
+            ]
+
+        async for job in self._fan_out_boards(self.COMPANY_BOARDS, scrape_board):
+            yield job
+
+    def _matches_filters(
+        self,
+        job: dict,
+        keywords: list[str],
+        location: str | None,
+        remote_only: bool,
+        cutoff_date: datetime,
+    ) -> bool:
+        title = job.get("title", "").lower()
+        if keywords and not any(k.lower() in title for k in keywords):
+            return False
+        locations = (job.get("locationsText") or "").lower()
+        if location and location.lower() not in locations:
+            return False
+        if remote_only and not self._is_remote(job):
+            return False
+        posted = self.posting_timestamp(job)
+        return posted is None or posted >= cutoff_date
+
+    async def _iter_pages(
+        self, board: str, search_text: str = ""
+    ) -> AsyncIterator[list[dict]]:
+        """Search results page by page, normalized to listing postings"""
+        tenant = WorkdayTenant.parse(board)
+        today = datetime.now(UTC)
+        offset = 0
+        total: int | None = None
+        while total is None or offset < total:
+            data = await self._make_request(
+                f"{tenant.api_url}/jobs",
+                method="POST",
+                json={
+                    "appliedFacets": {},
+                    "limit": self.PAGE_SIZE,
+                    "offset": offset,
+                    "searchText": search_text,
+                },
+            )
+            if not isinstance(data, dict):
+                raise ScraperError(f"Unexpected Workday response for {board}")
+            postings = data.get("jobPostings") or []
+            # Only the first page reports the total
+            if total is None:
+                total = int(data.get("total") or 0)
+            if not postings:
+                break
+            yield [
+                self._summary(p, board, today)
+                for p in postings
+                if p.get("externalPath")
+            ]
+            offset += len(postings)
+
+    def _summary(self, posting: dict, board: str, today: datetime) -> dict:
+        """
+        Listing posting keyed by its externalPath.
+
+        The relative "postedOn" label is replaced by an absolute date, so a
+        posting's fingerprint does not change every day it stays listed.
+        """
+        posted = parse_posted_on(posting.get("postedOn"), today)
+        return {
+            "id": posting["externalPath"],
+            "board": board,
+            "title": posting.get("title", ""),
+            "locationsText": posting.get("locationsText", ""),
+            "remoteType": posting.get("remoteType"),
+            "bulletFields": posting.get("bulletFields", []),
+            "postedDate": posted.date().isoformat() if posted else None,
+        }
+
+    async def _fetch_board(self, company: str) -> list[dict] | None:
+        postings: list[dict] = []
+        async for page in self._iter_pages(company):
+            postings.extend(page)
+        return postings
+
+    def posting_timestamp(self, posting: dict) -> datetime | None:
+        info = posting.get("jobPostingInfo") or {}
+        value = info.get("startDate") or posting.get("postedDate")
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value).replace(tzinfo=UTC)
+        except ValueError:
+            return None
+
+    async def prepare_descriptions(self, postings: list[dict]) -> None:
+        """
+        Fetch each posting's details, then convert their HTML.
+
+        Postings whose details cannot be fetched are left without
+        "jobPostingInfo" and fail to parse, so they are retried next sync.
+        """
+        semaphore = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+
+        async def fetch(posting: dict) -> None:
+            async with semaphore:
+                try:
+                    detail = await self._fetch_detail(posting["board"], posting["id"])
+                except (ScraperError, KeyError) as e:
+                    self.logger.warning(f"No Workday details for {posting['id']}: {e}")
+                    return
+            posting["jobPostingInfo"] = detail.get("jobPostingInfo") or {}
+            posting["hiringOrganization"] = detail.get("hiringOrganization") or {}
+
+        await asyncio.gather(*(fetch(p) for p in postings if "jobPostingInfo" not in p))
+        await super().prepare_descriptions(postings)
+
+    async def _fetch_detail(self, board: str, external_path: str) -> dict:
+        tenant = WorkdayTenant.parse(board)
+        data = await self._make_request(f"{tenant.api_url}{external_path}")
+        if not isinstance(data, dict):
+            raise ScraperError(f"Unexpected Workday detail for {external_path}")
+        return data
 
     async def get_job_details(self, external_id: str) -> RawJob:
-        _ = external_id
-        raise ScraperError("Workday scraper not fully implemented")
+        # external_id format: "{tenant}.{instance}/{site}:{externalPath}"
+        try:
+            board, external_path = external_id.split(":", 1)
+        except ValueError as e:
+            raise ScraperError(f"Invalid external_id format: {external_id}") from e
+
+        detail = await self._fetch_detail(board, external_path)
+        info = detail.get("jobPostingInfo") or {}
+        posting = {
+            "id": external_path,
+            "board": board,
+            "title": info.get("title", ""),
+            "locationsText": info.get("location", ""),
+            "remoteType": info.get("remoteType"),
+            "jobPostingInfo": info,
+            "hiringOrganization": detail.get("hiringOrganization") or {},
+        }
+        await super().prepare_descriptions([posting])
+        return self._to_raw_job(posting, board)
+
+    def parse_posting(self, posting: dict, board: str) -> RawJob:
+        if "jobPostingInfo" not in posting:
+            raise ScraperError(f"Details for {posting.get('id')} were not fetched")
+        return self._to_raw_job(posting, board)
+
+    def _to_raw_job(self, data: dict, company: str) -> RawJob:
+        tenant = WorkdayTenant.parse(company)
+        info = data["jobPostingInfo"]
+        organization = data.get("hiringOrganization") or {}
+        return RawJob(
+            external_id=f"{company}:{data['id']}",
+            source=self.source_name,
+            title=info.get("title") or data["title"],
+            company_name=organization.get("name") or tenant.tenant.title(),
+            location=info.get("location") or data.get("locationsText", ""),
+            description=self._clean_html(self._description_html(data)),
+            requirements=[],
+            salary_range=None,
+            posted_date=self.posting_timestamp(data),
+            apply_url=info.get("externalUrl") or tenant.posting_url(data["id"]),
+            remote_type="remote" if self._is_remote(data) else "onsite",
+            employment_type=info.get("timeType"),
+            raw_data=data,
+        )
+
+    def _description_html(self, posting: dict) -> str:
+        return (posting.get("jobPostingInfo") or {}).get("jobDescription", "")
+
+    def _is_remote(self, job: dict) -> bool:
+        remote_type = (job.get("remoteType") or "").lower()
+        locations = (job.get("locationsText") or "").lower()
+        return "remote" in remote_type or "remote" in locations
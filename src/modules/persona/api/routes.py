@@ -16,7 +16,7 @@ async def get_persona_service(
     db: AsyncSession = Depends(get_db),  # noqa: B008
 ) -> PersonaService:
     repository = SQLAlchemyPersonaRepository(db)
-    return PersonaService(repository)
+    return PersonaService(repository, db)
 
 
 @router.get("/me", response_model=PersonaResponse)
@@ -10,6 +10,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -80,6 +81,15 @@ class Persona(BaseModel):
     """Main model for candidate persona, including PII and preferences."""
 
     __tablename__ = "personas"
+    __table_args__ = (
+        Index(
+            "ix_personas_summary_embedding_hnsw",
+            "summary_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"summary_embedding": "vector_cosine_ops"},
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -132,6 +142,7 @@ class Persona(BaseModel):
         back_populates="persona",
         cascade="all, delete-orphan",
         uselist=False,
+        lazy="selectin",
     )
     behavioral_answers: Mapped[list["BehavioralAnswer"]] = relationship(
         "BehavioralAnswer",
@@ -151,6 +162,15 @@ class Experience(BaseModel):
     """Professional experience record."""
 
     __tablename__ = "persona_experiences"
+    __table_args__ = (
+        Index(
+            "ix_persona_experiences_experience_embedding_hnsw",
+            "experience_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"experience_embedding": "vector_cosine_ops"},
+        ),
+    )
 
     persona_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("personas.id"), index=True, nullable=False
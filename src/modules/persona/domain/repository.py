@@ -10,6 +10,10 @@ class PersonaRepository(Protocol):
 
     async def get_by_user_id(self, user_id: UUID) -> Persona | None: ...
 
+    async def get_nearest_by_embedding(
+        self, embedding: list[float], limit: int = 500
+    ) -> list[Persona]: ...
+
     async def save(self, persona: Persona) -> Persona: ...
 
     async def delete(self, persona_id: UUID) -> None: ...
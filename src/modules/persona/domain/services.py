@@ -1,15 +1,23 @@
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.events.event_bus import event_bus
 from src.modules.persona.domain.models import (
     Persona,
 )
 from src.modules.persona.domain.repository import PersonaRepository
 from src.modules.persona.domain.schemas import PersonaUpdate
+from src.modules.persona.events.events import PersonaUpdated
 
 
 class PersonaService:
-    def __init__(self, repository: PersonaRepository):
+    def __init__(
+        self, repository: PersonaRepository, session: AsyncSession | None = None
+    ):
         self._repository = repository
+        # Transaction the repository writes in; events wait for its commit
+        self._session = session
 
     async def get_persona_by_user_id(self, user_id: UUID) -> Persona | None:
         return await self._repository.get_by_user_id(user_id)
@@ -47,7 +55,16 @@ class PersonaService:
         # Trigger embedding update (placeholder for now)
         # TODO: Integrate with AI worker/service
 
-        return await self._repository.save(persona)
+        persona = await self._repository.save(persona)
+
+        # Lets job search refresh the precomputed matches
+        event = PersonaUpdated(user_id=user_id)
+        if self._session is not None:
+            event_bus.publish_after_commit(self._session, event)
+        else:
+            await event_bus.publish(event)
+
+        return persona
 
     def _calculate_completeness(self, persona: Persona) -> float:
         score = 0.0
@@ -0,0 +1,9 @@
+from uuid import UUID
+
+from src.core.events.event_bus import Event
+
+
+class PersonaUpdated(Event):
+    """Published after a persona is saved."""
+
+    user_id: UUID
@@ -1,9 +1,10 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.modules.persona.domain.models import Persona
+from src.core.database.vector_search import ef_search_for, vector_search_settings
+from src.modules.persona.domain.models import Experience, Persona
 from src.modules.persona.domain.repository import PersonaRepository
 
 
@@ -27,6 +28,64 @@ class SQLAlchemyPersonaRepository(PersonaRepository):
         )
         return result.scalar_one_or_none()
 
+    async def get_nearest_by_embedding(
+        self, embedding: list[float], limit: int = 500
+    ) -> list[Persona]:
+        """
+        Active personas whose query vector is closest to the embedding.
+
+        The query vector is the summary embedding, else the mean of the
+        experience embeddings, as JobMatcher uses when ranking jobs. The
+        summary branch is served by the HNSW index; the fallback branch
+        averages experiences for the (few) personas without a summary.
+        """
+        summary_distance = Persona.summary_embedding.cosine_distance(embedding)
+        by_summary = (
+            select(Persona.id, summary_distance.label("distance"))
+            .where(
+                Persona.deleted_at.is_(None),
+                Persona.summary_embedding.is_not(None),
+            )
+            .order_by(summary_distance)
+            .limit(limit)
+            .subquery("by_summary")
+        )
+        mean_experience = func.avg(
+            Experience.experience_embedding,
+            type_=Experience.experience_embedding.type,
+        )
+        mean_distance = mean_experience.cosine_distance(embedding)
+        by_experience = (
+            select(Persona.id, mean_distance.label("distance"))
+            .join(Experience, Experience.persona_id == Persona.id)
+            .where(
+                Persona.deleted_at.is_(None),
+                Persona.summary_embedding.is_(None),
+                Experience.deleted_at.is_(None),
+                Experience.experience_embedding.is_not(None),
+            )
+            .group_by(Persona.id)
+            .order_by(mean_distance)
+            .limit(limit)
+            .subquery("by_experience")
+        )
+        nearest = union_all(
+            select(by_summary.c.id, by_summary.c.distance),
+            select(by_experience.c.id, by_experience.c.distance),
+        ).subquery("nearest")
+
+        stmt = (
+            select(Persona)
+            .join(nearest, nearest.c.id == Persona.id)
+            .order_by(nearest.c.distance)
+            .limit(limit)
+        )
+        async with vector_search_settings(
+            self._session, ef_search=ef_search_for(limit)
+        ):
+            result = await self._session.execute(stmt)
+            return list(result.scalars().all())
+
     async def save(self, persona: Persona) -> Persona:
         self._session.add(persona)
         await self._session.flush()  # Ensure ID is generated
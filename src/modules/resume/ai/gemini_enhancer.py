@@ -1,15 +1,17 @@
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable
 from typing import Any, TypeVar, cast
 
 from pydantic import BaseModel, Field
 
 from src.core.ai.gemini_client import GeminiClient
-from src.core.infrastructure.redis import redis_provider
 from src.modules.persona.domain.models import Persona
 from src.modules.resume.ai.prompts import (
     ATS_OPTIMIZATION_PROMPT,
     BULLET_ENHANCEMENT_PROMPT,
+    BULLETS_ENHANCEMENT_PROMPT,
     IMPROVEMENT_SUGGESTION_PROMPT,
     METRIC_INJECTION_PROMPT,
     PROFESSIONAL_SUMMARY_PROMPT,
@@ -19,6 +21,12 @@ from src.modules.resume.domain.models import Resume, ResumeSection
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Enhancement prompts in flight at once for one resume
+ENHANCE_CONCURRENCY = 5
+# Bullets sent per prompt in packed mode
+BULLETS_PER_PROMPT = 10
 
 
 class EnhancedBullet(BaseModel):
@@ -29,6 +37,10 @@ class EnhancedBullet(BaseModel):
     confidence_score: float
 
 
+class EnhancedBulletList(BaseModel):
+    bullets: list[EnhancedBullet]
+
+
 class EnhancedSection(BaseModel):
     section_type: str
     original_content: dict[str, Any]
@@ -51,36 +63,19 @@ class ResumeEnhancer:
 
     def __init__(self, gemini_client: GeminiClient):
         self.client = gemini_client
-        self.cache_ttl = 86400  # 24 hours
 
-    async def _get_cached_or_generate(
-        self,
-        cache_key: str,
-        prompt: str,
-        schema: type[T] | None = None,
-        is_structured: bool = False,
+    async def _generate(
+        self, template: str, prompt: str, schema: type[T] | None = None
     ) -> Any:
-        """Helper to handle caching and AI generation."""
+        """Generation through the shared response cache, keyed by template."""
         try:
-            cached = await redis_provider.get(cache_key)
-            if cached:
-                logger.info(f"Cache hit for key: {cache_key}")
-                if is_structured and schema:
-                    return schema.model_validate_json(cached)
-                return cached
-        except Exception as e:
-            logger.error(f"Redis error: {str(e)}")
-
-        try:
-            if is_structured and schema:
-                result = await self.client.generate_structured(prompt, schema)
-                await redis_provider.set(
-                    cache_key, result.model_dump_json(), expire=self.cache_ttl
+            if schema is not None:
+                return await self.client.generate_structured(
+                    prompt, schema, task="resume_enhancement", cache_as=template
                 )
-                return result
-            result_text = await self.client.generate_text(prompt)
-            await redis_provider.set(cache_key, result_text, expire=self.cache_ttl)
-            return result_text
+            return await self.client.generate_text(
+                prompt, task="resume_enhancement", cache_as=template
+            )
         except Exception as e:
             logger.error(f"AI Generation error: {str(e)}")
             raise
@@ -89,15 +84,12 @@ class ResumeEnhancer:
         self, bullet: str, context: str = ""
     ) -> EnhancedBullet:
         """Enhances a single bullet point using the STAR method."""
-        cache_key = f"enhance:bullet:{hash(bullet + context)}"
         prompt = BULLET_ENHANCEMENT_PROMPT.format(original=bullet, context=context)
 
         try:
             return cast(
                 EnhancedBullet,
-                await self._get_cached_or_generate(
-                    cache_key, prompt, schema=EnhancedBullet, is_structured=True
-                ),
+                await self._generate("resume.enhance_bullet", prompt, EnhancedBullet),
             )
         except Exception:
             # Fallback to a basic structure if AI fails
@@ -108,23 +100,110 @@ class ResumeEnhancer:
                 confidence_score=0.0,
             )
 
-    async def enhance_full_section(self, section: ResumeSection) -> EnhancedSection:
+    async def enhance_bullets(
+        self, bullets: list[str], context: str = ""
+    ) -> list[EnhancedBullet]:
+        """Enhances several bullets with one prompt, in order."""
+        enhanced = await self._enhance_packed(bullets, context)
+        if enhanced is not None:
+            return enhanced
+        return list(
+            await asyncio.gather(
+                *(self.enhance_bullet_point(bullet, context) for bullet in bullets)
+            )
+        )
+
+    async def _enhance_packed(
+        self, bullets: list[str], context: str = ""
+    ) -> list[EnhancedBullet] | None:
+        """One prompt for all bullets; None when it fails or miscounts."""
+        numbered = "\n".join(f"{i}. {bullet}" for i, bullet in enumerate(bullets, 1))
+        prompt = BULLETS_ENHANCEMENT_PROMPT.format(bullets=numbered, context=context)
+        try:
+            result = cast(
+                EnhancedBulletList,
+                await self._generate(
+                    "resume.enhance_bullets", prompt, EnhancedBulletList
+                ),
+            )
+            if len(result.bullets) == len(bullets):
+                return result.bullets
+            logger.warning(
+                f"Packed enhancement returned {len(result.bullets)} bullets "
+                f"for {len(bullets)}; enhancing one by one"
+            )
+        except Exception:
+            logger.warning("Packed enhancement failed; enhancing one by one")
+        return None
+
+    async def enhance_full_section(
+        self, section: ResumeSection, packed: bool = False
+    ) -> EnhancedSection:
         """Enhances all bullets in a section (e.g., Experience)."""
+        (enhanced,) = await self.enhance_sections([section], packed=packed)
+        return enhanced
+
+    async def enhance_resume(
+        self, resume: Resume, packed: bool = True
+    ) -> list[EnhancedSection]:
+        """Enhances every section of a resume, packed by default."""
+        return await self.enhance_sections(list(resume.sections), packed=packed)
+
+    async def enhance_sections(
+        self,
+        sections: list[ResumeSection],
+        packed: bool = False,
+        concurrency: int = ENHANCE_CONCURRENCY,
+    ) -> list[EnhancedSection]:
+        """
+        Enhances the bullets of several sections concurrently.
+
+        At most `concurrency` prompts are in flight across all sections.
+        Packed mode sends BULLETS_PER_PROMPT bullets per prompt, so a whole
+        resume takes a couple of round trips. Results keep bullet order.
+        """
         # Note: This implementation assumes bullets are in section.content["items"]
-        items = section.content.get("items", [])
-        enhanced_bullets = []
-
-        for item in items:
-            description = item.get("description", "")
-            if description:
-                enhanced = await self.enhance_bullet_point(description)
-                enhanced_bullets.append(enhanced)
-
-        return EnhancedSection(
-            section_type=str(section.section_type),
-            original_content=section.content,
-            enhanced_bullets=enhanced_bullets,
+        descriptions = [
+            [
+                item.get("description", "")
+                for item in section.content.get("items", [])
+                if item.get("description", "")
+            ]
+            for section in sections
+        ]
+        bullets = [bullet for section in descriptions for bullet in section]
+        size = BULLETS_PER_PROMPT if packed else 1
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(call: Awaitable[R]) -> R:
+            async with semaphore:
+                return await call
+
+        async def enhance(chunk: list[str]) -> list[EnhancedBullet]:
+            if packed:
+                enhanced = await limited(self._enhance_packed(chunk))
+                if enhanced is not None:
+                    return enhanced
+            # Each single-bullet fallback takes its own slot
+            return list(
+                await asyncio.gather(
+                    *(limited(self.enhance_bullet_point(bullet)) for bullet in chunk)
+                )
+            )
+
+        chunks = await asyncio.gather(
+            *(enhance(bullets[i : i + size]) for i in range(0, len(bullets), size))
         )
+        enhanced = iter([bullet for chunk in chunks for bullet in chunk])
+
+        return [
+            EnhancedSection(
+                section_type=str(section.section_type),
+                original_content=section.content,
+                enhanced_bullets=[next(enhanced) for _ in section_bullets],
+            )
+            for section, section_bullets in zip(sections, descriptions, strict=True)
+        ]
 
     async def generate_professional_summary(self, persona: Persona) -> str:
         """Creates a compelling professional summary from persona data."""
@@ -148,21 +227,18 @@ class ResumeEnhancer:
             achievements="; ".join(achievements[:3]),
         )
 
-        cache_key = f"summary:{persona.user_id}"
-        return cast(str, await self._get_cached_or_generate(cache_key, prompt))
+        return cast(str, await self._generate("resume.summary", prompt))
 
     async def inject_metrics(self, achievement: str) -> str:
         """Suggests quantifiable metrics for an achievement."""
-        cache_key = f"metrics:{hash(achievement)}"
         prompt = METRIC_INJECTION_PROMPT.format(achievement=achievement)
-        return cast(str, await self._get_cached_or_generate(cache_key, prompt))
+        return cast(str, await self._generate("resume.inject_metrics", prompt))
 
     async def optimize_for_ats(self, content: str, target_keywords: list[str]) -> str:
         """Injects keywords naturally for ATS optimization."""
         keywords_str = ", ".join(target_keywords)
-        cache_key = f"ats:opt:{hash(content + keywords_str)}"
         prompt = ATS_OPTIMIZATION_PROMPT.format(content=content, keywords=keywords_str)
-        return cast(str, await self._get_cached_or_generate(cache_key, prompt))
+        return cast(str, await self._generate("resume.optimize_for_ats", prompt))
 
     async def suggest_improvements(self, resume: Resume) -> list[Suggestion]:
         """Audits resume and provides improvement suggestions."""
@@ -173,15 +249,12 @@ class ResumeEnhancer:
                 f"\nSection: {section.section_type}\n{json.dumps(section.content)}\n"
             )
 
-        cache_key = f"audit:{resume.id}:{resume.version}"
         prompt = IMPROVEMENT_SUGGESTION_PROMPT.format(content=content_text)
 
         try:
             result = cast(
                 SuggestionList,
-                await self._get_cached_or_generate(
-                    cache_key, prompt, schema=SuggestionList, is_structured=True
-                ),
+                await self._generate("resume.audit", prompt, SuggestionList),
             )
             return result.suggestions
         except Exception:
@@ -25,6 +25,37 @@ Return JSON:
 }}
 """
 
+BULLETS_ENHANCEMENT_PROMPT = """
+You are an expert resume writer. Enhance each of these numbered bullet points
+using the STAR method (Situation, Task, Action, Result).
+
+Bullets:
+{bullets}
+Job Context: {context}
+
+Requirements:
+1. Start each bullet with a strong action verb.
+2. Include quantifiable metrics (percentages, dollar amounts, time saved)
+   where possible.
+3. Focus on impact and results, not just duties.
+4. Keep each bullet under 2 lines.
+5. Use industry-relevant keywords.
+6. Return exactly one result per bullet, in the same order.
+
+Return JSON:
+{{
+    "bullets": [
+        {{
+            "enhanced": "improved bullet point",
+            "action_verb": "verb used",
+            "metrics_added": true/false,
+            "keywords_included": ["keyword1", "keyword2"],
+            "confidence_score": 0.0-1.0
+        }}
+    ]
+}}
+"""
+
 PROFESSIONAL_SUMMARY_PROMPT = """
 Create a compelling professional summary for this candidate:
 
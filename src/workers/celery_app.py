@@ -1,6 +1,9 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from src.workers import event_loop
 
 celery_app = Celery(
     "stellapply_workers",
@@ -8,6 +11,7 @@ celery_app = Celery(
     backend=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
     include=[
         "src.workers.tasks.job_scraping",
+        "src.workers.tasks.job_matching",
         "src.workers.tasks.auto_apply",
         "src.workers.tasks.embedding_update",
         "src.workers.tasks.security",
@@ -21,3 +25,15 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
 )
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _init_worker_process(**_kwargs: object) -> None:
+    # Prefork children must not share the parent's sockets
+    event_loop.reset()
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+@worker_shutdown.connect  # type: ignore[untyped-decorator]
+def _shutdown_worker(**_kwargs: object) -> None:
+    event_loop.shutdown()
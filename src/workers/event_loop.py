@@ -0,0 +1,51 @@
+"""
+Long-lived event loop per worker process.
+
+asyncio.run() builds and tears down a loop per task, which closes every
+pooled connection with it. Tasks that reuse process-wide clients (the
+scraper HTTP session) run on this loop instead, so connections opened by
+one task are still warm for the next.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from src.modules.job_search.infrastructure.scrapers.http_client import scraper_http
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:  # noqa: UP047
+    """Run a coroutine to completion on the worker's persistent loop"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+def reset() -> None:
+    """Drop state inherited from the parent after fork"""
+    global _loop
+    _loop = None
+    scraper_http.reset()
+
+
+def shutdown() -> None:
+    """Close pooled clients and the loop when the worker stops"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(scraper_http.close())
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    except Exception as e:
+        logger.warning(f"Error closing worker event loop: {e}")
+    finally:
+        _loop.close()
+        _loop = None
@@ -0,0 +1,58 @@
+import logging
+from uuid import UUID
+
+from src.core.ai.gemini_client import GeminiClient
+from src.core.ai.scheduler import Priority
+from src.core.config import settings
+from src.core.database.connection import AsyncSessionLocal
+from src.core.infrastructure.redis import redis_provider
+from src.modules.job_search.infrastructure.repository import SQLAlchemyJobRepository
+from src.workers import event_loop
+from src.workers.celery_app import celery_app
+from src.workers.tasks.job_matching import score_new_jobs
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="embed_jobs")  # type: ignore[untyped-decorator]
+def embed_jobs(job_ids: list[str]) -> int:
+    """Embed ingested jobs that have no description embedding, then score them."""
+
+    async def _embed() -> list[UUID]:
+        try:
+            await redis_provider.connect()
+        except Exception:
+            logger.warning("Redis unavailable, embedding without the shared cache")
+        try:
+            embedding_service = GeminiClient(
+                api_key=settings.ai.GEMINI_API_KEY or "",
+                priority=Priority.BATCH,
+            )
+            async with AsyncSessionLocal() as session:
+                repository = SQLAlchemyJobRepository(session)
+                jobs = [
+                    job
+                    for job in await repository.get_by_ids(
+                        [UUID(job_id) for job_id in job_ids]
+                    )
+                    if job.description_embedding is None
+                ]
+                try:
+                    # Same text the matcher embeds when no vector is stored
+                    embeddings = await embedding_service.embed_batch(
+                        [f"{job.title} {job.description}" for job in jobs]
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to embed {len(jobs)} jobs: {e}")
+                    return []
+                for job, embedding in zip(jobs, embeddings, strict=True):
+                    job.description_embedding = embedding
+                await session.commit()
+            return [job.id for job in jobs]
+        finally:
+            await redis_provider.disconnect()
+
+    embedded = event_loop.run(_embed())
+    if embedded:
+        score_new_jobs.delay([str(job_id) for job_id in embedded])
+    return len(embedded)
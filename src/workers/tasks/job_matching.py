@@ -0,0 +1,83 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.ai.gemini_client import GeminiClient
+from src.core.ai.scheduler import Priority
+from src.core.config import settings
+from src.core.database.connection import AsyncSessionLocal
+from src.core.infrastructure.redis import redis_provider
+from src.modules.job_search.domain.match_pipeline import MatchPipeline
+from src.modules.job_search.domain.matching import JobMatcher
+from src.modules.job_search.domain.skill_vocabulary import skill_vocabulary
+from src.modules.job_search.infrastructure.repository import (
+    SQLAlchemyJobRepository,
+    SQLAlchemySkillEmbeddingRepository,
+)
+from src.modules.persona.infrastructure.repository import SQLAlchemyPersonaRepository
+from src.workers import event_loop
+from src.workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _connect_redis() -> None:
+    """Redis backs the embedding and response caches; both work without it"""
+    try:
+        await redis_provider.connect()
+    except Exception:
+        logger.warning("Redis unavailable, using in-process caches only")
+
+
+def _build_pipeline(session: AsyncSession) -> MatchPipeline:
+    job_repository = SQLAlchemyJobRepository(session)
+    persona_repository = SQLAlchemyPersonaRepository(session)
+    matcher = JobMatcher(
+        embedding_service=GeminiClient(
+            api_key=settings.ai.GEMINI_API_KEY or "",
+            priority=Priority.BATCH,
+            embed_batch_window=settings.ai.EMBED_BATCH_WINDOW_MS / 1000,
+        ),
+        persona_repository=persona_repository,
+        job_repository=job_repository,
+        skill_vocabulary=skill_vocabulary,
+        skill_repository=SQLAlchemySkillEmbeddingRepository(session),
+    )
+    return MatchPipeline(matcher, job_repository, persona_repository)
+
+
+@celery_app.task(name="score_new_jobs")  # type: ignore[untyped-decorator]
+def score_new_jobs(job_ids: list[str]) -> int:
+    """Score newly ingested jobs against active personas."""
+
+    async def _score() -> int:
+        await _connect_redis()
+        try:
+            async with AsyncSessionLocal() as session:
+                stored = await _build_pipeline(session).score_new_jobs(
+                    [UUID(job_id) for job_id in job_ids]
+                )
+                await session.commit()
+                return stored
+        finally:
+            await redis_provider.disconnect()
+
+    return event_loop.run(_score())
+
+
+@celery_app.task(name="rescore_persona_matches")  # type: ignore[untyped-decorator]
+def rescore_persona_matches(user_id: str) -> int:
+    """Rebuild a user's precomputed matches after a persona change."""
+
+    async def _rescore() -> int:
+        await _connect_redis()
+        try:
+            async with AsyncSessionLocal() as session:
+                stored = await _build_pipeline(session).rescore_persona(UUID(user_id))
+                await session.commit()
+                return stored
+        finally:
+            await redis_provider.disconnect()
+
+    return event_loop.run(_rescore())
@@ -0,0 +1,143 @@
+import logging
+
+from src.core.database.connection import AsyncSessionLocal
+from src.core.infrastructure.redis import redis_provider
+from src.modules.job_search.domain.incremental_sync import IncrementalSync
+from src.modules.job_search.domain.ingestion import JobIngestion
+from src.modules.job_search.domain.normalization import structured_job_fields
+from src.modules.job_search.infrastructure.repository import (
+    SQLAlchemyJobRepository,
+    SQLAlchemyScrapeCursorRepository,
+)
+from src.modules.job_search.infrastructure.scrapers.bamboohr import BambooHRScraper
+from src.modules.job_search.infrastructure.scrapers.base import (
+    BaseScraper,
+    ScraperConfig,
+)
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.http_client import scraper_http
+from src.modules.job_search.infrastructure.scrapers.lever import LeverScraper
+from src.modules.job_search.infrastructure.scrapers.rate_limiter import (
+    RedisRateLimiter,
+)
+from src.modules.job_search.infrastructure.scrapers.smart_recruiters import (
+    SmartRecruitersScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.validator_cache import (
+    ResponseValidatorCache,
+)
+from src.modules.job_search.infrastructure.scrapers.workday import WorkdayScraper
+from src.workers import event_loop
+from src.workers.celery_app import celery_app
+from src.workers.tasks.embedding_update import embed_jobs
+
+logger = logging.getLogger(__name__)
+
+# Jobs re-normalized per transaction by normalize_jobs
+NORMALIZE_BATCH_SIZE = 500
+
+SCRAPERS: dict[str, type[BaseScraper]] = {
+    scraper.source_name: scraper
+    for scraper in (
+        GreenhouseScraper,
+        LeverScraper,
+        SmartRecruitersScraper,
+        BambooHRScraper,
+        WorkdayScraper,
+    )
+}
+
+
+@celery_app.task(name="sync_job_source")  # type: ignore[untyped-decorator]
+def sync_job_source(source: str) -> dict[str, int]:
+    """Incrementally sync every board of a source into the jobs table."""
+    if source not in SCRAPERS:
+        raise ValueError(f"Unknown job source: {source}")
+
+    async def _sync() -> tuple[dict[str, int], list[str]]:
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        to_embed: list[str] = []
+        try:
+            await redis_provider.connect()
+        except Exception:
+            logger.warning("Redis unavailable, fetching boards unconditionally")
+
+        config = ScraperConfig()
+        # The shared session outlives the task, keeping connections warm
+        http = await scraper_http.session()
+        try:
+            async with AsyncSessionLocal() as session:
+                job_repository = SQLAlchemyJobRepository(session)
+                scraper = SCRAPERS[source](
+                    http,
+                    RedisRateLimiter(),
+                    config,
+                    validator_cache=ResponseValidatorCache(namespace="sync"),
+                )
+                sync = IncrementalSync(
+                    scraper, SQLAlchemyScrapeCursorRepository(session), job_repository
+                )
+                ingestion = JobIngestion(job_repository)
+
+                async for changes in sync.run():
+                    async for batch in ingestion.ingest(changes.new + changes.changed):
+                        totals["inserted"] += batch.inserted
+                        totals["updated"] += batch.updated
+                        totals["unchanged"] += batch.unchanged
+                        to_embed.extend(str(job_id) for job_id in batch.needs_embedding)
+                    totals["removed"] += len(changes.removed)
+                    # Commits the previous board's cursor along with this board
+                    await session.commit()
+                    await sync.save_validators()
+                await session.commit()
+                await sync.save_validators()
+        finally:
+            await redis_provider.disconnect()
+        return totals, to_embed
+
+    totals, to_embed = event_loop.run(_sync())
+    if to_embed:
+        embed_jobs.delay(to_embed)
+    logger.info(f"Synced {source}: {totals}")
+    return totals
+
+
+@celery_app.task(name="normalize_jobs")  # type: ignore[untyped-decorator]
+def normalize_jobs() -> int:
+    """
+    Recompute the structured location and salary columns of every job.
+
+    Ingestion fills them for new and changed postings; this backfills
+    rows written before, or after the gazetteer or salary patterns change.
+    Only the description is at hand here, so a salary parsed at ingest
+    from the ATS salary field is kept when the description states none.
+    """
+
+    async def _normalize() -> int:
+        count = 0
+        after = None
+        async with AsyncSessionLocal() as session:
+            job_repository = SQLAlchemyJobRepository(session)
+            while jobs := await job_repository.get_batch_after(
+                after, NORMALIZE_BATCH_SIZE
+            ):
+                values = []
+                for job in jobs:
+                    fields = structured_job_fields(
+                        job.location, job.description, job.work_setting
+                    )
+                    if fields["salary_max"] is None:
+                        for column in ("salary_min", "salary_max", "salary_currency"):
+                            del fields[column]
+                    values.append({"id": job.id, **fields})
+                await job_repository.update_jobs(values)
+                await session.commit()
+                after = jobs[-1].id
+                count += len(jobs)
+        return count
+
+    count = event_loop.run(_normalize())
+    logger.info(f"Normalized {count} jobs")
+    return count
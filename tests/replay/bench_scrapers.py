@@ -0,0 +1,316 @@
+"""
+Throughput benchmark for the scrapers against the replay server.
+
+Measures postings/sec, peak Python memory and event-loop lag for each
+BaseScraper subclass (fetch + HTML cleaning + parsing), and for the full
+crawl pipeline (incremental sync + ingestion rows + dedup signatures,
+with in-memory repositories standing in for Postgres).
+
+Run with:
+    python -m tests.replay.bench_scrapers --boards 50 --postings 200
+    python -m tests.replay.bench_scrapers --save baseline.json
+    python -m tests.replay.bench_scrapers --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+import aiohttp
+
+from src.modules.job_search.domain.incremental_sync import IncrementalSync
+from src.modules.job_search.domain.ingestion import JobIngestion
+from src.modules.job_search.domain.models import ScrapeCursor
+from src.modules.job_search.domain.repository import UpsertedJob
+from src.modules.job_search.infrastructure.scrapers.bamboohr import BambooHRScraper
+from src.modules.job_search.infrastructure.scrapers.base import (
+    BaseScraper,
+    ScraperConfig,
+)
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.lever import LeverScraper
+from src.modules.job_search.infrastructure.scrapers.rate_limiter import RateLimiter
+from src.modules.job_search.infrastructure.scrapers.smart_recruiters import (
+    SmartRecruitersScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.workday import WorkdayScraper
+from tests.replay.cassettes import load_cassette
+from tests.replay.server import ReplayProfile, ReplayServer, ReplaySession
+
+SCRAPERS: list[type[BaseScraper]] = [
+    GreenhouseScraper,
+    LeverScraper,
+    SmartRecruitersScraper,
+    BambooHRScraper,
+    WorkdayScraper,
+]
+
+# Interval of the event-loop lag probe
+LAG_PROBE_SECONDS = 0.005
+
+
+@dataclass
+class BenchResult:
+    name: str
+    postings: int
+    seconds: float
+    postings_per_second: float
+    peak_memory_mb: float
+    loop_lag_p50_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    requests: int
+
+
+class NoRateLimit(RateLimiter):
+    """Measures the scrapers, not the configured politeness"""
+
+    async def acquire(self, source: str):
+        _ = source
+
+    async def penalize(self, source: str, retry_after: float | None = None):
+        _ = source, retry_after
+
+
+class InMemoryCursorRepository:
+    def __init__(self):
+        self.cursors: dict[tuple[str, str], ScrapeCursor] = {}
+
+    async def get_for_source(self, source: str) -> dict[str, ScrapeCursor]:
+        return {b: c for (s, b), c in self.cursors.items() if s == source}
+
+    async def save(self, cursor: ScrapeCursor) -> ScrapeCursor:
+        self.cursors[(cursor.source, cursor.board)] = cursor
+        return cursor
+
+
+class InMemoryJobRepository:
+    """Just enough of JobRepository for ingestion and dedup"""
+
+    def __init__(self):
+        self.jobs: dict[str, dict[str, Any]] = {}
+
+    async def upsert_jobs(self, rows: list[dict[str, Any]]) -> list[UpsertedJob]:
+        written = []
+        for row in rows:
+            existing = self.jobs.get(row["external_id"])
+            self.jobs[row["external_id"]] = row
+            written.append(
+                UpsertedJob(row["id"], existing is None, True, row["external_id"])
+            )
+        return written
+
+    async def expire_by_external_ids(self, external_ids: list[str]) -> int:
+        return len(external_ids)
+
+    async def find_duplicate_candidates(self, buckets: list) -> dict:
+        _ = buckets
+        return {}
+
+    async def save_lsh_buckets(self, buckets: dict) -> None:
+        _ = buckets
+
+    async def link_duplicates(self, links: dict[UUID, UUID | None]) -> None:
+        _ = links
+
+
+class LoopLagProbe:
+    """Samples how late the event loop wakes a sleeping task"""
+
+    def __init__(self, interval: float = LAG_PROBE_SECONDS):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def __enter__(self) -> "LoopLagProbe":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    def percentile_ms(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        if len(self.samples) == 1:
+            return self.samples[0] * 1000
+        quantiles = statistics.quantiles(self.samples, n=100, method="inclusive")
+        return quantiles[int(q) - 1] * 1000
+
+
+async def _scrape(scraper: BaseScraper, boards: list[str]) -> int:
+    """Fetch every board and build RawJobs, as a full crawl does"""
+    count = 0
+    async for listing in scraper.fetch_boards(boards):
+        postings = listing.postings or []
+        await scraper.prepare_descriptions(postings)
+        count += sum(1 for p in postings if scraper.parse_posting(p, listing.board))
+    return count
+
+
+async def _crawl_pipeline(scraper: BaseScraper, boards: list[str]) -> int:
+    """Incremental sync into ingestion, with in-memory storage"""
+    job_repository = InMemoryJobRepository()
+    sync = IncrementalSync(scraper, InMemoryCursorRepository(), job_repository)
+    ingestion = JobIngestion(job_repository)
+    count = 0
+    async for changes in sync.run(boards):
+        async for batch in ingestion.ingest(changes.new + changes.changed):
+            count += batch.inserted + batch.updated
+    return count
+
+
+async def _measure(
+    scraper_cls: type[BaseScraper],
+    run: Callable[[BaseScraper, list[str]], Awaitable[int]],
+    args: argparse.Namespace,
+    trace_memory: bool,
+) -> tuple[int, float, float, LoopLagProbe, int]:
+    cassette = load_cassette(scraper_cls.source_name)
+    boards = cassette.board_names(args.boards)
+    profile = ReplayProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+    async with (
+        ReplayServer(cassette.routes(boards, args.postings), profile) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        scraper = scraper_cls(
+            http_client=ReplaySession(session, server),  # type: ignore[arg-type]
+            rate_limiter=RateLimiter() if args.rate_limited else NoRateLimit(),
+            config=ScraperConfig(max_concurrent_boards=args.concurrency),
+        )
+        if trace_memory:
+            tracemalloc.start()
+        with LoopLagProbe() as probe:
+            start = time.perf_counter()
+            postings = await run(scraper, boards)
+            seconds = time.perf_counter() - start
+        peak = 0.0
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        return postings, seconds, peak, probe, server.requests
+
+
+async def bench(
+    name: str,
+    scraper_cls: type[BaseScraper],
+    run: Callable[[BaseScraper, list[str]], Awaitable[int]],
+    args: argparse.Namespace,
+) -> BenchResult:
+    # Timing and lag come from an untraced pass; tracemalloc slows
+    # allocation-heavy code several-fold
+    postings, seconds, _, probe, requests = await _measure(
+        scraper_cls, run, args, trace_memory=False
+    )
+    _, _, peak, _, _ = await _measure(scraper_cls, run, args, trace_memory=True)
+    return BenchResult(
+        name=name,
+        postings=postings,
+        seconds=round(seconds, 4),
+        postings_per_second=round(postings / seconds, 1) if seconds else 0.0,
+        peak_memory_mb=round(peak, 2),
+        loop_lag_p50_ms=round(probe.percentile_ms(50), 2),
+        loop_lag_p99_ms=round(probe.percentile_ms(99), 2),
+        loop_lag_max_ms=round(max(probe.samples, default=0.0) * 1000, 2),
+        requests=requests,
+    )
+
+
+async def run_all(args: argparse.Namespace) -> list[BenchResult]:
+    results = []
+    for scraper_cls in SCRAPERS:
+        if args.only and scraper_cls.source_name not in args.only:
+            continue
+        results.append(await bench(scraper_cls.source_name, scraper_cls, _scrape, args))
+        results.append(
+            await bench(
+                f"{scraper_cls.source_name}+pipeline",
+                scraper_cls,
+                _crawl_pipeline,
+                args,
+            )
+        )
+    return results
+
+
+def _print(results: list[BenchResult], baseline: dict[str, dict] | None) -> None:
+    header = (
+        f"{'benchmark':<26}{'postings':>9}{'post/s':>11}{'peak MB':>9}"
+        f"{'lag p50':>9}{'lag p99':>9}{'lag max':>9}"
+    )
+    if baseline:
+        header += f"{'vs base':>9}"
+    print(header)
+    for r in results:
+        line = (
+            f"{r.name:<26}{r.postings:>9}{r.postings_per_second:>11.1f}"
+            f"{r.peak_memory_mb:>9.2f}{r.loop_lag_p50_ms:>9.2f}"
+            f"{r.loop_lag_p99_ms:>9.2f}{r.loop_lag_max_ms:>9.2f}"
+        )
+        base = (baseline or {}).get(r.name)
+        if base and base["postings_per_second"]:
+            change = r.postings_per_second / base["postings_per_second"] - 1
+            line += f"{change:>+9.1%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--postings", type=int, default=100, help="per board")
+    parser.add_argument("--concurrency", type=int, default=8, help="boards at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limited",
+        action="store_true",
+        help="pace requests with the configured per-host limits",
+    )
+    parser.add_argument("--only", nargs="*", help="sources to run")
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare with results saved earlier")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_all(args))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {r["name"]: r for r in json.load(f)["results"]}
+    _print(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"args": vars(args), "results": [asdict(r) for r in results]},
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
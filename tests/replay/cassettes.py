@@ -0,0 +1,149 @@
+"""
+Recorded board listings for the replay server.
+
+Each cassette in cassettes/ holds one real-shaped board listing response
+for a source. It can be replayed as is, or scaled to any number of boards
+and postings for load tests by cloning its postings under fresh ids.
+
+Sources that page their listing through a POSTed search (Workday) set
+page_size, and sources whose listing lacks descriptions record the
+per-posting detail responses too.
+"""
+
+import copy
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+@dataclass
+class Cassette:
+    source: str
+    board: str
+    # Listing URL with a {board} placeholder, or {tenant}, {instance} and
+    # {site} for "{tenant}.{instance}/{site}" boards
+    url_template: str
+    # Key of the postings list in the body; None when the body is the list
+    listing_key: str | None
+    headers: dict[str, str]
+    body: Any
+    # Posting field the clones get a fresh value for
+    id_key: str = "id"
+    # Listing served as offset/limit pages of this size via POST
+    page_size: int | None = None
+    # Detail URL with {board} fields and an {id} placeholder, and the
+    # recorded detail body per posting id
+    detail_url_template: str | None = None
+    details: dict[str, Any] | None = None
+
+    @property
+    def postings(self) -> list[dict]:
+        return self.body if self.listing_key is None else self.body[self.listing_key]
+
+    def url(self, board: str) -> str:
+        return self.url_template.format(**_url_fields(board))
+
+    def detail_url(self, board: str, posting_id: str) -> str:
+        if self.detail_url_template is None:
+            raise ValueError(f"{self.source} cassette has no detail responses")
+        return self.detail_url_template.format(**_url_fields(board), id=posting_id)
+
+    def board_names(self, count: int) -> list[str]:
+        """Distinct boards shaped like the recorded one, for scaled routes"""
+        fields = _url_fields(self.board)
+        if "site" in fields:
+            return [
+                f"{fields['tenant']}{i}.{fields['instance']}/{fields['site']}"
+                for i in range(count)
+            ]
+        return [f"{self.board}-{i}" for i in range(count)]
+
+    def listing(self, postings: list[dict]) -> Any:
+        """Response body for a board holding these postings"""
+        if self.listing_key is None:
+            return postings
+        body = copy.copy(self.body)
+        body[self.listing_key] = postings
+        return body
+
+    def routes(
+        self, boards: list[str] | None = None, postings_per_board: int | None = None
+    ) -> dict[str, Any]:
+        """
+        URL -> body for each board.
+
+        Without arguments this is the recording itself. Otherwise every
+        board gets postings_per_board postings cloned from the recording,
+        each with an id unique across boards.
+        """
+        if boards is None:
+            boards_postings = {self.board: self.postings}
+        else:
+            count = postings_per_board or len(self.postings)
+            boards_postings = {}
+            serial = 0
+            for board in boards:
+                postings = []
+                for i in range(count):
+                    posting = copy.deepcopy(self.postings[i % len(self.postings)])
+                    serial += 1
+                    posting[self.id_key] = _clone_id(posting[self.id_key], serial)
+                    postings.append(posting)
+                boards_postings[board] = postings
+
+        routes: dict[str, Any] = {}
+        for board, postings in boards_postings.items():
+            if self.page_size:
+                routes[self.url(board)] = self._pager(postings)
+            else:
+                routes[self.url(board)] = self.listing(postings)
+            if self.details:
+                originals = list(self.details.values())
+                for i, posting in enumerate(postings):
+                    posting_id = posting[self.id_key]
+                    detail = self.details.get(posting_id, originals[i % len(originals)])
+                    routes[self.detail_url(board, posting_id)] = detail
+        return routes
+
+    def _pager(self, postings: list[dict]) -> Callable[[Any], Any]:
+        """Search endpoint answering offset/limit requests over postings"""
+
+        def page(request: Any) -> Any:
+            request = request or {}
+            offset = int(request.get("offset", 0))
+            limit = min(int(request.get("limit", self.page_size)), self.page_size)
+            body = self.listing(postings[offset : offset + limit])
+            # Like Workday, only the first page carries the total
+            body["total"] = len(postings) if offset == 0 else 0
+            return body
+
+        return page
+
+
+def _url_fields(board: str) -> dict[str, str]:
+    """Template fields for a board; "{tenant}.{instance}/{site}" is split"""
+    fields = {"board": board}
+    host, _, site = board.partition("/")
+    tenant, _, instance = host.partition(".")
+    if site and instance:
+        fields.update(tenant=tenant, instance=instance, site=site)
+    return fields
+
+
+def _clone_id(original: Any, serial: int) -> Any:
+    if isinstance(original, int):
+        return original * 1_000_000 + serial
+    return f"{original}-{serial}"
+
+
+def load_cassette(source: str) -> Cassette:
+    with open(CASSETTE_DIR / f"{source}.json") as f:
+        return Cassette(**json.load(f))
+
+
+def available_sources() -> list[str]:
+    return sorted(path.stem for path in CASSETTE_DIR.glob("*.json"))
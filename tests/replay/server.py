@@ -0,0 +1,161 @@
+"""
+Local replay server for scraper tests and benchmarks.
+
+ReplayServer serves recorded responses from an aiohttp test server, with
+configurable latency, server errors and 429s. ReplaySession is a drop-in
+for the scrapers' aiohttp.ClientSession that sends every request to the
+replay server instead of the real ATS host, so scrapers run unchanged
+(including per-host rate limiting, which still sees the original URL).
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+@dataclass
+class ReplayProfile:
+    """How the replay server misbehaves"""
+
+    # Seconds added to every response, plus up to `jitter` more
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Fraction of requests answered 503
+    error_rate: float = 0.0
+    # Fraction of requests answered 429 with Retry-After
+    rate_limit_rate: float = 0.0
+    retry_after: float = 0.0
+    seed: int = 0
+
+
+def _replay_path(url: str) -> str:
+    """Path on the replay server that stands for a real URL"""
+    parts = urlsplit(url)
+    path = f"/{parts.hostname}{parts.path or '/'}"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+# Computes a response body from the JSON request body (e.g. a search page)
+ReplayHandler = Callable[[Any], Any]
+
+
+class ReplayServer:
+    """
+    Serves url -> JSON body routes under /{host}/{path}.
+
+    A route may map to a ReplayHandler instead of a body, for endpoints
+    whose response depends on the request, like POSTed search pages.
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, Any | ReplayHandler],
+        profile: ReplayProfile | None = None,
+    ):
+        self.profile = profile or ReplayProfile()
+        self._random = random.Random(self.profile.seed)
+        # Serialized up front so the server adds no parsing cost to benchmarks
+        self._responses: dict[str, tuple[bytes, str]] = {}
+        self._handlers: dict[str, ReplayHandler] = {}
+        for url, body in routes.items():
+            if callable(body):
+                self._handlers[_replay_path(url)] = body
+                continue
+            raw = json.dumps(body).encode()
+            etag = '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+            self._responses[_replay_path(url)] = (raw, etag)
+        self.statuses: Counter[int] = Counter()
+        self._server: TestServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Replay server not started")
+        return str(self._server.make_url("")).rstrip("/")
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> "ReplayServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.close()
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        profile = self.profile
+        delay = profile.latency + self._random.random() * profile.jitter
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < profile.rate_limit_rate:
+            return self._respond(
+                web.Response(
+                    status=429, headers={"Retry-After": f"{profile.retry_after:g}"}
+                )
+            )
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            return self._respond(web.Response(status=503))
+
+        handler = self._handlers.get(request.path_qs)
+        if handler is not None:
+            payload = await request.json() if request.can_read_body else None
+            return self._respond(web.json_response(handler(payload)))
+
+        found = self._responses.get(request.path_qs)
+        if found is None:
+            return self._respond(web.Response(status=404))
+        raw, etag = found
+        if request.headers.get("If-None-Match") == etag:
+            return self._respond(web.Response(status=304, headers={"ETag": etag}))
+        return self._respond(
+            web.Response(
+                body=raw, content_type="application/json", headers={"ETag": etag}
+            )
+        )
+
+    def _respond(self, response: web.Response) -> web.Response:
+        self.statuses[response.status] += 1
+        return response
+
+
+class ReplaySession:
+    """ClientSession stand-in that routes requests to a ReplayServer"""
+
+    def __init__(self, session: aiohttp.ClientSession, server: ReplayServer):
+        self._session = session
+        self._server = server
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        kwargs.pop("proxy", None)
+        return self._session.request(
+            method, self._server.base_url + _replay_path(url), **kwargs
+        )
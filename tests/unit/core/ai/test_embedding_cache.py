@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.ai.embedding_cache import EmbeddingCache, embedding_key
+
+MODEL = "models/text-embedding-004"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get_many_bytes(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set_many_bytes(self, values, **_options):
+        self.store.update(values)
+
+
+class BrokenRedis:
+    async def get_many_bytes(self, _keys):
+        raise RuntimeError("Redis client not connected")
+
+    async def set_many_bytes(self, _values, **_options):
+        raise RuntimeError("Redis client not connected")
+
+
+def test_key_covers_model_and_task_type():
+    key = embedding_key(MODEL, "RETRIEVAL_QUERY", "python")
+
+    assert key == embedding_key(MODEL, "RETRIEVAL_QUERY", "python")
+    assert key != embedding_key(MODEL, "RETRIEVAL_DOCUMENT", "python")
+    assert key != embedding_key("models/embedding-001", "RETRIEVAL_QUERY", "python")
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_stores_compact_float16():
+    redis = FakeRedis()
+    embedding = [0.125, -0.5, 0.333]
+    await EmbeddingCache(redis=redis).put_many(MODEL, "QUERY", {"a": embedding})
+
+    (raw,) = redis.store.values()
+    assert len(raw) == 2 * len(embedding)
+
+    # A fresh process only has the Redis tier
+    (found,) = await EmbeddingCache(redis=redis).get_many(MODEL, "QUERY", ["a"])
+    assert found == pytest.approx(embedding, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used():
+    cache = EmbeddingCache(maxsize=2, redis=None)
+    await cache.put_many(MODEL, "QUERY", {"a": [1.0], "b": [2.0]})
+    await cache.get_many(MODEL, "QUERY", ["a"])
+    await cache.put_many(MODEL, "QUERY", {"c": [3.0]})
+
+    found = await cache.get_many(MODEL, "QUERY", ["a", "b", "c"])
+
+    assert found == [[1.0], None, [3.0]]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_degrade_to_misses():
+    cache = EmbeddingCache(redis=BrokenRedis())
+    embed = AsyncMock(return_value=[0.5, 0.25])
+
+    first = await cache.get_or_embed(MODEL, "QUERY", "text", embed)
+    second = await cache.get_or_embed(MODEL, "QUERY", "text", embed)
+
+    assert first == second == [0.5, 0.25]
+    embed.assert_awaited_once_with("text")
@@ -1,9 +1,29 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
 
-from src.core.ai.gemini_client import GeminiClient
+from src.core.ai.embedding_cache import EmbeddingCache
+from src.core.ai.gemini_client import (
+    EMBED_BATCH_SIZE,
+    GeminiClient,
+    ModelHandleCache,
+    SingleFlight,
+)
+from src.core.ai.response_cache import ResponseCache
+from src.core.ai.scheduler import Priority
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, **_options):
+        self.store[key] = value
 
 
 class MockSchema(BaseModel):
@@ -13,7 +33,12 @@ class MockSchema(BaseModel):
 
 @pytest.fixture
 def gemini_client():
-    return GeminiClient(api_key="test_key")
+    return GeminiClient(
+        api_key="test_key",
+        embedding_cache=EmbeddingCache(redis=None),
+        single_flight=SingleFlight(),
+        responses=ResponseCache(redis=FakeRedis()),
+    )
 
 
 @pytest.mark.asyncio
@@ -86,6 +111,84 @@ async def test_embed_text(gemini_client):
         assert embedding == [0.1, 0.2, 0.3]
 
 
+@pytest.mark.asyncio
+async def test_embed_batch_sends_one_request_per_chunk(gemini_client):
+    texts = [f"text {i}" for i in range(EMBED_BATCH_SIZE + 5)]
+
+    async def embed(content, **_):
+        return {"embedding": [[float(len(t))] for t in content]}
+
+    with patch("google.generativeai.embed_content_async", side_effect=embed) as mock:
+        embeddings = await gemini_client.embed_batch(texts)
+
+    assert [len(call.kwargs["content"]) for call in mock.call_args_list] == [100, 5]
+    assert embeddings == [[float(len(t))] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_only_sends_uncached_texts(gemini_client):
+    async def embed(content, **_):
+        if isinstance(content, str):
+            return {"embedding": [float(len(content))]}
+        return {"embedding": [[float(len(t))] for t in content]}
+
+    with patch("google.generativeai.embed_content_async", side_effect=embed) as mock:
+        await gemini_client.embed_text("a")
+        embeddings = await gemini_client.embed_batch(["a", "bb", "bb", "ccc"])
+        again = await gemini_client.embed_text("ccc")
+
+    assert embeddings == [[1.0], [2.0], [2.0], [3.0]]
+    assert again == [3.0]
+    assert [call.kwargs["content"] for call in mock.call_args_list] == [
+        "a",
+        ["bb", "ccc"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_coalesces_concurrent_embeds():
+    client = GeminiClient(
+        api_key="test_key",
+        embed_batch_window=0.01,
+        embedding_cache=EmbeddingCache(redis=None),
+    )
+
+    async def embed(content, **_):
+        return {"embedding": [[float(len(t))] for t in content]}
+
+    with patch("google.generativeai.embed_content_async", side_effect=embed) as mock:
+        results = await asyncio.gather(
+            client.embed_text("a"),
+            client.embed_text("bb"),
+            client.embed_text("a"),
+            client.embed_text("ccc", task_type="SEMANTIC_SIMILARITY"),
+        )
+
+    assert results == [[1.0], [2.0], [1.0], [3.0]]
+    assert sorted(call.kwargs["content"] for call in mock.call_args_list) == [
+        ["a", "bb"],
+        ["ccc"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_fans_out_errors():
+    client = GeminiClient(
+        api_key="test_key",
+        embed_batch_window=0.001,
+        embedding_cache=EmbeddingCache(redis=None),
+    )
+
+    with (
+        patch(
+            "google.generativeai.embed_content_async",
+            side_effect=RuntimeError("quota"),
+        ),
+        pytest.raises(RuntimeError, match="quota"),
+    ):
+        await asyncio.gather(client.embed_text("a"), client.embed_text("b"))
+
+
 @pytest.mark.asyncio
 async def test_generate_with_context(gemini_client):
     mock_response = MagicMock()
@@ -119,3 +222,153 @@ async def test_stream_text(gemini_client):
             chunks.append(chunk)
 
         assert chunks == ["Part 1", "Part 2"]
+
+
+@pytest.mark.asyncio
+async def test_model_handles_are_reused_per_config():
+    cache = ModelHandleCache(maxsize=2)
+    client = GeminiClient(api_key="test_key", model_cache=cache)
+
+    first = client._get_model("gemini-1.5-flash", generation_config={"temperature": 0})
+    again = client._get_model("gemini-1.5-flash", generation_config={"temperature": 0})
+    other = client._get_model("gemini-1.5-flash", "Be brief")
+
+    assert first is again
+    assert other is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_model_cache_evicts_least_recently_used():
+    cache = ModelHandleCache(maxsize=2)
+    cache.configure("test_key")
+
+    a = cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert len(cache) == 2
+    assert cache.get("a") is a
+    assert cache.misses == 3
+
+
+def test_model_cache_is_dropped_on_a_new_event_loop():
+    cache = ModelHandleCache()
+    cache.configure("test_key")
+
+    async def get_model():
+        return cache.get("gemini-1.5-flash")
+
+    with patch("google.generativeai.configure") as configure:
+        first = asyncio.run(get_model())
+        second = asyncio.run(get_model())
+
+    assert first is not second
+    configure.assert_called_once_with(api_key="test_key")
+
+
+def test_embeds_rebind_genai_on_a_new_event_loop():
+    # Worker tasks that only embed still run each task on a fresh loop
+    client = GeminiClient(
+        api_key="test_key",
+        model_cache=ModelHandleCache(),
+        embedding_cache=EmbeddingCache(redis=None),
+    )
+
+    with (
+        patch("google.generativeai.configure") as configure,
+        patch(
+            "google.generativeai.embed_content_async",
+            new_callable=AsyncMock,
+            return_value={"embedding": [0.5]},
+        ),
+    ):
+        asyncio.run(client.embed_text("first"))
+        asyncio.run(client.embed_text("second"))
+
+    configure.assert_called_once_with(api_key="test_key")
+
+
+def test_task_applies_model_config(gemini_client):
+    model_name, priority, config = gemini_client._call_settings(
+        {"task": "cover_letter", "temperature": 0.2}
+    )
+
+    assert model_name == "gemini-1.5-pro"
+    assert priority == Priority.INTERACTIVE
+    assert config == {"temperature": 0.2, "max_output_tokens": 1500}
+
+
+def _text_response(text):
+    response = MagicMock()
+    response.text = text
+    response.usage_metadata.prompt_token_count = 5
+    response.usage_metadata.candidates_token_count = 2
+    return response
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_prompts_share_one_call(gemini_client):
+    async def generate(prompt, **_):
+        await asyncio.sleep(0.01)
+        return _text_response(f"re: {prompt}")
+
+    google_gen_mock = "google.generativeai.GenerativeModel.generate_content_async"
+    with patch(google_gen_mock, side_effect=generate) as mock_gen:
+        results = await asyncio.gather(
+            gemini_client.generate_text("company values"),
+            gemini_client.generate_text("company values"),
+            gemini_client.generate_text("company values", temperature=0.9),
+            gemini_client.generate_text("other"),
+        )
+
+    assert results == [
+        "re: company values",
+        "re: company values",
+        "re: company values",
+        "re: other",
+    ]
+    assert mock_gen.await_count == 3
+    assert gemini_client.in_flight.shared == 1
+    assert len(gemini_client.in_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_call_survives_a_cancelled_caller(gemini_client):
+    async def generate(*_args, **_kwargs):
+        await asyncio.sleep(0.01)
+        return _text_response('{"name": "a", "score": 1}')
+
+    google_gen_mock = "google.generativeai.GenerativeModel.generate_content_async"
+    with patch(google_gen_mock, side_effect=generate) as mock_gen:
+        first = asyncio.create_task(
+            gemini_client.generate_structured("rate", MockSchema)
+        )
+        second = asyncio.create_task(
+            gemini_client.generate_structured("rate", MockSchema)
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await second
+
+    assert result == MockSchema(name="a", score=1)
+    assert mock_gen.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_as_serves_repeat_prompts_from_the_response_cache(gemini_client):
+    google_gen_mock = "google.generativeai.GenerativeModel.generate_content_async"
+    response = _text_response('{"name": "a", "score": 1}')
+    with patch(google_gen_mock, return_value=response) as mock_gen:
+        for _ in range(2):
+            text = await gemini_client.generate_text("p", cache_as="t")
+            result = await gemini_client.generate_structured(
+                "p", MockSchema, cache_as="t"
+            )
+        await gemini_client.generate_text("p")
+
+    assert text == '{"name": "a", "score": 1}'
+    assert result == MockSchema(name="a", score=1)
+    assert mock_gen.await_count == 3
+    assert gemini_client.responses.stats() == {"t": {"hits": 2, "misses": 2}}
@@ -0,0 +1,105 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from src.core.ai.response_cache import ResponseCache
+
+
+class Bullet(BaseModel):
+    enhanced: str
+
+
+class Summary(BaseModel):
+    text: str
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = value
+        self.expiry[key] = expire
+
+
+class BrokenRedis:
+    async def get(self, _key):
+        raise RuntimeError("Redis client not connected")
+
+    async def set(self, _key, _value, **_options):
+        raise RuntimeError("Redis client not connected")
+
+
+ROOT = Path(__file__).parents[4]
+KEY_SCRIPT = (
+    "from src.core.ai.response_cache import ResponseCache;"
+    "print(ResponseCache(redis=None).key('m', 't', 'prompt', {'temperature': 0.3})"
+    ".redis_key)"
+)
+
+
+def test_key_is_stable_across_processes():
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", KEY_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+            env={"PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2")
+    }
+
+    expected = ResponseCache(redis=None).key("m", "t", "prompt", {"temperature": 0.3})
+    assert keys == {expected.redis_key + "\n"}
+
+
+def test_key_covers_model_config_and_schema():
+    cache = ResponseCache(redis=None)
+    base = cache.key("flash", "t", "p", {"response_schema": Bullet})
+
+    assert base.redis_key.startswith("llm:t:")
+    assert base == cache.key("flash", "t", "p", {"response_schema": Bullet})
+    assert base != cache.key("pro", "t", "p", {"response_schema": Bullet})
+    assert base != cache.key("flash", "t", "p", {"response_schema": Summary})
+    assert base != cache.key("flash", "t", "p", {"response_schema": Bullet, "x": 1})
+
+
+@pytest.mark.asyncio
+async def test_get_or_generate_counts_hits_and_misses():
+    redis = FakeRedis()
+    cache = ResponseCache(redis=redis, default_ttl=60)
+    key = cache.key("flash", "summary", "p")
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return "response"
+
+    first = await cache.get_or_generate(key, generate, ttl=600)
+    second = await cache.get_or_generate(key, generate)
+
+    assert first == second == "response"
+    assert len(calls) == 1
+    assert redis.expiry == {key.redis_key: 600}
+    assert cache.stats() == {"summary": {"hits": 1, "misses": 1}}
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses():
+    cache = ResponseCache(redis=BrokenRedis())
+    key = cache.key("flash", "summary", "p")
+
+    async def generate():
+        return "response"
+
+    assert await cache.get_or_generate(key, generate) == "response"
+    assert cache.misses["summary"] == 1
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+
+from src.core.ai.scheduler import GeminiScheduler, Priority
+
+
+def _scheduler(**options):
+    defaults = {
+        "rpm": 600,
+        "tpm": 100_000,
+        "max_concurrency": 4,
+        "model_limits": {},
+        "interactive_reserve": 0.2,
+    }
+    return GeminiScheduler(**{**defaults, **options})
+
+
+async def _admitted(scheduler, model, tokens=0, priority=Priority.INTERACTIVE):
+    """Whether a request would be admitted right away"""
+    try:
+        async with asyncio.timeout(0.05):
+            async with scheduler.reserve(model, tokens, priority):
+                return True
+    except TimeoutError:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_models_have_separate_buckets():
+    scheduler = _scheduler(rpm=2)
+    for _ in range(2):
+        assert await _admitted(scheduler, "gemini-1.5-flash")
+
+    assert not await _admitted(scheduler, "gemini-1.5-flash")
+    assert await _admitted(scheduler, "gemini-1.5-pro")
+
+
+@pytest.mark.asyncio
+async def test_token_budget_is_settled_with_actual_usage():
+    scheduler = _scheduler(tpm=1_000)
+    async with scheduler.reserve("flash", tokens=100) as reservation:
+        reservation.settle(900)
+
+    assert not await _admitted(scheduler, "flash", tokens=200)
+    assert await _admitted(scheduler, "other", tokens=200)
+
+
+@pytest.mark.asyncio
+async def test_batch_leaves_reserve_to_interactive():
+    scheduler = _scheduler(rpm=10)
+    for _ in range(8):
+        assert await _admitted(scheduler, "flash", priority=Priority.BATCH)
+
+    assert not await _admitted(scheduler, "flash", priority=Priority.BATCH)
+    assert await _admitted(scheduler, "flash", priority=Priority.INTERACTIVE)
+
+
+@pytest.mark.asyncio
+async def test_interactive_waiters_go_first():
+    scheduler = _scheduler(max_concurrency=1)
+    order = []
+    release = asyncio.Event()
+
+    async def call(name, priority):
+        async with scheduler.reserve("flash", priority=priority):
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(call("first", Priority.BATCH))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(call("batch", Priority.BATCH)),
+        asyncio.create_task(call("interactive", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert order == ["first", "interactive", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_quota_errors_halve_concurrency_and_successes_restore_it():
+    scheduler = _scheduler(max_concurrency=8)
+    with pytest.raises(ResourceExhausted):
+        async with scheduler.reserve("pro"):
+            raise ResourceExhausted("quota")
+
+    lane = scheduler.lane("pro")
+    assert lane.limit == 4
+
+    for _ in range(30):
+        async with scheduler.reserve("pro"):
+            pass
+    assert lane.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_other_errors_leave_concurrency_alone():
+    scheduler = _scheduler(max_concurrency=8)
+    with pytest.raises(ValueError, match="bad schema"):
+        async with scheduler.reserve("pro"):
+            raise ValueError("bad schema")
+
+    lane = scheduler.lane("pro")
+    assert (lane.limit, lane.in_flight) == (8, 0)
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.core.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trips_typed_key():
+    key = [datetime(2026, 10, 1, 9, 30, tzinfo=UTC), uuid4()]
+
+    cursor = encode_cursor("recency", key)
+
+    assert decode_cursor(cursor, "recency") == key
+    assert "=" not in cursor
+
+
+def test_cursor_keeps_null_and_float_values():
+    key = [None, 0.125]
+    assert decode_cursor(encode_cursor("vector", key), "vector") == key
+
+
+def test_cursor_from_other_order_is_rejected():
+    cursor = encode_cursor("recency", [None, uuid4()])
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "vector")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "recency")
@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.database.vector_search import ef_search_for, vector_search_settings
+
+
+def test_ef_search_for_grows_with_requested_rows():
+    assert ef_search_for(20) is None
+    assert ef_search_for(150) == 150
+    assert ef_search_for(5000) == 1000
+    assert ef_search_for(150, ef_search=64) == 64
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one.return_value = "40"
+    session.execute.return_value = result
+    return session
+
+
+@pytest.mark.asyncio
+async def test_settings_are_applied_and_restored(session):
+    async with vector_search_settings(session, ef_search=200):
+        assert session.execute.await_count == 1
+
+    apply_params = session.execute.await_args_list[0].args[1]
+    restore_params = session.execute.await_args_list[1].args[1]
+    assert apply_params == {"name": "hnsw.ef_search", "value": "200"}
+    assert restore_params == {"name": "hnsw.ef_search", "value": "40"}
+
+
+@pytest.mark.asyncio
+async def test_exact_mode_disables_index_scans(session):
+    async with vector_search_settings(session, mode="exact"):
+        pass
+
+    names = [call.args[1]["name"] for call in session.execute.await_args_list]
+    assert names == ["enable_indexscan", "enable_indexscan"]
+
+
+@pytest.mark.asyncio
+async def test_no_overrides_issue_no_queries(session):
+    async with vector_search_settings(session):
+        pass
+
+    session.execute.assert_not_awaited()
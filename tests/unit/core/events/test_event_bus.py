@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.events.event_bus import Event, InternalEventBus
+
+
+class Saved(Event):
+    name: str
+
+
+class Recorder:
+    def __init__(self):
+        self.received = []
+        self.delivered = asyncio.Event()
+
+    async def __call__(self, event):
+        self.received.append(event.name)
+        self.delivered.set()
+
+    async def wait(self, timeout=0.1):
+        try:
+            async with asyncio.timeout(timeout):
+                await self.delivered.wait()
+        except TimeoutError:
+            pass
+        return self.received
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def bus(recorder):
+    bus = InternalEventBus()
+    bus.subscribe(Saved, recorder)
+    return bus
+
+
+@pytest.mark.asyncio
+async def test_publish_after_commit_waits_for_the_commit(bus, recorder):
+    session = AsyncSession()
+    await session.begin()
+    bus.publish_after_commit(session, Saved(name="persona"))
+
+    assert await recorder.wait(timeout=0.01) == []
+
+    await session.commit()
+    assert await recorder.wait() == ["persona"]
+
+
+@pytest.mark.asyncio
+async def test_rollback_drops_pending_events(bus, recorder):
+    session = AsyncSession()
+    await session.begin()
+    bus.publish_after_commit(session, Saved(name="persona"))
+
+    await session.rollback()
+    await session.begin()
+    await session.commit()
+
+    assert await recorder.wait(timeout=0.01) == []
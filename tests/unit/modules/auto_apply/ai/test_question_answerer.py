@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.core.ai.response_cache import response_cache
 from src.modules.auto_apply.ai.question_answerer import QuestionAnswerer, QuestionType
 from src.modules.persona.domain.models import Experience, Persona
 from src.modules.persona.domain.services import PersonaService
@@ -15,7 +16,7 @@ def mock_persona_service():
 
 @pytest.fixture
 def mock_redis():
-    with patch("src.modules.auto_apply.ai.question_answerer.redis_provider") as mock:
+    with patch.object(response_cache, "redis") as mock:
         mock.get = AsyncMock(return_value=None)
         mock.set = AsyncMock()
         yield mock
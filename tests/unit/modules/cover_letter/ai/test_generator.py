@@ -6,6 +6,7 @@ from src.modules.cover_letter.ai.generator import (
     AlternativesList,
     CoverLetterGenerator,
     CoverLetterPreferences,
+    QualityTracker,
 )
 from src.modules.cover_letter.domain.models import Emphasis, Length, Tone
 from src.modules.job_search.domain.models import Job
@@ -92,3 +93,65 @@ async def test_adjust_tone(generator, mock_gemini_client):
 
     assert result == "Enthusiastic version"
     mock_gemini_client.generate_text.assert_called_once()
+
+
+def _job():
+    job = MagicMock(spec=Job)
+    job.company = "Stellar Tech"
+    job.title = "Software Engineer"
+    job.description = "We need an engineer."
+    job.raw_data = {"requirements": ["Python"]}
+    return job
+
+
+def test_quality_tracker_matches_across_chunk_boundaries():
+    letter = "I am writing to join Stellar Tech, a great fit for me."
+    preferences = CoverLetterPreferences()
+    tracker = QualityTracker(_job(), preferences)
+    for i in range(0, len(letter), 3):
+        tracker.feed(letter[i : i + 3])
+
+    whole = QualityTracker(_job(), preferences)
+    whole.feed(letter)
+    assert tracker.metrics() == whole.metrics()
+    assert tracker.metrics() == {
+        "word_count": 12,
+        "target_word_count": 250,
+        "company_mentioned": True,
+        "generic_phrases_count": 2,
+        "quality_score": 80,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_relays_chunks_and_ends_with_result(generator, mock_gemini_client):
+    mock_gemini_client.generate_text.return_value = "Research"
+
+    async def stream_text(_prompt, **_):
+        for chunk in ["Dear team at Stel", "lar Tech, ", "hello."]:
+            yield chunk
+
+    mock_gemini_client.stream_text = stream_text
+    persona = MagicMock(spec=Persona)
+    persona.full_name = "Jane Doe"
+    persona.skills = []
+    persona.experiences = []
+
+    events = [
+        event
+        async for event in generator.stream(_job(), persona, CoverLetterPreferences())
+    ]
+
+    assert [event["event"] for event in events] == [
+        "start",
+        "delta",
+        "delta",
+        "delta",
+        "done",
+    ]
+    assert events[1]["data"]["quality_metrics"]["company_mentioned"] is False
+    assert events[2]["data"]["quality_metrics"]["company_mentioned"] is True
+    done = events[-1]["data"]
+    assert done["content"] == "Dear team at Stellar Tech, hello."
+    assert done["prompt_v"] == events[0]["data"]["prompt_v"]
+    assert done["quality_metrics"]["word_count"] == 6
@@ -0,0 +1,91 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.middleware.auth import get_current_user
+from src.core.ai.gemini_client import GeminiClient
+from src.core.database.connection import get_db
+from src.modules.cover_letter.ai.generator import CoverLetterGenerator
+from src.modules.cover_letter.api import routes
+from src.modules.job_search.domain.models import Job
+from src.modules.persona.domain.models import Persona
+
+
+def _frames(body: str) -> list[tuple[str, dict]]:
+    frames = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        frames.append((event.removeprefix("event: "), json.loads(data[6:])))
+    return frames
+
+
+@pytest.fixture
+def app(monkeypatch):
+    job = MagicMock(spec=Job)
+    job.id = uuid.uuid4()
+    job.company = "Stellar Tech"
+    job.title = "Engineer"
+    job.description = "We need an engineer."
+    job.raw_data = {"requirements": ["Python"]}
+    persona = MagicMock(spec=Persona)
+    persona.full_name = "Jane Doe"
+
+    repository = MagicMock()
+    repository.return_value.get_by_id = AsyncMock(return_value=job)
+    repository.return_value.get_by_user_id = AsyncMock(return_value=persona)
+    monkeypatch.setattr(routes, "SQLAlchemyJobRepository", repository)
+    monkeypatch.setattr(routes, "SQLAlchemyPersonaRepository", repository)
+
+    letter_id = uuid.uuid4()
+    service = MagicMock()
+    service.return_value.create_from_generation = AsyncMock(
+        return_value=MagicMock(id=letter_id)
+    )
+    monkeypatch.setattr(routes, "CoverLetterService", service)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield AsyncMock()
+
+    monkeypatch.setattr(routes, "AsyncSessionLocal", session_factory)
+
+    # The real generator dependency, with only the Gemini calls stubbed
+    async def stream_text(_self, _prompt, **_):
+        for chunk in ("Dear Stellar Tech, ", "I build APIs."):
+            yield chunk
+
+    monkeypatch.setattr(GeminiClient, "stream_text", stream_text)
+    monkeypatch.setattr(
+        CoverLetterGenerator, "_build_prompt", AsyncMock(return_value="prompt")
+    )
+
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1/cover-letters")
+    app.dependency_overrides[get_current_user] = lambda: {"sub": str(uuid.uuid4())}
+    app.dependency_overrides[get_db] = lambda: AsyncMock()
+    app.state.letter_id = letter_id
+    return app
+
+
+@pytest.mark.asyncio
+async def test_stream_route_sends_sse_frames(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/cover-letters/generate/stream",
+            json={"job_id": str(uuid.uuid4())},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = _frames(response.text)
+    assert [event for event, _ in frames] == ["start", "delta", "delta", "done"]
+    assert frames[1][1]["text"] == "Dear Stellar Tech, "
+    done = frames[-1][1]
+    assert done["content"] == "Dear Stellar Tech, I build APIs."
+    assert done["id"] == str(app.state.letter_id)
@@ -0,0 +1,39 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.cover_letter.domain.repository import CoverLetterRepository
+from src.modules.cover_letter.domain.services import CoverLetterService
+from src.modules.job_search.domain.models import Job
+from src.modules.persona.domain.models import Persona
+
+
+@pytest.mark.asyncio
+async def test_generation_is_stored_with_its_first_version():
+    repository = AsyncMock(spec=CoverLetterRepository)
+    repository.save.side_effect = lambda letter: letter
+    job = MagicMock(spec=Job)
+    job.id = uuid.uuid4()
+    persona = MagicMock(spec=Persona)
+    persona.id = uuid.uuid4()
+    persona.user_id = uuid.uuid4()
+
+    letter = await CoverLetterService(repository).create_from_generation(
+        job,
+        persona,
+        {
+            "content": "Dear team",
+            "prompt_v": "v2",
+            "quality_metrics": {"word_count": 2},
+            "preferences": {"tone": "PROFESSIONAL"},
+        },
+    )
+
+    repository.save.assert_awaited_once()
+    assert (letter.user_id, letter.job_id, letter.persona_id) == (
+        persona.user_id,
+        job.id,
+        persona.id,
+    )
+    assert [(v.content, v.prompt_id) for v in letter.versions] == [("Dear team", "v2")]
@@ -0,0 +1,103 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.modules.job_search.domain.dedup import (
+    NUM_PERM,
+    DedupItem,
+    JobDeduplicator,
+    estimated_similarity,
+    lsh_buckets,
+    minhash_signature,
+    normalize_company,
+)
+from src.modules.job_search.domain.repository import DedupCandidate
+
+DESCRIPTION = (
+    "We are looking for a backend engineer to design, build and operate the "
+    "services behind our payments platform. You will work with Python, "
+    "Postgres and Kafka, own features end to end, and mentor other engineers "
+    "on the team while improving reliability and observability."
+)
+
+
+def test_company_normalization_drops_legal_suffixes():
+    assert normalize_company("Acme, Inc.") == "acme"
+    assert normalize_company("ACME GmbH") == "acme"
+    assert normalize_company("Group") == "group"
+
+
+def test_signature_is_deterministic_and_sized():
+    signature = minhash_signature("Backend Engineer", DESCRIPTION)
+
+    assert len(signature) == NUM_PERM
+    assert signature == minhash_signature("Backend Engineer", DESCRIPTION)
+    assert minhash_signature("", "") == []
+
+
+def test_near_duplicates_score_higher_than_different_roles():
+    original = minhash_signature("Backend Engineer", DESCRIPTION)
+    reposted = minhash_signature(
+        "Backend Engineer (m/f/d)", DESCRIPTION + " Apply now!"
+    )
+    other = minhash_signature(
+        "Product Designer", "Shape the user experience of our mobile apps."
+    )
+
+    assert estimated_similarity(original, reposted) >= 0.8
+    assert estimated_similarity(original, other) < 0.2
+
+
+def test_buckets_are_scoped_to_company():
+    signature = minhash_signature("Backend Engineer", DESCRIPTION)
+
+    assert lsh_buckets(signature, "Acme Inc") == lsh_buckets(signature, "ACME")
+    assert set(lsh_buckets(signature, "Acme")).isdisjoint(
+        lsh_buckets(signature, "Globex")
+    )
+
+
+@pytest.fixture
+def job_repo():
+    repo = AsyncMock()
+    repo.find_duplicate_candidates.return_value = {}
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_links_to_canonical_of_existing_duplicate(job_repo):
+    signature = minhash_signature("Backend Engineer", DESCRIPTION)
+    canonical_id, existing_id, new_id = uuid4(), uuid4(), uuid4()
+    existing = DedupCandidate(existing_id, canonical_id, signature)
+    job_repo.find_duplicate_candidates.return_value = {
+        key: [existing] for key in lsh_buckets(signature, "Acme")
+    }
+
+    links = await JobDeduplicator(job_repo).link([DedupItem(new_id, "Acme", signature)])
+
+    assert links == {new_id: canonical_id}
+    job_repo.link_duplicates.assert_awaited_once_with({new_id: canonical_id})
+
+
+@pytest.mark.asyncio
+async def test_copies_within_a_batch_are_linked(job_repo):
+    first, second, other = uuid4(), uuid4(), uuid4()
+
+    links = await JobDeduplicator(job_repo).link(
+        [
+            DedupItem(
+                first, "Acme", minhash_signature("Backend Engineer", DESCRIPTION)
+            ),
+            DedupItem(
+                second, "Acme Inc", minhash_signature("Backend Engineer", DESCRIPTION)
+            ),
+            DedupItem(
+                other, "Globex", minhash_signature("Backend Engineer", DESCRIPTION)
+            ),
+        ]
+    )
+
+    assert links == {first: None, second: first, other: None}
+    [buckets] = job_repo.save_lsh_buckets.await_args.args
+    assert set(buckets) == {first, second, other}
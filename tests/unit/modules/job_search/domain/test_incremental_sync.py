@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.job_search.domain.incremental_sync import (
+    IncrementalSync,
+    posting_fingerprint,
+)
+from src.modules.job_search.domain.models import ScrapeCursor
+from src.modules.job_search.infrastructure.scrapers.base import ScraperConfig
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+
+
+def _posting(job_id: int, updated_at: str = "2026-10-01T00:00:00Z", **extra):
+    return {"id": job_id, "title": "Engineer", "updated_at": updated_at, **extra}
+
+
+def _sync(listings: dict, cursors: dict | None = None):
+    scraper = GreenhouseScraper(
+        http_client=MagicMock(), rate_limiter=AsyncMock(), config=ScraperConfig()
+    )
+    scraper.COMPANY_BOARDS = list(listings)
+
+    async def fetch_board(company):
+        listing = listings[company]
+        if isinstance(listing, Exception):
+            raise listing
+        return listing
+
+    scraper._fetch_board = fetch_board
+    cursor_repo = AsyncMock()
+    cursor_repo.get_for_source.return_value = cursors or {}
+    job_repo = AsyncMock()
+    job_repo.expire_by_external_ids.return_value = 0
+    return IncrementalSync(scraper, cursor_repo, job_repo), cursor_repo, job_repo
+
+
+def _cursor(board: str, *postings: dict) -> ScrapeCursor:
+    return ScrapeCursor(
+        source="greenhouse",
+        board=board,
+        postings={f"{board}:{p['id']}": posting_fingerprint(p) for p in postings},
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_sync_emits_everything_as_new():
+    sync, cursor_repo, _ = _sync({"acme": [_posting(1), _posting(2)]})
+
+    changes = [c async for c in sync.run()]
+
+    assert [job.external_id for job in changes[0].new] == ["acme:1", "acme:2"]
+    saved = cursor_repo.save.await_args.args[0]
+    assert set(saved.postings) == {"acme:1", "acme:2"}
+
+
+@pytest.mark.asyncio
+async def test_emits_only_new_changed_and_removed():
+    unchanged, edited, gone = _posting(1), _posting(2), _posting(3)
+    cursor = _cursor("acme", unchanged, edited, gone)
+    listing = [
+        unchanged,
+        _posting(2, updated_at="2026-10-05T00:00:00Z"),
+        _posting(4),
+    ]
+    sync, _, job_repo = _sync({"acme": listing}, {"acme": cursor})
+
+    [changes] = [c async for c in sync.run()]
+
+    assert [job.external_id for job in changes.new] == ["acme:4"]
+    assert [job.external_id for job in changes.changed] == ["acme:2"]
+    assert changes.removed == ["acme:3"]
+    job_repo.expire_by_external_ids.assert_awaited_once_with(["greenhouse:acme:3"])
+
+
+@pytest.mark.asyncio
+async def test_unchanged_board_emits_nothing():
+    posting = _posting(1)
+    sync, cursor_repo, _ = _sync(
+        {"acme": [posting]}, {"acme": _cursor("acme", posting)}
+    )
+
+    assert [c async for c in sync.run()] == []
+    cursor_repo.save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_or_not_modified_board_keeps_its_cursor():
+    cursor = _cursor("down", _posting(1))
+    sync, cursor_repo, job_repo = _sync(
+        {"down": RuntimeError("503"), "cached": None}, {"down": cursor}
+    )
+
+    assert [c async for c in sync.run()] == []
+    cursor_repo.save.assert_not_awaited()
+    job_repo.expire_by_external_ids.assert_not_awaited()
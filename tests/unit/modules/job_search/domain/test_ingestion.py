@@ -0,0 +1,126 @@
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.modules.job_search.domain.ingestion import JobIngestion
+from src.modules.job_search.domain.repository import UpsertedJob
+from src.modules.job_search.infrastructure.scrapers.base import RawJob
+
+
+def _raw_job(external_id: str = "acme:1", **overrides) -> RawJob:
+    fields = {
+        "external_id": external_id,
+        "source": "greenhouse",
+        "title": "Backend Engineer",
+        "company_name": "Acme",
+        "location": "Berlin",
+        "description": "Build APIs",
+        "requirements": [],
+        "salary_range": None,
+        "posted_date": datetime(2026, 10, 1, 12, tzinfo=UTC),
+        "apply_url": "https://example.com/jobs/1",
+        "remote_type": "onsite",
+        "employment_type": "Full-time",
+        "raw_data": {"id": 1},
+    }
+    return RawJob(**{**fields, **overrides})
+
+
+@pytest.fixture
+def job_repo():
+    repo = AsyncMock()
+    repo.upsert_jobs.side_effect = lambda rows: [
+        UpsertedJob(uuid4(), inserted=True, needs_embedding=True) for _ in rows
+    ]
+    repo.find_duplicate_candidates.return_value = {}
+    return repo
+
+
+def test_to_row_normalizes_raw_job(job_repo):
+    raw_job = _raw_job(
+        posted_date=datetime(2026, 10, 1, 14, tzinfo=timezone(timedelta(hours=2))),
+        title="x" * 300,
+        location="",
+    )
+
+    row = JobIngestion(job_repo).to_row(raw_job)
+
+    assert row["external_id"] == "greenhouse:acme:1"
+    assert row["posted_at"] == datetime(2026, 10, 1, 12, tzinfo=UTC).replace(
+        tzinfo=None
+    )
+    assert len(row["title"]) == 255
+    assert row["location"] is None
+    assert row["status"] == "active"
+
+
+def test_to_row_fills_structured_location_and_salary(job_repo):
+    raw_job = _raw_job(location="Berlin, Germany", salary_range="EUR 70000 - 85000")
+
+    row = JobIngestion(job_repo).to_row(raw_job)
+
+    assert (row["location_country"], row["location_city"]) == ("DE", "Berlin")
+    assert (row["salary_min"], row["salary_max"]) == (70_000, 85_000)
+    assert row["salary_currency"] == "EUR"
+
+
+@pytest.mark.asyncio
+async def test_postings_are_written_in_chunks(job_repo):
+    ingestion = JobIngestion(job_repo, batch_size=2)
+    raw_jobs = [_raw_job(f"acme:{i}") for i in range(5)]
+
+    batches = [batch async for batch in ingestion.ingest(raw_jobs)]
+
+    assert [len(call.args[0]) for call in job_repo.upsert_jobs.await_args_list] == [
+        2,
+        2,
+        1,
+    ]
+    assert sum(batch.inserted for batch in batches) == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_inserted_updated_unchanged(job_repo):
+    new_id, changed_id = uuid4(), uuid4()
+    job_repo.upsert_jobs.side_effect = None
+    job_repo.upsert_jobs.return_value = [
+        UpsertedJob(new_id, inserted=True, needs_embedding=True),
+        UpsertedJob(changed_id, inserted=False, needs_embedding=False),
+    ]
+
+    batch = await JobIngestion(job_repo).ingest_batch(
+        [_raw_job("acme:1"), _raw_job("acme:2"), _raw_job("acme:3")]
+    )
+
+    assert (batch.inserted, batch.updated, batch.unchanged) == (1, 1, 1)
+    assert batch.needs_embedding == [new_id]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_postings_in_a_batch_are_collapsed(job_repo):
+    await JobIngestion(job_repo).ingest_batch(
+        [_raw_job(title="Old"), _raw_job(title="New")]
+    )
+
+    [rows] = job_repo.upsert_jobs.await_args.args
+    assert [row["title"] for row in rows] == ["New"]
+
+
+@pytest.mark.asyncio
+async def test_written_jobs_are_deduplicated(job_repo):
+    job_repo.upsert_jobs.side_effect = lambda rows: [
+        UpsertedJob(
+            uuid4(), inserted=True, needs_embedding=True, external_id=row["external_id"]
+        )
+        for row in rows
+    ]
+
+    batch = await JobIngestion(job_repo).ingest_batch(
+        [_raw_job("acme:1"), _raw_job("globex:1", company_name="Acme Inc.")]
+    )
+
+    assert batch.duplicates == 1
+    [links] = job_repo.link_duplicates.await_args.args
+    assert sorted(links.values(), key=bool)[0] is None
@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from src.modules.job_search.domain.match_pipeline import MatchPipeline
+from src.modules.job_search.domain.matching import JobMatcher
+from src.modules.job_search.domain.models import Job
+from src.modules.persona.domain.models import Persona, Skill, SkillCategory
+
+
+@pytest.fixture
+def job_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def persona_repo():
+    return AsyncMock()
+
+
+@pytest.fixture
+def pipeline(job_repo, persona_repo):
+    embedding_service = AsyncMock()
+    matcher = JobMatcher(
+        embedding_service=embedding_service,
+        persona_repository=persona_repo,
+        job_repository=job_repo,
+    )
+    return MatchPipeline(matcher, job_repo, persona_repo)
+
+
+def make_persona():
+    persona = Persona(id=uuid4(), user_id=uuid4(), full_name="Jane", email="j@x.io")
+    persona.skills = [
+        Skill(name="Python", proficiency_level=5, category=SkillCategory.TECHNICAL)
+    ]
+    persona.summary_embedding = [1.0, 0.0]
+    return persona
+
+
+def make_job(skills, embedding=(1.0, 0.0)):
+    return Job(
+        id=uuid4(),
+        title="Engineer",
+        company="Acme",
+        description="Build things",
+        url="http://example.com",
+        status="active",
+        raw_data={"skills": skills},
+        description_embedding=list(embedding),
+    )
+
+
+@pytest.mark.asyncio
+async def test_score_new_jobs_batches_per_persona(pipeline, job_repo, persona_repo):
+    first, second = make_persona(), make_persona()
+    good_job, bad_job = make_job(["Python"]), make_job(["Cobol", "Fortran"])
+    job_repo.get_by_ids.return_value = [good_job, bad_job]
+    persona_repo.get_nearest_by_embedding.return_value = [first, second]
+
+    stored = await pipeline.score_new_jobs([good_job.id, bad_job.id])
+
+    assert persona_repo.get_nearest_by_embedding.await_count == 2
+    [rows] = job_repo.upsert_matches.await_args.args
+    assert stored == len(rows) == 2
+    assert {row["user_id"] for row in rows} == {first.user_id, second.user_id}
+    assert all(row["job_id"] == good_job.id for row in rows)
+    assert rows[0]["analysis"]["matching_skills"] == ["Python"]
+
+
+@pytest.mark.asyncio
+async def test_score_new_jobs_skips_jobs_without_embedding(
+    pipeline, job_repo, persona_repo
+):
+    job = make_job(["Python"])
+    job.description_embedding = None
+    job_repo.get_by_ids.return_value = [job]
+
+    stored = await pipeline.score_new_jobs([job.id])
+
+    assert stored == 0
+    persona_repo.get_nearest_by_embedding.assert_not_awaited()
+    job_repo.upsert_matches.assert_awaited_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_rescore_persona_upserts_and_prunes(pipeline, job_repo, persona_repo):
+    persona = make_persona()
+    job = make_job(["Python"])
+    persona_repo.get_by_user_id.return_value = persona
+    job_repo.get_match_candidates.return_value = [job]
+    job_repo.prune_user_matches.return_value = 3
+
+    stored = await pipeline.rescore_persona(persona.user_id)
+
+    assert stored == 1
+    [rows] = job_repo.upsert_matches.await_args.args
+    assert rows[0]["user_id"] == persona.user_id
+    assert rows[0]["status"] == "pending"
+    job_repo.prune_user_matches.assert_awaited_once_with(persona.user_id, [job.id])
+
+
+@pytest.mark.parametrize("relationship", ["career_preference", "experiences", "skills"])
+def test_persona_relationships_read_by_the_matcher_load_eagerly(relationship):
+    # Workers load personas on an AsyncSession, where an implicit lazy load
+    # raises MissingGreenlet
+    assert inspect(Persona).relationships[relationship].lazy == "selectin"
@@ -1,16 +1,20 @@
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
+import pytest
+
 from src.modules.job_search.domain.matching import JobMatcher, MatchScore
+from src.modules.job_search.domain.models import Job
+from src.modules.job_search.domain.skill_vocabulary import SkillVocabulary
 from src.modules.persona.domain.models import (
+    CareerPreference,
+    Experience,
     Persona,
-    WorkAuthorization,
     RemotePreference,
     Skill,
-    CareerPreference,
     SkillCategory,
+    WorkAuthorization,
 )
-from src.modules.job_search.domain.models import Job
 
 
 @pytest.fixture
@@ -84,7 +88,8 @@ def sample_job(sample_job_id):
         raw_data={"skills": ["Python", "FastAPI", "Docker"]},
         status="active",
     )
-    # Mock dynamic attributes often used in matching not strictly in model definition if needed
+    # Mock dynamic attributes often used in matching not strictly in model
+    # definition if needed
     # But here logic uses raw_data for skills
     job.is_remote = False
     return job
@@ -179,3 +184,121 @@ async def test_hard_requirement_bypass(
 
     # Asserting no crash and valid score
     assert match_score.overall_score >= 0
+
+
+@pytest.mark.asyncio
+async def test_score_jobs_agrees_with_calculate_match(
+    job_matcher,
+    mock_persona_repo,
+    mock_job_repo,
+    sample_user_id,
+    sample_job_id,
+    sample_persona,
+    sample_job,
+):
+    sample_job.description_embedding = [0.2] * 768
+    sample_persona.experiences = [
+        Experience(
+            company_name="Acme",
+            job_title="Engineer",
+            experience_embedding=[0.1] * 384 + [0.3] * 384,
+        )
+    ]
+    mock_persona_repo.get_by_user_id.return_value = sample_persona
+    mock_job_repo.get_by_id.return_value = sample_job
+
+    single = await job_matcher.calculate_match(sample_user_id, sample_job_id)
+    [batch] = await job_matcher.score_jobs(sample_persona, [sample_job])
+
+    assert batch == single
+
+
+@pytest.mark.asyncio
+async def test_get_top_matches_uses_one_query_and_no_embeddings(
+    job_matcher,
+    mock_embedding_service,
+    mock_persona_repo,
+    mock_job_repo,
+    sample_user_id,
+    sample_persona,
+    sample_job,
+):
+    sample_persona.summary_embedding = [0.5] * 768
+    weak_job = Job(
+        id=uuid4(),
+        title="Chef",
+        company="Diner",
+        description="Cook things.",
+        url="http://example.com/chef",
+        raw_data={"skills": ["Cooking", "Baking"]},
+    )
+    mock_persona_repo.get_by_user_id.return_value = sample_persona
+    mock_job_repo.get_match_candidates.return_value = [weak_job, sample_job]
+
+    matches = await job_matcher.get_top_matches(sample_user_id, min_score=0)
+
+    assert [job for job, _ in matches] == [sample_job, weak_job]
+    mock_job_repo.get_match_candidates.assert_awaited_once()
+    assert (
+        mock_job_repo.get_match_candidates.call_args.kwargs["embedding"] == [0.5] * 768
+    )
+    mock_job_repo.get_by_id.assert_not_called()
+    mock_embedding_service.embed_text.assert_not_called()
+    mock_persona_repo.get_by_user_id.assert_awaited_once()
+
+
+def test_batch_experience_uses_top_similarities(job_matcher, sample_persona):
+    jobs = [
+        Job(title="A", company="X", description="d", description_embedding=[1.0, 0.0]),
+        Job(title="B", company="X", description="d", description_embedding=[0.0, 1.0]),
+        Job(title="C", company="X", description="d"),
+    ]
+    sample_persona.experiences = [
+        Experience(company_name="Acme", job_title="Eng", experience_embedding=[1, 0])
+    ]
+
+    scores = job_matcher._batch_score_experience(sample_persona, jobs)
+
+    assert scores.tolist() == pytest.approx([100.0, 0.0, 50.0])
+
+
+@pytest.mark.asyncio
+async def test_semantic_skill_match_with_vocabulary(
+    mock_embedding_service,
+    mock_persona_repo,
+    mock_job_repo,
+    sample_user_id,
+    sample_job_id,
+    sample_persona,
+    sample_job,
+):
+    vectors = {
+        "python": [1.0, 0.0, 0.0],
+        "fastapi": [0.0, 1.0, 0.0],
+        "kubernetes": [0.0, 0.0, 1.0],
+        "k8s": [0.0, 0.1, 1.0],
+        "docker": [0.7, 0.7, 0.0],
+    }
+    mock_embedding_service.embed_text.side_effect = lambda text, **_: vectors[text]
+    mock_embedding_service.embed_batch.side_effect = lambda texts, **_: [
+        vectors[text] for text in texts
+    ]
+    matcher = JobMatcher(
+        embedding_service=mock_embedding_service,
+        persona_repository=mock_persona_repo,
+        job_repository=mock_job_repo,
+        skill_vocabulary=SkillVocabulary(dim=3),
+    )
+    sample_persona.skills.append(
+        Skill(name="Kubernetes", proficiency_level=3, category=SkillCategory.TOOL)
+    )
+    sample_job.raw_data = {"skills": ["Python", "k8s", "Docker"]}
+    mock_persona_repo.get_by_user_id.return_value = sample_persona
+    mock_job_repo.get_by_id.return_value = sample_job
+
+    single = await matcher.calculate_match(sample_user_id, sample_job_id)
+    [batch] = await matcher.score_jobs(sample_persona, [sample_job])
+
+    assert single.matching_skills == ["Python", "k8s"]
+    assert single.missing_skills == ["Docker"]
+    assert batch == single
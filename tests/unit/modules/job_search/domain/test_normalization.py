@@ -0,0 +1,84 @@
+import pytest
+
+from src.modules.job_search.domain.normalization import (
+    Place,
+    normalize_location,
+    parse_salary,
+    structured_job_fields,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("San Francisco, CA", Place("US", "CA", "San Francisco")),
+        ("NYC, New York, United States", Place("US", "NY", "New York")),
+        ("New York", Place("US", "NY", "New York")),
+        ("California", Place("US", "CA")),
+        ("Toronto, CA", Place("CA", "ON", "Toronto")),
+        ("München, Deutschland", Place("DE", None, "Munich")),
+        ("Remote - UK", Place("GB")),
+        ("2 Locations", None),
+    ],
+)
+def test_primary_place(text, expected):
+    assert normalize_location(text).primary == expected
+
+
+def test_alternatives_and_remote():
+    normalized = normalize_location("Berlin, Germany or Remote (EU); London")
+
+    assert normalized.remote
+    assert normalized.places == (
+        Place("DE", None, "Berlin"),
+        Place("GB", None, "London"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("$120,000 - $150,000 per year", (120_000, 150_000, "USD", "year")),
+        ("Base pay: $120k–150k", (120_000, 150_000, "USD", "year")),
+        ("€60.000 - €75.000 p.a.", (60_000, 75_000, "EUR", "year")),
+        ("CA$80K - 100K", (80_000, 100_000, "CAD", "year")),
+        ("$52.50/hr", (52.5, 52.5, "USD", "hour")),
+        ("£30 - £45 an hour", (30, 45, "GBP", "hour")),
+        ("$6,000 - $8,000 per month", (6_000, 8_000, "USD", "month")),
+    ],
+)
+def test_salary_patterns(text, expected):
+    salary = parse_salary(text)
+
+    assert salary is not None
+    assert (salary.minimum, salary.maximum, salary.currency, salary.period) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["5-7 years of experience", "401(k) and a $5,000 stipend", "Team of 40"]
+)
+def test_free_text_without_pay_is_ignored(text):
+    assert parse_salary(text) is None
+
+
+def test_structured_salary_field_needs_no_currency():
+    salary = parse_salary("100000-120000", free_text=False)
+
+    assert salary is not None
+    assert salary.annual == (100_000, 120_000)
+
+
+def test_structured_job_fields_annualize_and_mark_remote():
+    fields = structured_job_fields(
+        "Remote, US", "Pay is $40 - $50 per hour.", work_setting="onsite"
+    )
+
+    assert fields == {
+        "location_country": "US",
+        "location_region": None,
+        "location_city": None,
+        "work_setting": "remote",
+        "salary_min": 40 * 2080,
+        "salary_max": 50 * 2080,
+        "salary_currency": "USD",
+    }
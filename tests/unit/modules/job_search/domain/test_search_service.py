@@ -0,0 +1,31 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.job_search.domain.services import JobSearchService, SearchOrderError
+
+
+@pytest.mark.parametrize("order", ["vector", "hybrid"])
+@pytest.mark.asyncio
+async def test_semantic_orders_embed_the_query(order):
+    repository, embedder = AsyncMock(), AsyncMock()
+    embedder.embed_text.return_value = [0.1, 0.2]
+
+    await JobSearchService(repository, embedder).search_jobs(
+        query="python backend", order=order
+    )
+
+    embedder.embed_text.assert_awaited_once_with(
+        "python backend", task_type="RETRIEVAL_QUERY"
+    )
+    assert repository.search_jobs.await_args.kwargs["embedding"] == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_semantic_order_without_query_is_rejected():
+    repository = AsyncMock()
+
+    with pytest.raises(SearchOrderError, match="needs a search query"):
+        await JobSearchService(repository, AsyncMock()).search_jobs(order="hybrid")
+
+    repository.search_jobs.assert_not_awaited()
@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.job_search.domain.models import SKILL_NAME_MAX_LENGTH
+from src.modules.job_search.domain.skill_vocabulary import (
+    SkillVocabulary,
+    normalize_skill,
+)
+
+
+@pytest.fixture
+def embedding_service():
+    service = AsyncMock()
+    vectors = {"python": [3.0, 4.0], "kubernetes": [0.0, 2.0]}
+    service.embed_batch.side_effect = lambda texts, **_: [vectors[t] for t in texts]
+    return service
+
+
+@pytest.fixture
+def vocabulary():
+    return SkillVocabulary(dim=2)
+
+
+def test_normalize_skill():
+    assert normalize_skill("  Machine   Learning ") == "machine learning"
+
+
+@pytest.mark.asyncio
+async def test_ensure_embeds_each_skill_once(vocabulary, embedding_service):
+    await vocabulary.ensure(["Python", "python ", "Kubernetes"], embedding_service)
+    await vocabulary.ensure(["PYTHON"], embedding_service)
+
+    embedding_service.embed_batch.assert_awaited_once_with(
+        ["python", "kubernetes"], task_type="SEMANTIC_SIMILARITY"
+    )
+    assert len(vocabulary) == 2
+    assert "Python" in vocabulary
+    assert vocabulary.vectors(["python"])[0].tolist() == pytest.approx([0.6, 0.8])
+
+
+@pytest.mark.asyncio
+async def test_ensure_prefers_repository(vocabulary, embedding_service):
+    repository = AsyncMock()
+    repository.get_many.return_value = {"python": [1.0, 0.0]}
+
+    await vocabulary.ensure(["Python", "Kubernetes"], embedding_service, repository)
+
+    repository.get_many.assert_awaited_once_with(["python", "kubernetes"])
+    embedding_service.embed_batch.assert_awaited_once_with(
+        ["kubernetes"], task_type="SEMANTIC_SIMILARITY"
+    )
+    repository.save_many.assert_awaited_once_with({"kubernetes": [0.0, 2.0]})
+
+
+@pytest.mark.asyncio
+async def test_similarity_matrix(vocabulary, embedding_service):
+    await vocabulary.ensure(["python", "kubernetes"], embedding_service)
+
+    similarity = vocabulary.similarity(["python", "unknown"], ["kubernetes"])
+
+    assert similarity.shape == (2, 1)
+    assert similarity[:, 0].tolist() == pytest.approx([0.8, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_ensure_skips_names_longer_than_column(vocabulary, embedding_service):
+    repository = AsyncMock()
+    repository.get_many.return_value = {}
+    too_long = "x" * (SKILL_NAME_MAX_LENGTH + 1)
+
+    await vocabulary.ensure(["Python", too_long], embedding_service, repository)
+
+    repository.get_many.assert_awaited_once_with(["python"])
+    embedding_service.embed_batch.assert_awaited_once_with(
+        ["python"], task_type="SEMANTIC_SIMILARITY"
+    )
+    repository.save_many.assert_awaited_once_with({"python": [3.0, 4.0]})
+    assert too_long not in vocabulary
+    assert not vocabulary.vectors([too_long]).any()
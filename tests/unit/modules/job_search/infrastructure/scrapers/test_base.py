@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.job_search.infrastructure.scrapers.base import ScraperConfig
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+
+
+def _scraper(max_concurrent_boards: int = 8) -> GreenhouseScraper:
+    return GreenhouseScraper(
+        http_client=MagicMock(),
+        rate_limiter=AsyncMock(),
+        config=ScraperConfig(max_concurrent_boards=max_concurrent_boards),
+    )
+
+
+def _posting(job_id: int, title: str = "Python Engineer") -> dict:
+    return {"id": job_id, "title": title, "location": {"name": "Remote"}}
+
+
+@pytest.mark.asyncio
+async def test_boards_are_yielded_as_they_finish():
+    scraper = _scraper()
+    scraper.COMPANY_BOARDS = ["slow", "fast"]
+    delays = {"slow": 0.05, "fast": 0.0}
+
+    async def get_company_jobs(company):
+        await asyncio.sleep(delays[company])
+        return [_posting(1)]
+
+    scraper._get_company_jobs = get_company_jobs
+
+    jobs = [job async for job in scraper.search_jobs(["python"])]
+
+    assert [job.external_id for job in jobs] == ["fast:1", "slow:1"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    scraper = _scraper(max_concurrent_boards=2)
+    scraper.COMPANY_BOARDS = [f"board{i}" for i in range(6)]
+    in_flight = 0
+    peak = 0
+
+    async def get_company_jobs(_company):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [_posting(1)]
+
+    scraper._get_company_jobs = get_company_jobs
+
+    jobs = [job async for job in scraper.search_jobs(["python"])]
+
+    assert len(jobs) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_board_does_not_affect_others():
+    scraper = _scraper()
+    scraper.COMPANY_BOARDS = ["broken", "ok"]
+
+    async def get_company_jobs(company):
+        if company == "broken":
+            return [{"title": "Python Engineer"}]  # no id
+        return [_posting(7), _posting(8, title="Designer")]
+
+    scraper._get_company_jobs = get_company_jobs
+
+    jobs = [job async for job in scraper.search_jobs(["python"])]
+
+    assert [job.external_id for job in jobs] == ["ok:7"]
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_pending_boards():
+    scraper = _scraper()
+    scraper.COMPANY_BOARDS = ["fast", "hung"]
+    hung = asyncio.Event()
+
+    async def get_company_jobs(company):
+        if company == "hung":
+            await hung.wait()
+        return [_posting(1)]
+
+    scraper._get_company_jobs = get_company_jobs
+
+    stream = scraper.search_jobs(["python"])
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first.external_id == "fast:1"
@@ -0,0 +1,90 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from src.modules.job_search.infrastructure.scrapers import html_text
+from src.modules.job_search.infrastructure.scrapers.html_text import (
+    HtmlTextService,
+    html_to_text,
+)
+
+HTML = (
+    "<h2>About</h2><p>Build <b>APIs</b></p>"
+    "<script>track()</script><ul><li>Python</li></ul>"
+)
+
+
+def test_html_to_text_keeps_visible_text_only():
+    assert html_to_text(HTML).split("\n") == ["About", "Build", "APIs", "Python"]
+    assert html_to_text("") == ""
+
+
+@pytest.mark.asyncio
+async def test_clean_many_memoizes_by_content(monkeypatch):
+    converted = []
+
+    def batch(documents):
+        converted.extend(documents)
+        return [html_to_text(html) for html in documents]
+
+    monkeypatch.setattr(html_text, "_html_to_text_batch", batch)
+    service = HtmlTextService()
+
+    first = await service.clean_many([HTML, "<p>Other</p>", HTML, ""])
+    second = await service.clean_many([HTML])
+
+    assert first[0] == first[2] == second[0]
+    assert first[3] == ""
+    assert converted == [HTML, "<p>Other</p>"]
+    assert service.clean(HTML) == first[0]
+
+
+@pytest.mark.asyncio
+async def test_large_batches_run_in_the_process_pool():
+    service = HtmlTextService(max_workers=1)
+    service.INLINE_MAX_CHARS = 0
+    documents = [f"<p>Job {i}</p>" for i in range(100)]
+
+    try:
+        texts = await service.clean_many(documents)
+    finally:
+        service.shutdown()
+
+    assert texts == [f"Job {i}" for i in range(100)]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_threads_when_pool_breaks(monkeypatch):
+    def broken_pool(**_kwargs):
+        raise OSError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(html_text, "ProcessPoolExecutor", broken_pool)
+    service = HtmlTextService()
+    service.INLINE_MAX_CHARS = 0
+
+    assert await service.clean_many(["<p>Hi</p>"]) == ["Hi"]
+
+
+def _clean_in_child(documents, results):
+    service = HtmlTextService()
+    service.INLINE_MAX_CHARS = 0
+    results.put(asyncio.run(service.clean_many(documents)))
+
+
+def test_clean_many_in_a_daemon_process_uses_threads():
+    # Celery prefork children are daemonic and may not start a pool
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    documents = [f"<p>Job {i}</p>" for i in range(10)]
+    child = context.Process(
+        target=_clean_in_child, args=(documents, results), daemon=True
+    )
+    child.start()
+    try:
+        texts = results.get(timeout=30)
+    finally:
+        child.join(timeout=30)
+
+    assert texts == [f"Job {i}" for i in range(10)]
+    assert child.exitcode == 0
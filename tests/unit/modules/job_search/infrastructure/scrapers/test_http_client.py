@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from src.core.config import settings
+from src.modules.job_search.infrastructure.scrapers.http_client import (
+    ScraperHttpClient,
+    client_timeout,
+)
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_and_pooled():
+    client = ScraperHttpClient()
+    try:
+        session = await client.session()
+        assert await client.session() is session
+
+        connector = session.connector
+        assert connector.limit == settings.scraper.CONNECTION_LIMIT
+        assert connector.limit_per_host == settings.scraper.CONNECTION_LIMIT_PER_HOST
+        assert session.headers["Accept-Encoding"].startswith("gzip")
+    finally:
+        await client.close()
+    assert session.closed
+
+
+def test_session_is_replaced_on_a_new_loop():
+    client = ScraperHttpClient()
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first, second = (loop.run_until_complete(client.session()) for loop in loops)
+        assert first is not second
+    finally:
+        loops[0].run_until_complete(first.close())
+        loops[1].run_until_complete(client.close())
+        for loop in loops:
+            loop.close()
+
+
+def test_client_timeout_bounds_connect():
+    timeout = client_timeout(30)
+    assert timeout.total == 30
+    assert timeout.connect == 10
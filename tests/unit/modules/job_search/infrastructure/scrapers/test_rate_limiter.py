@@ -0,0 +1,110 @@
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.job_search.infrastructure.scrapers import rate_limiter
+from src.modules.job_search.infrastructure.scrapers.base import ScraperConfig
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.rate_limiter import (
+    PENALIZE_SCRIPT,
+    RedisRateLimiter,
+    parse_retry_after,
+    resolve_bucket,
+)
+
+URL = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+
+
+def test_resolve_bucket_matches_subdomains():
+    assert resolve_bucket("acme.bamboohr.com") == ("bamboohr.com", 1.0)
+    assert resolve_bucket("BOARDS-API.greenhouse.io")[0] == "boards-api.greenhouse.io"
+    assert resolve_bucket("notbamboohr.com")[0] == "notbamboohr.com"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    later = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(later) <= 30
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_for_the_wait_redis_returns(monkeypatch):
+    redis = MagicMock(run_script=AsyncMock(side_effect=[250, 0]))
+    sleep = AsyncMock()
+    monkeypatch.setattr(rate_limiter, "redis_provider", redis)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", sleep)
+
+    await RedisRateLimiter().acquire("acme.bamboohr.com")
+
+    sleep.assert_awaited_once_with(0.25)
+    assert redis.run_script.await_args.kwargs["keys"] == [
+        "scraper:ratelimit:bamboohr.com"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limiter_without_redis(monkeypatch):
+    redis = MagicMock(run_script=AsyncMock(side_effect=RuntimeError("down")))
+    monkeypatch.setattr(rate_limiter, "redis_provider", redis)
+    limiter = RedisRateLimiter()
+
+    await limiter.acquire("api.lever.co")
+    await limiter.penalize("api.lever.co", retry_after=3)
+
+    assert "api.lever.co" in limiter._limiters
+    assert "api.lever.co" in limiter._blocked_until
+
+
+@pytest.mark.asyncio
+async def test_penalize_blocks_bucket_for_retry_after(monkeypatch):
+    redis = MagicMock(run_script=AsyncMock(return_value=2000))
+    monkeypatch.setattr(rate_limiter, "redis_provider", redis)
+
+    await RedisRateLimiter().penalize("acme.bamboohr.com", retry_after=2)
+
+    (script,) = redis.run_script.await_args.args
+    assert script == PENALIZE_SCRIPT
+    assert redis.run_script.await_args.kwargs["args"][0] == 2000
+
+
+def _response(status=200, body=b"{}", headers=None):
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.json = AsyncMock(return_value=json.loads(body))
+    return response
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    @asynccontextmanager
+    async def request(self, _method, _url, **_kwargs):
+        yield self.responses.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_make_request_backs_off_and_retries_on_429():
+    limiter = AsyncMock()
+    session = FakeSession(
+        _response(status=429, headers={"Retry-After": "4"}),
+        _response(body=b'{"jobs": []}'),
+    )
+    scraper = GreenhouseScraper(
+        http_client=session, rate_limiter=limiter, config=ScraperConfig()
+    )
+
+    assert await scraper._make_request(URL) == {"jobs": []}
+    limiter.penalize.assert_awaited_once_with("boards-api.greenhouse.io", 4.0)
+    assert limiter.acquire.await_count == 2
+    limiter.acquire.assert_awaited_with("boards-api.greenhouse.io")
@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from src.modules.job_search.infrastructure.scrapers.bamboohr import BambooHRScraper
+from src.modules.job_search.infrastructure.scrapers.base import ScraperConfig
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.lever import LeverScraper
+from src.modules.job_search.infrastructure.scrapers.smart_recruiters import (
+    SmartRecruitersScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.workday import WorkdayScraper
+from tests.replay.cassettes import load_cassette
+from tests.replay.server import ReplayProfile, ReplayServer, ReplaySession
+
+SCRAPERS = [
+    GreenhouseScraper,
+    LeverScraper,
+    SmartRecruitersScraper,
+    BambooHRScraper,
+    WorkdayScraper,
+]
+
+
+async def _fetch(scraper_cls, routes, boards, profile=None, config=None):
+    async with (
+        ReplayServer(routes, profile) as server,
+        aiohttp.ClientSession() as session,
+    ):
+        scraper = scraper_cls(
+            http_client=ReplaySession(session, server),
+            rate_limiter=AsyncMock(),
+            config=config or ScraperConfig(),
+        )
+        listings = [listing async for listing in scraper.fetch_boards(boards)]
+        # Some sources fetch descriptions separately, so prepare them while
+        # the server is up
+        for listing in listings:
+            await scraper.prepare_descriptions(listing.postings or [])
+        return scraper, listings, server
+
+
+@pytest.mark.parametrize("scraper_cls", SCRAPERS)
+@pytest.mark.asyncio
+async def test_recorded_board_parses(scraper_cls):
+    cassette = load_cassette(scraper_cls.source_name)
+
+    scraper, [listing], _ = await _fetch(
+        scraper_cls, cassette.routes(), [cassette.board]
+    )
+
+    assert len(listing.postings) == len(cassette.postings)
+    raw_jobs = [scraper.parse_posting(p, listing.board) for p in listing.postings]
+    assert all(job.title for job in raw_jobs)
+    assert all("analytics" not in job.description for job in raw_jobs)
+
+
+@pytest.mark.asyncio
+async def test_scaled_boards_have_unique_postings():
+    cassette = load_cassette("greenhouse")
+    boards = [f"board{i}" for i in range(5)]
+
+    scraper, listings, _ = await _fetch(
+        GreenhouseScraper, cassette.routes(boards, postings_per_board=20), boards
+    )
+
+    ids = {
+        scraper.external_id_for(p, listing.board)
+        for listing in listings
+        for p in listing.postings
+    }
+    assert len(ids) == 100
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried():
+    cassette = load_cassette("lever")
+    boards = [f"board{i}" for i in range(10)]
+    profile = ReplayProfile(rate_limit_rate=0.3, retry_after=0, seed=7)
+
+    _, listings, server = await _fetch(
+        LeverScraper,
+        cassette.routes(boards),
+        boards,
+        profile,
+        ScraperConfig(max_rate_limit_retries=10),
+    )
+
+    assert len(listings) == len(boards)
+    assert server.statuses[429] > 0
+    assert server.statuses[200] == len(boards)
+
+
+@pytest.mark.asyncio
+async def test_workday_pages_search_and_fetches_details():
+    cassette = load_cassette("workday")
+    boards = cassette.board_names(2)
+
+    scraper, listings, server = await _fetch(
+        WorkdayScraper, cassette.routes(boards, postings_per_board=45), boards
+    )
+
+    assert [len(listing.postings) for listing in listings] == [45, 45]
+    # Three search pages and 45 details per board
+    assert server.statuses[200] == 2 * (3 + 45)
+    raw_jobs = [
+        scraper.parse_posting(p, listing.board)
+        for listing in listings
+        for p in listing.postings
+    ]
+    assert len({job.external_id for job in raw_jobs}) == 90
+    assert all(job.company_name == "Acme Corporation" for job in raw_jobs)
+    assert all("About the role" in job.description for job in raw_jobs)
@@ -0,0 +1,156 @@
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.job_search.domain.incremental_sync import IncrementalSync
+from src.modules.job_search.infrastructure.scrapers import validator_cache
+from src.modules.job_search.infrastructure.scrapers.base import ScraperConfig
+from src.modules.job_search.infrastructure.scrapers.greenhouse import (
+    GreenhouseScraper,
+)
+from src.modules.job_search.infrastructure.scrapers.validator_cache import (
+    ResponseValidatorCache,
+)
+
+URL = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, **_options):
+        self.store[key] = value
+
+
+def _response(status=200, body=b"{}", headers=None):
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=body)
+    response.json = AsyncMock(return_value=json.loads(body))
+    return response
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    @asynccontextmanager
+    async def request(self, _method, _url, **kwargs):
+        self.sent_headers.append(kwargs["headers"])
+        yield self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(validator_cache, "redis_provider", redis)
+    return redis
+
+
+def _scraper(session):
+    return GreenhouseScraper(
+        http_client=session,
+        rate_limiter=AsyncMock(),
+        config=ScraperConfig(),
+        validator_cache=ResponseValidatorCache(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_parsing():
+    body = b'{"jobs": [{"id": 1}]}'
+    session = FakeSession(
+        _response(body=body, headers={"ETag": '"v1"'}),
+        _response(status=304),
+    )
+    scraper = _scraper(session)
+
+    first = await scraper._make_request(URL, conditional=True)
+    second = await scraper._make_request(URL, conditional=True)
+
+    assert first == {"jobs": [{"id": 1}]}
+    assert second is None
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_unchanged_digest_without_validators_skips_parsing():
+    body = b'{"jobs": []}'
+    session = FakeSession(_response(body=body), _response(body=body))
+    scraper = _scraper(session)
+
+    assert await scraper._make_request(URL, conditional=True) == {"jobs": []}
+    assert await scraper._make_request(URL, conditional=True) is None
+    assert "If-None-Match" not in session.sent_headers[1]
+
+
+@pytest.mark.asyncio
+async def test_changed_body_is_returned():
+    session = FakeSession(
+        _response(body=b'{"jobs": []}'),
+        _response(body=b'{"jobs": [{"id": 2}]}'),
+    )
+    scraper = _scraper(session)
+
+    await scraper._make_request(URL, conditional=True)
+
+    assert await scraper._make_request(URL, conditional=True) == {"jobs": [{"id": 2}]}
+
+
+@pytest.mark.asyncio
+async def test_unconditional_request_ignores_cache(fake_redis):
+    session = FakeSession(_response(body=b'{"id": 1}'))
+    scraper = _scraper(session)
+
+    assert await scraper._make_request(URL) == {"id": 1}
+    assert fake_redis.store == {}
+
+
+async def _sync_once(session, crash=False):
+    scraper = GreenhouseScraper(
+        http_client=session,
+        rate_limiter=AsyncMock(),
+        config=ScraperConfig(),
+        validator_cache=ResponseValidatorCache(namespace="sync"),
+    )
+    scraper.COMPANY_BOARDS = ["acme"]
+    cursor_repo = AsyncMock()
+    cursor_repo.get_for_source.return_value = {}
+    job_repo = AsyncMock()
+    job_repo.expire_by_external_ids.return_value = 0
+    sync = IncrementalSync(scraper, cursor_repo, job_repo)
+
+    changes = [c async for c in sync.run()]
+    if not crash:
+        # The worker commits the cursors, then stores the validators
+        await sync.save_validators()
+    return changes
+
+
+@pytest.mark.asyncio
+async def test_crash_before_commit_replays_the_board(fake_redis):
+    body = b'{"jobs": [{"id": 1, "title": "Engineer"}]}'
+    session = FakeSession(
+        _response(body=body, headers={"ETag": '"v1"'}),
+        _response(body=body, headers={"ETag": '"v1"'}),
+        _response(status=304),
+    )
+
+    assert await _sync_once(session, crash=True)
+    assert fake_redis.store == {}
+
+    # Without stored validators the board is fetched and emitted again
+    [replayed] = await _sync_once(session)
+    assert "If-None-Match" not in session.sent_headers[1]
+    assert [job.external_id for job in replayed.new] == ["acme:1"]
+
+    assert await _sync_once(session) == []
+    assert session.sent_headers[2]["If-None-Match"] == '"v1"'
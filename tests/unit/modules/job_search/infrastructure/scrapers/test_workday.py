@@ -0,0 +1,67 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.job_search.infrastructure.scrapers.base import (
+    ScraperConfig,
+    ScraperError,
+)
+from src.modules.job_search.infrastructure.scrapers.workday import (
+    WorkdayScraper,
+    WorkdayTenant,
+    parse_posted_on,
+)
+
+TODAY = datetime(2026, 10, 16, 15, 30, tzinfo=UTC)
+
+
+def test_tenant_is_parsed_from_board():
+    tenant = WorkdayTenant.parse("nvidia.wd5/NVIDIAExternalCareerSite")
+
+    assert tenant.api_url == (
+        "https://nvidia.wd5.myworkdayjobs.com/wday/cxs/nvidia/NVIDIAExternalCareerSite"
+    )
+
+
+def test_invalid_board_is_rejected():
+    with pytest.raises(ScraperError):
+        WorkdayTenant.parse("nvidia")
+
+
+@pytest.mark.parametrize(
+    ("label", "expected"),
+    [
+        ("Posted Today", datetime(2026, 10, 16, tzinfo=UTC)),
+        ("Posted Yesterday", datetime(2026, 10, 15, tzinfo=UTC)),
+        ("Posted 3 Days Ago", datetime(2026, 10, 13, tzinfo=UTC)),
+        ("Posted 30+ Days Ago", None),
+        (None, None),
+    ],
+)
+def test_posted_on_labels(label, expected):
+    assert parse_posted_on(label, TODAY) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_pages_until_total():
+    scraper = WorkdayScraper(
+        http_client=MagicMock(), rate_limiter=AsyncMock(), config=ScraperConfig()
+    )
+    pages = [
+        {
+            "total": 25,
+            "jobPostings": [{"externalPath": f"/job/{i}"} for i in range(20)],
+        },
+        {
+            "total": 0,
+            "jobPostings": [{"externalPath": f"/job/{i}"} for i in range(20, 25)],
+        },
+    ]
+    scraper._make_request = AsyncMock(side_effect=pages)
+
+    postings = await scraper._fetch_board("acme.wd1/External")
+
+    assert [p["id"] for p in postings] == [f"/job/{i}" for i in range(25)]
+    offsets = [c.kwargs["json"]["offset"] for c in scraper._make_request.call_args_list]
+    assert offsets == [0, 20]
@@ -0,0 +1,286 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from src.modules.job_search.domain.ingestion import JobIngestion
+from src.modules.job_search.domain.models import SKILL_NAME_MAX_LENGTH, Job
+from src.modules.job_search.infrastructure.repository import (
+    SQLAlchemyJobRepository,
+    SQLAlchemySkillEmbeddingRepository,
+)
+from src.modules.job_search.infrastructure.scrapers.base import RawJob
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    result.scalar_one.return_value = None
+    session.execute.return_value = result
+    return session
+
+
+@pytest.fixture
+def repo(session):
+    return SQLAlchemyJobRepository(session)
+
+
+def _compiled_sql(session) -> str:
+    """SQL of the last statement executed, compiled for Postgres"""
+    stmt = session.execute.await_args_list[-1].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.parametrize(
+    ("order", "query", "embedding", "expected"),
+    [
+        (None, None, None, "recency"),
+        (None, "python", [0.1], "vector"),
+        ("text_rank", "python", None, "text_rank"),
+        ("text_rank", None, None, "recency"),
+        ("hybrid", "python", [0.1], "hybrid"),
+        ("hybrid", "python", None, "text_rank"),
+        ("hybrid", None, [0.1], "vector"),
+        ("vector", "python", None, "recency"),
+    ],
+)
+def test_resolve_order(repo, order, query, embedding, expected):
+    assert repo._resolve_order(order, query, embedding) == expected
+
+
+@pytest.mark.asyncio
+async def test_text_query_uses_tsvector_match(repo, session):
+    await repo.search_jobs(query="senior python", order="text_rank")
+
+    sql = _compiled_sql(session)
+    assert "websearch_to_tsquery('english'::regconfig" in sql
+    assert "jobs.search_vector @@" in sql
+    assert "ts_rank(jobs.search_vector" in sql
+    assert "ILIKE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_ranks_in_one_statement(repo, session):
+    await repo.search_jobs(query="python", embedding=[0.1] * 768, order="hybrid")
+
+    sql = _compiled_sql(session)
+    assert "text_hits" in sql
+    assert "vector_hits" in sql
+    assert "row_number() OVER" in sql
+    assert "UNION ALL" in sql
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_applies_caller_ef_search(repo, session):
+    await repo.search_jobs(
+        query="python", embedding=[0.1] * 768, order="hybrid", ef_search=321
+    )
+
+    settings = {
+        call.args[1]["name"]: call.args[1]["value"]
+        for call in session.execute.await_args_list
+        if len(call.args) > 1
+    }
+    assert settings["hnsw.ef_search"] == "321"
+
+
+def _jobs(n):
+    return [
+        Job(id=uuid4(), posted_at=datetime(2026, 10, 1, tzinfo=UTC) - timedelta(days=i))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recency_page_returns_cursor_when_more_rows(repo, session):
+    jobs = _jobs(3)
+    session.execute.return_value.scalars.return_value.all.return_value = jobs
+
+    page = await repo.search_jobs(limit=2)
+
+    assert page.items == jobs[:2]
+    assert decode_cursor(page.next_cursor, "recency") == [
+        jobs[1].posted_at,
+        jobs[1].id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_last_recency_page_has_no_cursor(repo, session):
+    session.execute.return_value.scalars.return_value.all.return_value = _jobs(2)
+
+    page = await repo.search_jobs(limit=2)
+
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_recency_cursor_seeks_instead_of_offset(repo, session):
+    cursor = encode_cursor("recency", [datetime(2026, 9, 1, tzinfo=UTC), uuid4()])
+
+    await repo.search_jobs(limit=20, offset=400, cursor=cursor)
+
+    sql = _compiled_sql(session)
+    assert "(jobs.posted_at, jobs.id) < (" in sql
+    assert "jobs.posted_at IS NULL" in sql
+    stmt = session.execute.await_args_list[-1].args[0]
+    assert 400 not in stmt.compile().params.values()
+
+
+@pytest.mark.asyncio
+async def test_vector_cursor_seeks_on_distance(repo, session):
+    cursor = encode_cursor("vector", [0.25, uuid4()])
+
+    await repo.search_jobs(embedding=[0.1] * 768, cursor=cursor)
+
+    sql = _compiled_sql(session)
+    assert "<=>" in sql
+    assert ", jobs.id) > (" in sql
+    settings = [
+        call.args[1]["name"]
+        for call in session.execute.await_args_list
+        if len(call.args) > 1
+    ]
+    assert "hnsw.iterative_scan" in settings
+
+
+@pytest.mark.asyncio
+async def test_vector_search_orders_by_distance_only(repo, session):
+    session.execute.return_value.all.return_value = []
+
+    await repo.search_jobs(embedding=[0.1] * 768)
+
+    # A second sort key keeps PG16 from serving ORDER BY from the HNSW index
+    order_by = _compiled_sql(session).split("ORDER BY")[-1]
+    assert "<=>" in order_by
+    assert "jobs.id" not in order_by
+
+
+def _hits(*distances):
+    return [
+        SimpleNamespace(Job=Job(id=UUID(int=i + 1)), distance=distance)
+        for i, distance in enumerate(distances)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_vector_page_orders_ties_by_id(repo, session):
+    near, tied_low, tied_mid, tied_high = _hits(0.1, 0.3, 0.3, 0.3)
+    scan, ties = MagicMock(), MagicMock()
+    # The index scan cut the tie and left its lowest id out
+    scan.all.return_value = [tied_high, near, tied_mid]
+    ties.all.return_value = [tied_low, tied_mid, tied_high]
+    session.execute.side_effect = [scan, ties]
+
+    page = await repo.search_jobs(embedding=[0.1] * 768, limit=2)
+
+    assert page.items == [near.Job, tied_low.Job]
+    assert decode_cursor(page.next_cursor, "vector") == [0.3, tied_low.Job.id]
+    tie_sql = _compiled_sql(session)
+    assert "ORDER BY jobs.id" in tie_sql
+
+
+@pytest.mark.asyncio
+async def test_cursor_rejected_for_text_rank(repo):
+    with pytest.raises(InvalidCursorError):
+        await repo.search_jobs(query="python", order="text_rank", cursor="abc")
+
+
+@pytest.mark.asyncio
+async def test_match_cursor_seeks_on_score(repo, session):
+    cursor = encode_cursor("score", [87, uuid4()])
+
+    await repo.get_user_matches(uuid4(), cursor=cursor)
+
+    sql = _compiled_sql(session)
+    assert "(job_matches.overall_score, job_matches.id) < (" in sql
+    assert "ORDER BY job_matches.overall_score DESC, job_matches.id DESC" in sql
+
+
+def _raw_job() -> RawJob:
+    return RawJob(
+        external_id="acme:1",
+        source="greenhouse",
+        title="Backend Engineer",
+        company_name="Acme",
+        location="Berlin",
+        description="Build APIs",
+        requirements=[],
+        salary_range=None,
+        posted_date=None,
+        apply_url="https://example.com/jobs/1",
+        remote_type=None,
+        employment_type=None,
+        raw_data={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_jobs_skips_unchanged_rows(repo, session):
+    session.execute.return_value.all.return_value = []
+
+    await repo.upsert_jobs([JobIngestion(AsyncMock()).to_row(_raw_job())])
+
+    sql = _compiled_sql(session)
+    assert "ON CONFLICT (external_id) DO UPDATE" in sql
+    assert "IS DISTINCT FROM" in sql
+    assert "RETURNING jobs.id, xmax = 0 AS inserted" in sql
+
+
+@pytest.mark.asyncio
+async def test_search_excludes_duplicate_jobs(repo, session):
+    await repo.search_jobs()
+
+    assert "jobs.canonical_job_id IS NULL" in _compiled_sql(session)
+
+
+@pytest.mark.asyncio
+async def test_filters_use_structured_columns(repo, session):
+    await repo.search_jobs(location="NYC", remote_only=True, salary_min=100_000)
+
+    sql = _compiled_sql(session)
+    assert "jobs.location_country = " in sql
+    assert "jobs.location_region = " in sql
+    assert "jobs.location_city = " in sql
+    assert "jobs.salary_max >= " in sql
+    assert "ILIKE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_unknown_location_falls_back_to_text(repo, session):
+    await repo.search_jobs(location="Springfield")
+
+    assert "jobs.location ILIKE" in _compiled_sql(session)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_candidates_bind_buckets_as_arrays(repo, session):
+    session.execute.return_value.all.return_value = []
+
+    await repo.find_duplicate_candidates([(band, band * 7) for band in range(500)])
+
+    stmt = session.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "unnest(" in str(compiled)
+    assert len(compiled.params) == 3  # two arrays and the status filter
+
+
+@pytest.mark.asyncio
+async def test_save_skill_embeddings_drops_over_long_names(session):
+    repo = SQLAlchemySkillEmbeddingRepository(session)
+
+    await repo.save_many({"python": [0.1], "x" * (SKILL_NAME_MAX_LENGTH + 1): [0.2]})
+
+    assert session.execute.await_args.args[1] == [
+        {"name": "python", "embedding": [0.1]}
+    ]
@@ -0,0 +1,23 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.modules.persona.infrastructure.repository import SQLAlchemyPersonaRepository
+
+
+@pytest.mark.asyncio
+async def test_nearest_personas_fall_back_to_mean_experience_embedding():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+
+    await SQLAlchemyPersonaRepository(session).get_nearest_by_embedding([0.1] * 768)
+
+    # The other statements apply and restore the ef_search setting
+    [stmt] = [c.args[0] for c in session.execute.await_args_list if len(c.args) == 1]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "personas.summary_embedding <=>" in sql
+    # Personas without a summary are ranked like JobMatcher ranks their jobs
+    assert "personas.summary_embedding IS NULL" in sql
+    assert "avg(persona_experiences.experience_embedding) <=>" in sql
+    assert "UNION ALL" in sql
@@ -1,10 +1,16 @@
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.modules.persona.domain.models import Persona
-from src.modules.resume.ai.gemini_enhancer import EnhancedBullet, ResumeEnhancer
+from src.modules.resume.ai.gemini_enhancer import (
+    BULLETS_PER_PROMPT,
+    EnhancedBullet,
+    EnhancedBulletList,
+    ResumeEnhancer,
+)
+from src.modules.resume.domain.models import ResumeSection, SectionType
 
 
 @pytest.fixture
@@ -28,34 +34,21 @@ async def test_enhance_bullet_point_success(enhancer, mock_gemini_client):
     )
     mock_gemini_client.generate_structured.return_value = mock_result
 
-    with (
-        patch(
-            "src.modules.resume.ai.gemini_enhancer.redis_provider.get",
-            return_value=None,
-        ),
-        patch(
-            "src.modules.resume.ai.gemini_enhancer.redis_provider.set",
-            return_value=None,
-        ),
-    ):
-        result = await enhancer.enhance_bullet_point("Original bullet", "Context")
+    result = await enhancer.enhance_bullet_point("Original bullet", "Context")
 
-        assert isinstance(result, EnhancedBullet)
-        assert result.enhanced == "Enhanced bullet"
-        assert result.metrics_added is True
+    assert isinstance(result, EnhancedBullet)
+    assert result.enhanced == "Enhanced bullet"
+    assert result.metrics_added is True
 
 
 @pytest.mark.asyncio
 async def test_enhance_bullet_point_fallback(enhancer, mock_gemini_client):
     mock_gemini_client.generate_structured.side_effect = Exception("AI Error")
 
-    with patch(
-        "src.modules.resume.ai.gemini_enhancer.redis_provider.get", return_value=None
-    ):
-        result = await enhancer.enhance_bullet_point("Original bullet")
+    result = await enhancer.enhance_bullet_point("Original bullet")
 
-        assert result.enhanced == "Original bullet"
-        assert result.confidence_score == 0.0
+    assert result.enhanced == "Original bullet"
+    assert result.confidence_score == 0.0
 
 
 @pytest.mark.asyncio
@@ -81,37 +74,132 @@ async def test_generate_professional_summary(enhancer, mock_gemini_client):
     persona.career_preference.target_titles = ["Senior Engineer"]
     persona.user_id = "user-123"
 
-    with (
-        patch(
-            "src.modules.resume.ai.gemini_enhancer.redis_provider.get",
-            return_value=None,
-        ),
-        patch(
-            "src.modules.resume.ai.gemini_enhancer.redis_provider.set",
-            return_value=None,
-        ),
-    ):
-        summary = await enhancer.generate_professional_summary(persona)
+    summary = await enhancer.generate_professional_summary(persona)
 
-        assert summary == "Experienced professional summary."
-        mock_gemini_client.generate_text.assert_called_once()
+    assert summary == "Experienced professional summary."
+    mock_gemini_client.generate_text.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_enhance_bullet_point_cached(enhancer, mock_gemini_client):
-    cached_response = {
-        "enhanced": "Cached bullet",
-        "action_verb": "Led",
-        "metrics_added": True,
-        "keywords_included": [],
-        "confidence_score": 1.0,
-    }
-
-    with patch(
-        "src.modules.resume.ai.gemini_enhancer.redis_provider.get",
-        return_value=json.dumps(cached_response),
-    ):
-        result = await enhancer.enhance_bullet_point("Original bullet")
-
-        assert result.enhanced == "Cached bullet"
-        mock_gemini_client.generate_structured.assert_not_called()
+async def test_responses_are_cached_per_template(enhancer, mock_gemini_client):
+    mock_gemini_client.generate_text.return_value = "Cut costs by 20%"
+
+    await enhancer.inject_metrics("Cut costs")
+    await enhancer.optimize_for_ats("Built APIs", ["Python", "REST"])
+
+    templates = [
+        call.kwargs["cache_as"]
+        for call in mock_gemini_client.generate_text.call_args_list
+    ]
+    assert templates == ["resume.inject_metrics", "resume.optimize_for_ats"]
+
+
+def _bullet(text):
+    return EnhancedBullet(
+        enhanced=f"Enhanced {text}",
+        action_verb="Led",
+        metrics_added=False,
+        confidence_score=0.5,
+    )
+
+
+def _section(*descriptions):
+    return ResumeSection(
+        section_type=SectionType.EXPERIENCE,
+        content={"items": [{"description": d} for d in descriptions]},
+    )
+
+
+@pytest.mark.asyncio
+async def test_sections_are_enhanced_concurrently_in_order(
+    enhancer, mock_gemini_client
+):
+    in_flight = peak = 0
+
+    async def generate(prompt, _schema, **_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        bullet = prompt.split("Original: ")[1].split("\n")[0]
+        # Later bullets finish first
+        await asyncio.sleep(0.01 / int(bullet[1:]))
+        in_flight -= 1
+        return _bullet(bullet)
+
+    mock_gemini_client.generate_structured.side_effect = generate
+    sections = [_section("b1", "b2", "b3"), _section(), _section("b4", "b5", "b6")]
+
+    enhanced = await enhancer.enhance_sections(sections, concurrency=4)
+
+    assert [[b.enhanced for b in s.enhanced_bullets] for s in enhanced] == [
+        ["Enhanced b1", "Enhanced b2", "Enhanced b3"],
+        [],
+        ["Enhanced b4", "Enhanced b5", "Enhanced b6"],
+    ]
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_packed_resume_takes_one_prompt_per_chunk(enhancer, mock_gemini_client):
+    async def generate(prompt, _schema, **_):
+        lines = prompt.split("Bullets:\n")[1].split("\nJob Context")[0]
+        return EnhancedBulletList(
+            bullets=[_bullet(line.split(". ", 1)[1]) for line in lines.splitlines()]
+        )
+
+    mock_gemini_client.generate_structured.side_effect = generate
+    first = [f"a{i}" for i in range(BULLETS_PER_PROMPT)]
+    resume = MagicMock()
+    resume.sections = [_section(*first), _section("b0", "b1")]
+
+    enhanced = await enhancer.enhance_resume(resume)
+
+    assert mock_gemini_client.generate_structured.await_count == 2
+    assert [b.enhanced for b in enhanced[1].enhanced_bullets] == [
+        "Enhanced b0",
+        "Enhanced b1",
+    ]
+    assert enhanced[0].enhanced_bullets[-1].enhanced == f"Enhanced {first[-1]}"
+
+
+@pytest.mark.asyncio
+async def test_packed_count_mismatch_falls_back_to_single_bullets(
+    enhancer, mock_gemini_client
+):
+    async def generate(prompt, schema, **_):
+        if schema is EnhancedBulletList:
+            return EnhancedBulletList(bullets=[_bullet("only one")])
+        return _bullet(prompt.split("Original: ")[1].split("\n")[0])
+
+    mock_gemini_client.generate_structured.side_effect = generate
+
+    bullets = await enhancer.enhance_bullets(["x", "y"])
+
+    assert [b.enhanced for b in bullets] == ["Enhanced x", "Enhanced y"]
+
+
+@pytest.mark.asyncio
+async def test_packed_fallback_stays_within_concurrency(enhancer, mock_gemini_client):
+    in_flight = peak = 0
+
+    async def generate(prompt, schema, **_):
+        nonlocal in_flight, peak
+        if schema is EnhancedBulletList:
+            raise RuntimeError("malformed JSON")
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return _bullet(prompt.split("Original: ")[1].split("\n")[0])
+
+    mock_gemini_client.generate_structured.side_effect = generate
+    bullets = [f"b{i}" for i in range(3 * BULLETS_PER_PROMPT)]
+
+    [enhanced] = await enhancer.enhance_sections(
+        [_section(*bullets)], packed=True, concurrency=3
+    )
+
+    assert [b.enhanced for b in enhanced.enhanced_bullets] == [
+        f"Enhanced {b}" for b in bullets
+    ]
+    assert peak == 3